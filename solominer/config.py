@@ -7,6 +7,7 @@ import json
 import os
 import tempfile
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from typing import Optional
 
 
@@ -16,6 +17,9 @@ LOG_FILE = os.path.join(CONFIG_DIR, "activity.log")
 STATS_FILE = os.path.join(CONFIG_DIR, "stats.json")
 CRASH_LOG_FILE = os.path.join(CONFIG_DIR, "crash.log")
 
+# How much of the activity log readers load at most when opening it.
+LOG_TAIL_BYTES = 64 * 1024
+
 LAUNCHD_LABEL = "com.cooperwang.solominer"
 LAUNCHD_PLIST = os.path.expanduser(f"~/Library/LaunchAgents/{LAUNCHD_LABEL}.plist")
 
@@ -186,14 +190,34 @@ def append_log(message: str):
         pass  # Never crash the caller (mining thread) on log I/O failure
 
 
-def read_log() -> str:
+def read_log(max_bytes: int = LOG_TAIL_BYTES) -> str:
+    """Return the end of the activity log: at most *max_bytes*, starting on
+    a line boundary, so callers don't pay for the whole file as it grows."""
     try:
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, "r") as f:
-                return f.read()
-    except Exception:
-        pass
-    return ""
+        with open(LOG_FILE, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - max_bytes)
+            f.seek(start)
+            data = f.read()
+    except OSError:
+        return ""
+    if start:
+        data = data[data.find(b"\n") + 1 :]
+    return data.decode("utf-8", "replace")
+
+
+def read_log_from(offset: int = 0) -> tuple:
+    """Read the complete log lines written at or after byte *offset*.
+    Returns (text, next_offset); a trailing partial line is left for the
+    next call."""
+    try:
+        with open(LOG_FILE, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except OSError:
+        return "", offset
+    end = data.rfind(b"\n") + 1
+    return data[:end].decode("utf-8", "replace"), offset + end
 
 
 def clear_log():
@@ -282,6 +306,26 @@ def is_login_item_installed() -> bool:
     return os.path.exists(LAUNCHD_PLIST)
 
 
+# Address validation tables, built once rather than on every keystroke/save
+_TESTNET_NETWORKS = frozenset(("testnet3", "testnet4", "signet", "regtest"))
+# network kind -> (legacy first characters, bech32 prefixes, error message)
+_ADDRESS_PREFIXES = {
+    True: (
+        frozenset("mn2"),
+        ("tb1q", "tb1p", "bcrt1"),
+        "Not a valid testnet/regtest address prefix",
+    ),
+    False: (
+        frozenset("13"),
+        ("bc1q", "bc1p"),
+        "Must start with 1, 3, bc1q, or bc1p",
+    ),
+}
+_BECH32_HRPS = ("bc1", "tb1", "bcrt1")
+_BECH32_CHARS = frozenset("qpzry9x8gf2tvdw0s3jn54khce6mua7l")
+_BASE58_CHARS = frozenset("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
+
+
 def validate_bitcoin_address(address: str, network: str = "Mainnet") -> tuple:
     """Validate a Bitcoin address.
     Returns (is_valid: bool, error: str).
@@ -297,44 +341,30 @@ def validate_bitcoin_address(address: str, network: str = "Mainnet") -> tuple:
         return (False, "Address is empty")
 
     address = address.strip()
+    lower = address.lower()
+    is_bech32 = lower.startswith(_BECH32_HRPS)
 
     # BIP 173: bech32 addresses must not mix upper and lower case.
     # Check this before any prefix logic (which lowercases).
-    if address.lower().startswith(("bc1", "tb1", "bcrt1")):
-        has_lower = any(c.islower() for c in address if c.isalpha())
-        has_upper = any(c.isupper() for c in address if c.isalpha())
-        if has_lower and has_upper:
-            return (False, "Bech32 address must not mix upper and lower case")
-
-    # Determine expected prefixes based on network
-    is_testnet = network.lower() in ("testnet3", "testnet4", "signet", "regtest")
-
-    if is_testnet:
-        # Testnet: 1-prefix P2PKH uses m or n, P2SH uses 2, bech32 uses tb1
-        valid_legacy = address[0] in ("m", "n", "2")
-        valid_bech32 = address.lower().startswith(("tb1q", "tb1p"))
-        # Regtest uses bcrt1
-        valid_regtest = address.lower().startswith("bcrt1")
-        if not (valid_legacy or valid_bech32 or valid_regtest):
-            return (False, "Not a valid testnet/regtest address prefix")
-    else:
-        # Mainnet
-        valid_legacy = address[0] in ("1", "3")
-        valid_bech32 = address.lower().startswith(("bc1q", "bc1p"))
-        if not (valid_legacy or valid_bech32):
-            return (False, "Must start with 1, 3, bc1q, or bc1p")
+    if is_bech32 and address != lower and address != address.upper():
+        return (False, "Bech32 address must not mix upper and lower case")
+
+    # Expected prefixes depend only on mainnet vs. test networks
+    # (regtest's bcrt1 is accepted alongside testnet's tb1)
+    legacy_first, bech32_prefixes, prefix_error = _ADDRESS_PREFIXES[
+        network.lower() in _TESTNET_NETWORKS
+    ]
+    if not (address[0] in legacy_first or lower.startswith(bech32_prefixes)):
+        return (False, prefix_error)
 
     # Length checks
-    lower = address.lower()
-    if lower.startswith(("bc1", "tb1", "bcrt1")):
+    if is_bech32:
         # Bech32/bech32m: bc1q is 42-62 chars, bc1p is 62 chars (taproot)
         if len(address) < 14 or len(address) > 90:
             return (False, f"Bech32 address length {len(address)} out of range")
         # Character set: bech32 uses only lowercase + digits (no 1boi after prefix)
         prefix_end = address.index("1") + 1  # find the separator '1'
-        data_part = lower[prefix_end:]
-        bech32_chars = set("qpzry9x8gf2tvdw0s3jn54khce6mua7l")
-        invalid = set(data_part) - bech32_chars
+        invalid = set(lower[prefix_end:]) - _BECH32_CHARS
         if invalid:
             return (False, f"Invalid bech32 character(s): {''.join(sorted(invalid))}")
     else:
@@ -342,14 +372,37 @@ def validate_bitcoin_address(address: str, network: str = "Mainnet") -> tuple:
         if len(address) < 25 or len(address) > 34:
             return (False, f"Legacy address length {len(address)} out of range (25-34)")
         # Base58 character set (no 0, O, I, l)
-        base58_chars = set("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
-        invalid = set(address) - base58_chars
+        invalid = set(address) - _BASE58_CHARS
         if invalid:
             return (False, f"Invalid base58 character(s): {''.join(sorted(invalid))}")
 
     return (True, "")
 
 
+# (format, divisor, displayed decimals) per magnitude: H/s, KH/s, MH/s, GH/s
+_HASHRATE_FORMATS = (
+    ("%.0f H/s", 1, 0),
+    ("%.2f KH/s", 1e3, 2),
+    ("%.2f MH/s", 1e6, 2),
+    ("%.2f GH/s", 1e9, 2),
+)
+
+
+@lru_cache(maxsize=128)
+def _format_scaled_hashrate(bucket: int, scaled: float) -> str:
+    return _HASHRATE_FORMATS[bucket][0] % scaled
+
+
+def format_hashrate(rate: float) -> str:
+    """Human-readable hashrate, shared by the menu bar app and the TUI. The
+    value is rounded to the decimals its bucket displays before the cache
+    lookup; round() and %-formatting round the same way, so the string is
+    exactly what formatting the raw rate would give."""
+    bucket = 0 if rate < 1e3 else 1 if rate < 1e6 else 2 if rate < 1e9 else 3
+    _fmt, div, digits = _HASHRATE_FORMATS[bucket]
+    return _format_scaled_hashrate(bucket, round(rate / div, digits))
+
+
 def ping_pool(host: str, port: int, timeout: float = 3.0) -> tuple:
     """TCP ping a pool to check if it's online. Supports both IPv4 and IPv6.
     Returns (is_online: bool, latency_ms: float, error: str)."""
@@ -380,6 +433,40 @@ def ping_pool(host: str, port: int, timeout: float = 3.0) -> tuple:
         return (False, 0, str(e))
 
 
+async def ping_pool_async(host: str, port: int, timeout: float = 3.0) -> tuple:
+    """ping_pool for an asyncio loop, so one thread can ping many pools at
+    once. Returns (is_online: bool, latency_ms: float, error: str)."""
+    import asyncio
+    import socket
+    import time as _time
+
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await asyncio.wait_for(
+            loop.getaddrinfo(host, port, type=socket.SOCK_STREAM), timeout
+        )
+        if not infos:
+            return (False, 0, "DNS failed")
+        family, socktype, proto, canonname, sockaddr = infos[0]
+        sock = socket.socket(family, socktype, proto)
+        sock.setblocking(False)
+        try:
+            start = _time.time()
+            await asyncio.wait_for(loop.sock_connect(sock, sockaddr), timeout)
+            latency = (_time.time() - start) * 1000
+        finally:
+            sock.close()
+        return (True, round(latency, 1), "")
+    except socket.gaierror:
+        return (False, 0, "DNS failed")
+    except asyncio.TimeoutError:
+        return (False, 0, "Timeout")
+    except ConnectionRefusedError:
+        return (False, 0, "Refused")
+    except Exception as e:
+        return (False, 0, str(e))
+
+
 def write_crash_log(exc_type, exc_value, exc_tb):
     """Write a crash report to ~/Library/Application Support/SoloMiner/crash.log
     and return the path. Designed to be as safe as possible - no dependencies
@@ -102,6 +102,8 @@ class MiningEngine:
         self._last_hashrate_time: float = 0
         self._peak_hashrate: float = 0.0
         self._last_stats_persist: float = 0
+        # Called from a mining thread with each new hashrate sample
+        self.on_hashrate_sample: Optional[Callable[[float], None]] = None
 
         # Thread-safe status string for UI
         self._status: str = "Idle"
@@ -563,7 +565,10 @@ class MiningEngine:
                         self._hashes_since_last += hashes
                         if self.hashrate > self._peak_hashrate:
                             self._peak_hashrate = self.hashrate
+                        rate = self.hashrate
                     last_hr_time = now
+                    if self.on_hashrate_sample:
+                        self.on_hashrate_sample(rate)
 
                     # Auto-tune difficulty based on measured hashrate.
                     # After HASHRATE_MEASUREMENT_PERIOD seconds of mining,
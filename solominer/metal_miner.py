@@ -33,6 +33,11 @@ except ImportError:
     logger.warning("Metal framework not available, falling back to CPU mining")
 
 
+# Header arrives as 80 wire-format bytes; the shader takes 20 native uint32s
+_HEADER_WORDS_BE = struct.Struct(">20I")
+_HEADER_WORDS_NATIVE = struct.Struct("=20I")
+_TARGET_WORDS_NATIVE = struct.Struct("=8I")
+
 # Bitcoin difficulty-1 target (used to derive share targets from pool difficulty)
 DIFF1_TARGET = 0x00000000FFFF0000000000000000000000000000000000000000000000000000
 
@@ -280,6 +285,8 @@ class MetalMiner:
         self._hashcount = 0
         self._hashcount_lock = threading.Lock()
         self.best_share_bits = 0
+        # (target_int, MTLBuffer) for the last share target dispatched
+        self._target_buf = None
 
         if self.use_gpu:
             self._init_metal()
@@ -349,6 +356,22 @@ class MetalMiner:
             words.append(w)
         return words
 
+    def _target_buffer(self, target_int: int):
+        """
+        Metal buffer holding target_int as LE words for the shader.
+        The share target only changes with pool difficulty, so the last
+        buffer is reused; the shader never writes it, so threads can share it.
+        """
+        cached = self._target_buf
+        if cached is not None and cached[0] == target_int:
+            return cached[1]
+        target_packed = _TARGET_WORDS_NATIVE.pack(*self._target_to_le_uints(target_int))
+        buf = self.device.newBufferWithBytes_length_options_(
+            target_packed, len(target_packed), Metal.MTLResourceStorageModeShared
+        )
+        self._target_buf = (target_int, buf)
+        return buf
+
     def mine_range_gpu(
         self, header_data: bytes, target_int: int, base_nonce: int, count: int
     ) -> Optional[int]:
@@ -366,25 +389,15 @@ class MetalMiner:
         if count <= 0:
             return None
 
-        # Prepare header as 20 big-endian uint32 (matching wire format)
-        header_uints = []
-        for i in range(0, 80, 4):
-            val = struct.unpack(">I", header_data[i : i + 4])[0]
-            header_uints.append(val)
-
-        # Convert target to LE word array for shader
-        target_uints = self._target_to_le_uints(target_int)
-
-        # Create Metal buffers
-        header_packed = struct.pack("=" + "I" * 20, *header_uints)
+        # Header as 20 big-endian uint32 (matching wire format)
+        header_packed = _HEADER_WORDS_NATIVE.pack(
+            *_HEADER_WORDS_BE.unpack_from(header_data)
+        )
         header_buf = self.device.newBufferWithBytes_length_options_(
             header_packed, len(header_packed), Metal.MTLResourceStorageModeShared
         )
 
-        target_packed = struct.pack("=" + "I" * 8, *target_uints)
-        target_buf = self.device.newBufferWithBytes_length_options_(
-            target_packed, len(target_packed), Metal.MTLResourceStorageModeShared
-        )
+        target_buf = self._target_buffer(target_int)
 
         # Results: [found_flag, winning_nonce, best_leading_zeros, best_nonce]
         results_packed = struct.pack("=IIII", 0, 0, 0, 0)
@@ -13,6 +13,9 @@ Usage:
     python3 main.py --tui
 """
 
+import collections
+import queue
+import copy
 import curses
 import os
 import sys
@@ -20,6 +23,10 @@ import time
 import threading
 import struct
 import hashlib
+import textwrap
+from functools import lru_cache
+from itertools import groupby, islice
+from typing import Optional
 
 from .config import (
     MinerConfig,
@@ -27,10 +34,10 @@ from .config import (
     save_config,
     load_stats,
     save_stats,
-    read_log,
     clear_log,
     append_log,
     ping_pool,
+    format_hashrate,
     validate_bitcoin_address,
     install_login_item,
     uninstall_login_item,
@@ -38,8 +45,13 @@ from .config import (
     PoolConfig,
     DEFAULT_POOLS,
     APP_VERSION,
+    CONFIG_FILE,
+    LOG_FILE,
+    LOG_TAIL_BYTES,
+    STATS_FILE,
 )
 from .engine import MiningEngine
+from .metal_miner import MetalMiner
 
 # ── Color pair IDs ──
 C_NORMAL = 0
@@ -56,8 +68,45 @@ C_SELECTED = 10
 C_BLUE = 11
 
 
-def _init_colors():
-    """Initialize color pairs for the TUI."""
+# Address checks are pure functions of (address, network); memoize them so
+# repeated start/stop presses skip re-validation.
+_validate_address = lru_cache(maxsize=32)(validate_bitcoin_address)
+
+# Benchmark inputs: an all-zero header against an unreachable target, so
+# every nonce in the range is hashed (same as the menu bar benchmark)
+_BENCH_HEADER = b"\x00" * 80
+_BENCH_TARGET = 0
+
+# getch() blocks for up to this long, so an idle TUI sleeps in the kernel
+# between keystrokes instead of spinning. Also the live stats refresh rate.
+_INPUT_TIMEOUT_MS = 500
+
+# Log lines kept in memory for the log viewer, and how often the background
+# tail thread polls the log file for new data.
+_LOG_BUFFER_LINES = 10000
+_LOG_POLL_INTERVAL = 0.2
+
+# Most daemon threads serving background I/O (pool pings) at once
+_IO_WORKERS = 4
+
+# Upper bound of the CPU Threads setting
+_CPU_COUNT = os.cpu_count() or 4
+
+# Key code groups shared by the input handlers
+_ENTER_KEYS = frozenset((10, 13))
+_BACKSPACE_KEYS = frozenset((8, 127, curses.KEY_BACKSPACE))
+_BACK_KEYS = _BACKSPACE_KEYS | {27}  # Esc or Backspace leaves a sub-screen
+_PRINTABLE = frozenset(range(32, 127))
+
+# Applied once as log lines are read so the draw path never sees control
+# characters: tabs become a space, everything else shows as "?".
+_SANITIZE = str.maketrans(
+    {chr(c): " " if c == 9 else "?" for c in (*range(0, 32), 127)}
+)
+
+
+def _init_colors() -> dict:
+    """Initialize color pairs for the TUI. Returns {pair_id: attr}."""
     curses.start_color()
     curses.use_default_colors()
     # (pair_id, fg, bg)
@@ -72,17 +121,24 @@ def _init_colors():
     curses.init_pair(C_CARD, curses.COLOR_WHITE, -1)
     curses.init_pair(C_SELECTED, curses.COLOR_BLACK, curses.COLOR_CYAN)
     curses.init_pair(C_BLUE, curses.COLOR_BLUE, -1)
-
-
-def _format_hashrate(hr: float) -> str:
-    if hr >= 1e9:
-        return f"{hr / 1e9:.2f} GH/s"
-    elif hr >= 1e6:
-        return f"{hr / 1e6:.2f} MH/s"
-    elif hr >= 1e3:
-        return f"{hr / 1e3:.2f} KH/s"
-    else:
-        return f"{hr:.0f} H/s"
+    # Resolve every pair's attribute once so draw code does a dict lookup
+    return {
+        pair: curses.color_pair(pair)
+        for pair in (
+            C_NORMAL,
+            C_HEADER,
+            C_ACCENT,
+            C_GREEN,
+            C_RED,
+            C_ORANGE,
+            C_DIM,
+            C_CYAN,
+            C_STATUS_BAR,
+            C_CARD,
+            C_SELECTED,
+            C_BLUE,
+        )
+    }
 
 
 def _format_uptime(seconds: float) -> str:
@@ -117,19 +173,43 @@ def _format_runtime(seconds: float) -> str:
 
 def _safe_addstr(win, y, x, text, attr=0):
     """Write text to window, silently ignoring out-of-bounds errors."""
+    _safe_addnstr(win, y, x, text, len(text), attr)
+
+
+def _safe_addnstr(win, y, x, text, n, attr=0):
+    """Write at most n characters of text, clipped to the window width.
+    curses does the truncation, so callers never need to slice."""
     h, w = win.getmaxyx()
     if y < 0 or y >= h or x < 0:
         return
-    # Truncate if would exceed width
-    max_len = w - x - 1
-    if max_len <= 0:
+    n = min(n, w - x - 1)
+    if n <= 0:
         return
     try:
-        win.addnstr(y, x, text, max_len, attr)
+        win.addnstr(y, x, text, n, attr)
     except curses.error:
         pass
 
 
+def _draw_lines(win, y, x, lines, max_len, attr=0):
+    """Draw consecutive rows sharing one attribute with a single addnstr.
+    Each row is cut to max_len. Rows must already be free of control
+    characters (see _SANITIZE) or curses would expand them."""
+    if len(lines) > 1:
+        # A newline returns to column 0, so re-indent every following row
+        chunk = ("\n" + " " * x).join(line[:max_len] for line in lines)
+        h, _ = win.getmaxyx()
+        if y < 0 or y + len(lines) > h or max_len <= 0:
+            return
+        try:
+            win.addnstr(y, x, chunk, len(chunk), attr)
+        except curses.error:
+            pass
+        return
+    for i, line in enumerate(lines):
+        _safe_addnstr(win, y + i, x, line, max_len, attr)
+
+
 def _draw_box(win, y, x, h, w, title=""):
     """Draw a box outline with optional title."""
     rows, cols = win.getmaxyx()
@@ -170,17 +250,21 @@ class SoloMinerTUI:
     STATS_TABS = ["Overview", "Sessions"]
 
     def __init__(self):
-        self._config: MinerConfig = load_config()
+        self._config: MinerConfig = None
+        self._disk_config: MinerConfig = None  # last config read from disk
+        self._config_mtime = None
+        self._reload_config()
         self._engine = MiningEngine()
         self._screen = "dashboard"
         self._settings_tab = 0  # Mining=0, Pools=1, General=2, About=3
         self._stats_tab = 0  # Overview=0, Sessions=1
         self._running = True
+        self._attr: dict = {}  # pair_id -> curses attr, filled in by run()
 
         # Selection cursors for interactive fields
         self._sel_idx = 0  # General selection index within a screen
         self._input_mode = False
-        self._input_buffer = ""
+        self._input_buffer = bytearray()  # ASCII keystrokes, decoded on commit
         self._input_field = ""  # Which field is being edited
 
         # Pool management
@@ -188,22 +272,88 @@ class SoloMinerTUI:
 
         # Log scrolling
         self._log_scroll = 0
-        self._log_lines: list = []
+        # Filled by the log tail thread; _log_lock guards the buffer and offset
+        self._log_buf: collections.deque = collections.deque(maxlen=_LOG_BUFFER_LINES)
+        self._log_lock = threading.Lock()
+        self._log_offset = 0  # bytes of LOG_FILE already consumed
+        self._log_partial = b""  # trailing bytes without a newline yet
+        self._log_epoch = 0  # bumped by clears so a poll in flight is dropped
+
+        # Parsed stats.json, keyed by the file's mtime (read-only, for drawing)
+        self._stats_cache: Optional[tuple] = None
 
         # Benchmark state
-        self._benchmarking = False
         self._bench_result = ""
+        self._bench_miner: Optional[MetalMiner] = None  # created on first run
+        self._bench_thread: Optional[threading.Thread] = None
+
+        # Background I/O runs on a few daemon workers fed by a queue. Daemon
+        # threads (unlike executor workers) are not joined at exit, so
+        # quitting never waits on a ping or a benchmark.
+        self._io_jobs: queue.Queue = queue.Queue()
+        self._io_workers = 0
 
         # Ping states
         self._ping_results: dict = {}  # pool_index -> "120ms" or "Timeout" etc.
 
+        # Key dispatch tables (letters are folded to lowercase before lookup)
+        self._dash_keys = {
+            ord("s"): self._go_settings,
+            ord("t"): self._go_stats,
+            ord("l"): self._go_logs,
+            ord("m"): self._toggle_mining,
+            ord("b"): self._run_benchmark,
+        }
+        self._settings_keys = {
+            9: self._next_settings_tab,  # Tab
+            353: self._prev_settings_tab,  # Shift-Tab
+            curses.KEY_UP: self._sel_up,
+            curses.KEY_DOWN: self._sel_down,
+            curses.KEY_LEFT: self._cycle_mining_left,
+            curses.KEY_RIGHT: self._cycle_mining_right,
+            10: self._settings_enter,
+            13: self._settings_enter,
+            ord("s"): self._settings_save,
+        }
+        self._settings_tab_keys = {
+            1: {
+                ord("a"): self._pool_set_active,
+                ord("p"): self._pool_ping,
+                ord("d"): self._pool_delete,
+                ord("n"): self._pool_add_interactive,
+                ord("r"): self._pool_reset,
+            },
+            2: {
+                ord("c"): self._clear_log_from_settings,
+            },
+        }
+        self._stats_keys = {
+            9: self._next_stats_tab,  # Tab
+        }
+        self._logs_keys = {
+            curses.KEY_UP: self._log_scroll_up,
+            curses.KEY_DOWN: self._log_scroll_down,
+            curses.KEY_PPAGE: self._log_page_up,
+            curses.KEY_NPAGE: self._log_page_down,
+            ord("r"): self._log_refresh,
+            ord("c"): self._log_clear,
+        }
+        self._screen_handlers = {
+            "dashboard": self._handle_dashboard_input,
+            "settings": self._handle_settings_input,
+            "stats": self._handle_stats_input,
+            "logs": self._handle_logs_input,
+        }
+
     def run(self, stdscr):
         """Main entry point - called by curses.wrapper()."""
         self._stdscr = stdscr
-        _init_colors()
+        self._attr = _init_colors()
         curses.curs_set(0)
-        stdscr.nodelay(True)
-        stdscr.timeout(500)  # 500ms refresh for live stats
+        stdscr.timeout(_INPUT_TIMEOUT_MS)
+        threading.Thread(
+            target=self._log_tail_loop, daemon=True, name="tui-log-tail"
+        ).start()
 
         while self._running:
             try:
@@ -237,6 +387,28 @@ class SoloMinerTUI:
         if self._engine.is_running:
             self._engine.stop()
 
+    @property
+    def _benchmarking(self) -> bool:
+        return self._bench_thread is not None and self._bench_thread.is_alive()
+
+    def _submit_io(self, fn, *args):
+        """Queue fn(*args) for a background I/O worker, starting one if
+        fewer than _IO_WORKERS are running."""
+        self._io_jobs.put((fn, args))
+        if self._io_workers < _IO_WORKERS:
+            self._io_workers += 1
+            threading.Thread(
+                target=self._io_worker_loop, daemon=True, name="tui-io"
+            ).start()
+
+    def _io_worker_loop(self):
+        while True:
+            fn, args = self._io_jobs.get()
+            try:
+                fn(*args)
+            except Exception:
+                pass
+
     # ── Status bar ──
 
     def _draw_status_bar(self, win, h, w):
@@ -244,13 +416,11 @@ class SoloMinerTUI:
         # Top bar
         status = self._engine.status if self._engine.is_running else "Idle"
         hr_str = (
-            _format_hashrate(self._engine.hashrate)
-            if self._engine.is_running
-            else "---"
+            format_hashrate(self._engine.hashrate) if self._engine.is_running else "---"
         )
         top = f" SoloMiner v{APP_VERSION}  |  {status}  |  {hr_str} "
         top = top.ljust(w)
-        _safe_addstr(win, 0, 0, top[:w], curses.color_pair(C_STATUS_BAR))
+        _safe_addnstr(win, 0, 0, top, w, self._attr[C_STATUS_BAR])
 
         # Bottom help bar
         if self._input_mode:
@@ -266,7 +436,7 @@ class SoloMinerTUI:
         else:
             hint = " [Esc] Back  [Q]uit "
         hint = hint.ljust(w)
-        _safe_addstr(win, h - 1, 0, hint[:w], curses.color_pair(C_STATUS_BAR))
+        _safe_addnstr(win, h - 1, 0, hint, w, self._attr[C_STATUS_BAR])
 
     # ═══════════════════════════════════════════════════════════
     # Dashboard
@@ -277,16 +447,14 @@ class SoloMinerTUI:
         cx = 2  # content x offset
 
         # ── Title row ──
-        _safe_addstr(
-            win, y, cx, "SoloMiner", curses.A_BOLD | curses.color_pair(C_HEADER)
-        )
+        _safe_addstr(win, y, cx, "SoloMiner", curses.A_BOLD | self._attr[C_HEADER])
 
         # Status indicator
         eng = self._engine
         if eng.is_running:
             status = eng.status
             if status == "Mining":
-                st_color = curses.color_pair(C_GREEN)
+                st_color = self._attr[C_GREEN]
                 st_char = ">>>"
             elif status in (
                 "Connecting",
@@ -295,13 +463,13 @@ class SoloMinerTUI:
                 "Authorizing",
                 "Starting",
             ):
-                st_color = curses.color_pair(C_ORANGE)
+                st_color = self._attr[C_ORANGE]
                 st_char = "..."
             elif status in ("Auth Failed", "Disconnected", "Error"):
-                st_color = curses.color_pair(C_RED)
+                st_color = self._attr[C_RED]
                 st_char = "!!!"
             else:
-                st_color = curses.color_pair(C_ORANGE)
+                st_color = self._attr[C_ORANGE]
                 st_char = "..."
             _safe_addstr(
                 win,
@@ -311,14 +479,14 @@ class SoloMinerTUI:
                 st_color | curses.A_BOLD,
             )
         else:
-            _safe_addstr(win, y, w - 8, "Idle", curses.color_pair(C_DIM))
+            _safe_addstr(win, y, w - 8, "Idle", self._attr[C_DIM])
 
         # ── Hashrate box ──
         y += 2
         box_w = min(w - 4, 60)
         _draw_box(win, y, cx, 5, box_w, "Hash Rate")
         hr = eng.hashrate if eng.is_running else 0.0
-        hr_str = _format_hashrate(hr) if not self._benchmarking else "Benchmarking..."
+        hr_str = format_hashrate(hr) if not self._benchmarking else "Benchmarking..."
         if self._bench_result and not eng.is_running and not self._benchmarking:
             hr_str = self._bench_result
         _safe_addstr(
@@ -326,7 +494,7 @@ class SoloMinerTUI:
             y + 2,
             cx + 3,
             hr_str,
-            curses.A_BOLD | curses.color_pair(C_GREEN if eng.is_running else C_NORMAL),
+            curses.A_BOLD | self._attr[C_GREEN if eng.is_running else C_NORMAL],
         )
         threads_str = f"{eng.active_thread_count} thr" if eng.is_running else "--"
         _safe_addstr(
@@ -334,12 +502,12 @@ class SoloMinerTUI:
             y + 2,
             cx + box_w - len(threads_str) - 3,
             threads_str,
-            curses.color_pair(C_DIM),
+            self._attr[C_DIM],
         )
         peak_str = (
-            f"Peak: {_format_hashrate(eng.peak_hashrate)}" if eng.is_running else ""
+            f"Peak: {format_hashrate(eng.peak_hashrate)}" if eng.is_running else ""
         )
-        _safe_addstr(win, y + 3, cx + 3, peak_str, curses.color_pair(C_DIM))
+        _safe_addstr(win, y + 3, cx + 3, peak_str, self._attr[C_DIM])
 
         # ── Stats rows ──
         y += 6
@@ -371,7 +539,7 @@ class SoloMinerTUI:
         for label, val in rows:
             if y >= h - 6:
                 break
-            _safe_addstr(win, y, stats_col, label, curses.color_pair(C_DIM))
+            _safe_addstr(win, y, stats_col, label, self._attr[C_DIM])
             _safe_addstr(win, y, val_col, str(val), curses.A_BOLD)
             y += 1
 
@@ -389,15 +557,15 @@ class SoloMinerTUI:
             for label, val in details:
                 if y >= h - 4:
                     break
-                _safe_addstr(win, y, stats_col, label, curses.color_pair(C_DIM))
-                _safe_addstr(win, y, val_col, val, curses.color_pair(C_CYAN))
+                _safe_addstr(win, y, stats_col, label, self._attr[C_DIM])
+                _safe_addstr(win, y, val_col, val, self._attr[C_CYAN])
                 y += 1
 
         # ── Action buttons hint ──
         y = h - 3
         if eng.is_running:
             _safe_addstr(
-                win, y, cx, "[M] Stop Mining", curses.color_pair(C_RED) | curses.A_BOLD
+                win, y, cx, "[M] Stop Mining", self._attr[C_RED] | curses.A_BOLD
             )
         else:
             _safe_addstr(
@@ -405,10 +573,10 @@ class SoloMinerTUI:
                 y,
                 cx,
                 "[M] Start Mining",
-                curses.color_pair(C_GREEN) | curses.A_BOLD,
+                self._attr[C_GREEN] | curses.A_BOLD,
             )
-        _safe_addstr(win, y, cx + 20, "[B] Benchmark", curses.color_pair(C_ACCENT))
-        _safe_addstr(win, y, cx + 38, "[S] Settings", curses.color_pair(C_ACCENT))
+        _safe_addstr(win, y, cx + 20, "[B] Benchmark", self._attr[C_ACCENT])
+        _safe_addstr(win, y, cx + 38, "[S] Settings", self._attr[C_ACCENT])
 
     def _get_pool_display(self) -> str:
         pools = self._config.pools
@@ -428,15 +596,13 @@ class SoloMinerTUI:
         cx = 2
 
         # Tab bar
-        _safe_addstr(
-            win, y, cx, "Settings", curses.A_BOLD | curses.color_pair(C_HEADER)
-        )
+        _safe_addstr(win, y, cx, "Settings", curses.A_BOLD | self._attr[C_HEADER])
         y += 1
         for i, tab in enumerate(self.SETTINGS_TABS):
             attr = (
-                curses.color_pair(C_SELECTED) | curses.A_BOLD
+                self._attr[C_SELECTED] | curses.A_BOLD
                 if i == self._settings_tab
-                else curses.color_pair(C_DIM)
+                else self._attr[C_DIM]
             )
             label = f" {tab} "
             _safe_addstr(win, y, cx, label, attr)
@@ -464,18 +630,18 @@ class SoloMinerTUI:
             is_editing = self._input_mode and self._input_field == label
 
             # Label
-            _safe_addstr(win, y, cx, label + ":", curses.color_pair(C_DIM))
+            _safe_addstr(win, y, cx, label + ":", self._attr[C_DIM])
 
             # Value
             val_x = cx + 20
             if is_editing:
-                display = self._input_buffer + "_"
+                display = self._input_buffer.decode("ascii", "ignore") + "_"
                 _safe_addstr(
                     win,
                     y,
                     val_x,
                     display,
-                    curses.A_UNDERLINE | curses.color_pair(C_ACCENT),
+                    curses.A_UNDERLINE | self._attr[C_ACCENT],
                 )
             elif is_sel and editable:
                 _safe_addstr(
@@ -483,16 +649,14 @@ class SoloMinerTUI:
                     y,
                     val_x,
                     str(value),
-                    curses.color_pair(C_SELECTED) | curses.A_BOLD,
+                    self._attr[C_SELECTED] | curses.A_BOLD,
                 )
             else:
-                attr = curses.A_BOLD if editable else curses.color_pair(C_DIM)
+                attr = curses.A_BOLD if editable else self._attr[C_DIM]
                 _safe_addstr(win, y, val_x, str(value), attr)
 
             if is_sel and not self._input_mode:
-                _safe_addstr(
-                    win, y, cx - 1, ">", curses.color_pair(C_GREEN) | curses.A_BOLD
-                )
+                _safe_addstr(win, y, cx - 1, ">", self._attr[C_GREEN] | curses.A_BOLD)
             y += 1
 
         # Save hint
@@ -503,7 +667,7 @@ class SoloMinerTUI:
                 y,
                 cx,
                 "[Enter] Edit  [S] Save Config  [Left/Right] Cycle",
-                curses.color_pair(C_DIM),
+                self._attr[C_DIM],
             )
 
     def _mining_fields(self) -> list:
@@ -542,8 +706,7 @@ class SoloMinerTUI:
             idx = (idx + direction) % len(opts)
             cfg.gpu_threads = opts[idx]
         elif label == "CPU Threads":
-            cpu_max = os.cpu_count() or 4
-            opts = list(range(0, cpu_max + 1))
+            opts = list(range(0, _CPU_COUNT + 1))
             idx = opts.index(cfg.cpu_threads) if cfg.cpu_threads in opts else 0
             idx = (idx + direction) % len(opts)
             cfg.cpu_threads = opts[idx]
@@ -575,30 +738,34 @@ class SoloMinerTUI:
         if label == "Worker Name":
             self._input_mode = True
             self._input_field = label
-            self._input_buffer = self._config.worker_name
+            self._input_buffer = bytearray(
+                self._config.worker_name.encode("ascii", "ignore")
+            )
         elif label == "Address":
             self._input_mode = True
             self._input_field = label
-            self._input_buffer = self._config.bitcoin_address
+            self._input_buffer = bytearray(
+                self._config.bitcoin_address.encode("ascii", "ignore")
+            )
 
     def _finish_edit_mining_field(self):
         """Commit the current input buffer to the config."""
         label = self._input_field
-        val = self._input_buffer.strip()
+        val = self._input_buffer.decode("ascii", "ignore").strip()
         if label == "Worker Name":
             self._config.worker_name = val
         elif label == "Address":
             self._config.bitcoin_address = val
             # Validate address and show result in log
             if val:
-                valid, err = validate_bitcoin_address(val, self._config.network)
+                valid, err = _validate_address(val, self._config.network)
                 if valid:
                     append_log(f"[TUI] Address accepted: {val[:16]}...")
                 else:
                     append_log(f"[TUI] Address warning: {err}")
         self._input_mode = False
         self._input_field = ""
-        self._input_buffer = ""
+        self._input_buffer = bytearray()
 
     def _save_mining_config(self):
         """Save mining settings to disk."""
@@ -618,7 +785,7 @@ class SoloMinerTUI:
             y,
             cx + 20,
             f"Active: #{self._config.active_pool_index}",
-            curses.color_pair(C_GREEN),
+            self._attr[C_GREEN],
         )
         y += 1
 
@@ -628,7 +795,7 @@ class SoloMinerTUI:
             y,
             cx,
             "  # On Name                 Host                        ",
-            curses.color_pair(C_DIM),
+            self._attr[C_DIM],
         )
         y += 1
 
@@ -650,7 +817,7 @@ class SoloMinerTUI:
             line = f"{marker}{pi:>2} {en_mark} {name:<20} {host}:{port:<5}"
             ping = self._ping_results.get(pi, "")
 
-            attr = curses.color_pair(C_SELECTED) if is_sel else curses.A_NORMAL
+            attr = self._attr[C_SELECTED] if is_sel else curses.A_NORMAL
             if is_active:
                 attr |= curses.A_BOLD
             _safe_addstr(win, y, cx, line, attr)
@@ -662,7 +829,7 @@ class SoloMinerTUI:
                 y,
                 badge_x,
                 f"BTC{active_mark}",
-                curses.color_pair(C_BLUE) | curses.A_BOLD,
+                self._attr[C_BLUE] | curses.A_BOLD,
             )
 
             # Ping result
@@ -673,7 +840,7 @@ class SoloMinerTUI:
                     y,
                     min(badge_x + 8, w - len(ping) - 2),
                     ping,
-                    curses.color_pair(ping_col),
+                    self._attr[ping_col],
                 )
 
             y += 1
@@ -686,7 +853,7 @@ class SoloMinerTUI:
                 y,
                 cx,
                 "[Enter] Toggle  [A] Set Active  [P] Ping  [D] Delete  [N] New  [R] Reset  [S] Save",
-                curses.color_pair(C_DIM),
+                self._attr[C_DIM],
             )
 
     # ── Settings > General ──
@@ -706,8 +873,8 @@ class SoloMinerTUI:
                 break
             is_sel = i == self._sel_idx
             marker = ">" if is_sel else " "
-            attr = curses.color_pair(C_SELECTED) if is_sel else curses.A_NORMAL
-            _safe_addstr(win, y, cx, f"{marker} {label}:", curses.color_pair(C_DIM))
+            attr = self._attr[C_SELECTED] if is_sel else curses.A_NORMAL
+            _safe_addstr(win, y, cx, f"{marker} {label}:", self._attr[C_DIM])
             _safe_addstr(win, y, cx + 22, value, attr | curses.A_BOLD)
             y += 1
 
@@ -718,7 +885,7 @@ class SoloMinerTUI:
                 y,
                 cx,
                 "[Enter] Toggle  [S] Save  [C] Clear Log",
-                curses.color_pair(C_DIM),
+                self._attr[C_DIM],
             )
 
     def _toggle_general_field(self):
@@ -747,13 +914,11 @@ class SoloMinerTUI:
 
     def _draw_settings_about(self, win, y, h, w):
         cx = 4
-        _safe_addstr(
-            win, y, cx, "SoloMiner", curses.A_BOLD | curses.color_pair(C_HEADER)
-        )
+        _safe_addstr(win, y, cx, "SoloMiner", curses.A_BOLD | self._attr[C_HEADER])
         y += 1
-        _safe_addstr(win, y, cx, f"Version {APP_VERSION}", curses.color_pair(C_DIM))
+        _safe_addstr(win, y, cx, f"Version {APP_VERSION}", self._attr[C_DIM])
         y += 1
-        _safe_addstr(win, y, cx, "by Cooper Wang", curses.color_pair(C_DIM))
+        _safe_addstr(win, y, cx, "by Cooper Wang", self._attr[C_DIM])
         y += 2
         desc = (
             "A lightweight, native macOS menu bar application for solo Bitcoin mining."
@@ -764,7 +929,7 @@ class SoloMinerTUI:
         for line in _word_wrap(desc, w - cx - 2):
             if y >= h - 12:
                 break
-            _safe_addstr(win, y, cx, line, curses.color_pair(C_DIM))
+            _safe_addstr(win, y, cx, line, self._attr[C_DIM])
             y += 1
 
         y += 1
@@ -778,13 +943,13 @@ class SoloMinerTUI:
         for label, val in info:
             if y >= h - 5:
                 break
-            _safe_addstr(win, y, cx, f"{label}:", curses.color_pair(C_DIM))
+            _safe_addstr(win, y, cx, f"{label}:", self._attr[C_DIM])
             _safe_addstr(win, y, cx + 14, val, curses.A_BOLD)
             y += 1
 
         y += 1
         if y < h - 3:
-            _safe_addstr(win, y, cx, "Donate:", curses.color_pair(C_DIM))
+            _safe_addstr(win, y, cx, "Donate:", self._attr[C_DIM])
             y += 1
         if y < h - 2:
             from .config import DONATION_ADDRESS
@@ -794,27 +959,35 @@ class SoloMinerTUI:
                 y,
                 cx,
                 DONATION_ADDRESS,
-                curses.color_pair(C_ORANGE) | curses.A_BOLD,
+                self._attr[C_ORANGE] | curses.A_BOLD,
             )
 
     # ═══════════════════════════════════════════════════════════
     # Stats
     # ═══════════════════════════════════════════════════════════
 
+    def _cached_stats(self) -> dict:
+        """load_stats(), re-read only when stats.json's mtime changes."""
+        try:
+            mtime = os.stat(STATS_FILE).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._stats_cache is None or self._stats_cache[0] != mtime:
+            self._stats_cache = (mtime, load_stats())
+        return self._stats_cache[1]
+
     def _draw_stats(self, win, h, w):
         y = 2
         cx = 2
 
-        _safe_addstr(
-            win, y, cx, "Statistics", curses.A_BOLD | curses.color_pair(C_HEADER)
-        )
+        _safe_addstr(win, y, cx, "Statistics", curses.A_BOLD | self._attr[C_HEADER])
         y += 1
         tab_x = cx
         for i, tab in enumerate(self.STATS_TABS):
             attr = (
-                curses.color_pair(C_SELECTED) | curses.A_BOLD
+                self._attr[C_SELECTED] | curses.A_BOLD
                 if i == self._stats_tab
-                else curses.color_pair(C_DIM)
+                else self._attr[C_DIM]
             )
             label = f" {tab} "
             _safe_addstr(win, y, tab_x, label, attr)
@@ -828,7 +1001,7 @@ class SoloMinerTUI:
 
     def _draw_stats_overview(self, win, y, h, w):
         cx = 2
-        stats = load_stats()
+        stats = self._cached_stats()
 
         cards = [
             ("Hashes", _format_hashes(stats.get("total_hashes", 0)), "Total computed"),
@@ -840,7 +1013,7 @@ class SoloMinerTUI:
             ("Shares", str(stats.get("shares_found", 0)), "Shares found"),
             (
                 "Peak",
-                _format_hashrate(stats.get("peak_hashrate", 0.0)),
+                format_hashrate(stats.get("peak_hashrate", 0.0)),
                 "Peak hash rate",
             ),
         ]
@@ -857,13 +1030,13 @@ class SoloMinerTUI:
                 row + 1,
                 col + 3,
                 value,
-                curses.A_BOLD | curses.color_pair(C_ORANGE),
+                curses.A_BOLD | self._attr[C_ORANGE],
             )
-            _safe_addstr(win, row + 2, col + 3, subtitle, curses.color_pair(C_DIM))
+            _safe_addstr(win, row + 2, col + 3, subtitle, self._attr[C_DIM])
 
     def _draw_stats_sessions(self, win, y, h, w):
         cx = 2
-        stats = load_stats()
+        stats = self._cached_stats()
         sessions = stats.get("sessions", [])
 
         if not sessions:
@@ -872,7 +1045,7 @@ class SoloMinerTUI:
                 y + 2,
                 cx + 4,
                 "No mining sessions recorded yet.",
-                curses.color_pair(C_DIM),
+                self._attr[C_DIM],
             )
             return
 
@@ -882,7 +1055,7 @@ class SoloMinerTUI:
             y,
             cx,
             f"{'Start Time':<20} {'Runtime':>8} {'Shares':>6} {'Peak':>10}",
-            curses.A_BOLD | curses.color_pair(C_DIM),
+            curses.A_BOLD | self._attr[C_DIM],
         )
         y += 1
 
@@ -911,56 +1084,99 @@ class SoloMinerTUI:
         cx = 1
 
         _safe_addstr(
-            win, y, cx + 1, "Mining Logs", curses.A_BOLD | curses.color_pair(C_HEADER)
+            win, y, cx + 1, "Mining Logs", curses.A_BOLD | self._attr[C_HEADER]
         )
-        _safe_addstr(win, y, w - 18, "[R]efresh [C]lear", curses.color_pair(C_DIM))
+        _safe_addstr(win, y, w - 18, "[R]efresh [C]lear", self._attr[C_DIM])
         y += 1
 
-        self._refresh_log_lines()
-
         visible_h = h - y - 2
-        total = len(self._log_lines)
-        # Clamp scroll
-        max_scroll = max(0, total - visible_h)
-        self._log_scroll = max(0, min(self._log_scroll, max_scroll))
-
-        start = self._log_scroll
-        for i in range(visible_h):
-            line_idx = start + i
-            if line_idx >= total:
-                break
-            line = self._log_lines[line_idx]
-            # Color code
-            attr = curses.color_pair(C_DIM)
-            line_upper = line.upper()
-            if "SHARE FOUND" in line.upper():
-                attr = curses.color_pair(C_GREEN) | curses.A_BOLD
-            elif (
-                "ERROR" in line_upper
-                or "REJECTED" in line_upper
-                or "FAILED" in line_upper
-            ):
-                attr = curses.color_pair(C_RED)
-            elif "ACCEPTED" in line or "Authorized" in line:
-                attr = curses.color_pair(C_GREEN)
-            elif "[STRATUM" in line:
-                attr = curses.color_pair(C_BLUE)
-            elif "[ENGINE" in line:
-                attr = curses.color_pair(C_CYAN)
-
-            display = line[: w - cx - 1]
-            _safe_addstr(win, y + i, cx, display, attr)
+        with self._log_lock:
+            total = len(self._log_buf)
+            # Clamp scroll
+            max_scroll = max(0, total - visible_h)
+            self._log_scroll = max(0, min(self._log_scroll, max_scroll))
+            start = self._log_scroll
+            visible = list(islice(self._log_buf, start, start + visible_h))
+        if not visible:
+            visible = ["(no log entries)"]
+
+        max_len = w - cx - 1
+        row = y
+        # Consecutive lines with the same color are drawn in one call
+        for attr, group in groupby(visible, key=self._log_line_attr):
+            run = list(group)
+            _draw_lines(win, row, cx, run, max_len, attr)
+            row += len(run)
 
         # Scroll indicator
         if total > visible_h:
             pct = int(100 * (start + visible_h) / total) if total > 0 else 100
-            _safe_addstr(
-                win, h - 2, w - 12, f"{pct:>3}% ({total})", curses.color_pair(C_DIM)
-            )
-
-    def _refresh_log_lines(self):
-        text = read_log()
-        self._log_lines = text.splitlines() if text else ["(no log entries)"]
+            _safe_addstr(win, h - 2, w - 12, f"{pct:>3}% ({total})", self._attr[C_DIM])
+
+    def _log_line_attr(self, line: str) -> int:
+        """Color code a log line."""
+        line_upper = line.upper()
+        if "SHARE FOUND" in line_upper:
+            return self._attr[C_GREEN] | curses.A_BOLD
+        if "ERROR" in line_upper or "REJECTED" in line_upper or "FAILED" in line_upper:
+            return self._attr[C_RED]
+        if "ACCEPTED" in line or "Authorized" in line:
+            return self._attr[C_GREEN]
+        if "[STRATUM" in line:
+            return self._attr[C_BLUE]
+        if "[ENGINE" in line:
+            return self._attr[C_CYAN]
+        return self._attr[C_DIM]
+
+    def _log_tail_loop(self):
+        """Follow the log file in the background so the UI thread only ever
+        reads from the in-memory buffer."""
+        while self._running:
+            self._poll_log_file()
+            time.sleep(_LOG_POLL_INTERVAL)
+
+    def _poll_log_file(self):
+        """Append any lines written since the last poll. The stat, read and
+        decode run outside _log_lock, which is only taken to snapshot and
+        commit the buffer state, so a redraw never waits on the disk."""
+        with self._log_lock:
+            offset = self._log_offset
+            partial = self._log_partial
+            epoch = self._log_epoch
+        try:
+            size = os.path.getsize(LOG_FILE)
+        except OSError:
+            size = 0
+        if size == offset:
+            return
+        # First load, or the log was cleared/replaced: start over, reading
+        # only the last LOG_TAIL_BYTES like config.read_log
+        reload = offset == 0 or size < offset
+        start = max(0, size - LOG_TAIL_BYTES) if reload else offset
+        try:
+            with open(LOG_FILE, "rb") as f:
+                f.seek(start)
+                data = f.read()
+        except OSError:
+            return
+        new_offset = start + len(data)
+        if reload:
+            partial = b""
+            if start:
+                data = data[data.find(b"\n") + 1 :]  # begin at a full line
+        lines = (partial + data).split(b"\n")
+        partial = lines.pop()
+        decoded = [
+            line.decode("utf-8", "replace").translate(_SANITIZE) for line in lines
+        ]
+        with self._log_lock:
+            if self._log_epoch != epoch:
+                return  # cleared while reading; the next poll starts fresh
+            if reload:
+                self._log_buf.clear()
+            self._log_buf.extend(decoded)
+            self._log_offset = new_offset
+            self._log_partial = partial
 
     # ═══════════════════════════════════════════════════════════
     # Input handling
@@ -980,17 +1196,21 @@ class SoloMinerTUI:
             if ch == 27:  # Esc
                 self._input_mode = False
                 self._input_field = ""
-                self._input_buffer = ""
-            elif ch in (10, 13):  # Enter
+                self._input_buffer = bytearray()
+            elif ch in _ENTER_KEYS:  # Enter
                 self._finish_edit_mining_field()
-            elif ch in (127, curses.KEY_BACKSPACE, 8):
-                self._input_buffer = self._input_buffer[:-1]
-            elif 32 <= ch <= 126:
-                self._input_buffer += chr(ch)
+            elif ch in _BACKSPACE_KEYS:
+                del self._input_buffer[-1:]
+            elif ch in _PRINTABLE:
+                self._input_buffer.append(ch)
             return
 
+        # Fold A-Z to a-z so the dispatch tables only hold lowercase keys
+        if 65 <= ch <= 90:
+            ch |= 0x20
+
         # ── Global keys ──
-        if ch == ord("q") or ch == ord("Q"):
+        if ch == ord("q"):
             if self._screen == "dashboard":
                 self._running = False
                 return
@@ -999,134 +1219,128 @@ class SoloMinerTUI:
                 self._sel_idx = 0
                 return
 
-        if ch == 27 or ch == curses.KEY_BACKSPACE or ch == 127 or ch == 8:
+        if ch in _BACK_KEYS:
             if self._screen != "dashboard":
                 self._screen = "dashboard"
                 self._sel_idx = 0
                 return
 
         # ── Screen-specific keys ──
-        if self._screen == "dashboard":
-            self._handle_dashboard_input(ch)
-        elif self._screen == "settings":
-            self._handle_settings_input(ch)
-        elif self._screen == "stats":
-            self._handle_stats_input(ch)
-        elif self._screen == "logs":
-            self._handle_logs_input(ch)
+        handler = self._screen_handlers.get(self._screen)
+        if handler:
+            handler(ch)
 
     def _handle_dashboard_input(self, ch):
-        c = chr(ch) if 32 <= ch <= 126 else ""
-        if c in ("s", "S"):
-            self._screen = "settings"
-            self._sel_idx = 0
-        elif c in ("t", "T"):
-            self._screen = "stats"
-            self._sel_idx = 0
-        elif c in ("l", "L"):
-            self._screen = "logs"
-            self._log_scroll = max(0, len(self._log_lines) - 20)
-            self._refresh_log_lines()
-        elif c in ("m", "M"):
-            self._toggle_mining()
-        elif c in ("b", "B"):
-            self._run_benchmark()
+        h = self._dash_keys.get(ch)
+        if h:
+            h()
 
     def _handle_settings_input(self, ch):
-        c = chr(ch) if 32 <= ch <= 126 else ""
+        h = self._settings_keys.get(ch)
+        if h is None:
+            tab_keys = self._settings_tab_keys.get(self._settings_tab)
+            h = tab_keys.get(ch) if tab_keys else None
+        if h:
+            h()
 
-        # Tab switching
-        if ch == 9:  # Tab
-            if self._settings_tab < 3:
-                self._settings_tab += 1
-            else:
-                self._settings_tab = 0
-            self._sel_idx = 0
-            return
-        # Shift-Tab (often 353)
-        if ch == 353:
-            if self._settings_tab > 0:
-                self._settings_tab -= 1
-            else:
-                self._settings_tab = 3
-            self._sel_idx = 0
-            return
+    def _handle_stats_input(self, ch):
+        h = self._stats_keys.get(ch)
+        if h:
+            h()
 
-        # Navigation
-        if ch == curses.KEY_UP:
-            self._sel_idx = max(0, self._sel_idx - 1)
-            return
-        if ch == curses.KEY_DOWN:
-            self._sel_idx += 1
-            return
+    def _handle_logs_input(self, ch):
+        h = self._logs_keys.get(ch)
+        if h:
+            h()
+
+    # ── Key actions: dashboard ──
+
+    def _go_settings(self):
+        self._screen = "settings"
+        self._sel_idx = 0
+
+    def _go_stats(self):
+        self._screen = "stats"
+        self._sel_idx = 0
 
-        # Left/Right for cycling
-        if ch == curses.KEY_LEFT and self._settings_tab == 0:
+    def _go_logs(self):
+        self._screen = "logs"
+        self._log_scroll = max(0, len(self._log_buf) - 20)
+
+    # ── Key actions: settings ──
+
+    def _next_settings_tab(self):
+        self._settings_tab = (self._settings_tab + 1) % len(self.SETTINGS_TABS)
+        self._sel_idx = 0
+
+    def _prev_settings_tab(self):
+        self._settings_tab = (self._settings_tab - 1) % len(self.SETTINGS_TABS)
+        self._sel_idx = 0
+
+    def _sel_up(self):
+        self._sel_idx = max(0, self._sel_idx - 1)
+
+    def _sel_down(self):
+        self._sel_idx += 1
+
+    def _cycle_mining_left(self):
+        if self._settings_tab == 0:
             self._cycle_mining_field(-1)
-            return
-        if ch == curses.KEY_RIGHT and self._settings_tab == 0:
+
+    def _cycle_mining_right(self):
+        if self._settings_tab == 0:
             self._cycle_mining_field(1)
-            return
 
-        # Enter
-        if ch in (10, 13):
-            if self._settings_tab == 0:
-                self._start_edit_mining_field()
-            elif self._settings_tab == 1:
-                self._pool_toggle_enabled()
-            elif self._settings_tab == 2:
-                self._toggle_general_field()
-            return
+    def _settings_enter(self):
+        if self._settings_tab == 0:
+            self._start_edit_mining_field()
+        elif self._settings_tab == 1:
+            self._pool_toggle_enabled()
+        elif self._settings_tab == 2:
+            self._toggle_general_field()
 
-        # Save
-        if c in ("s", "S"):
-            if self._settings_tab in (0, 2):
-                self._save_mining_config()
-            elif self._settings_tab == 1:
-                save_config(self._config)
-                append_log("[TUI] Pool configuration saved")
-            return
+    def _settings_save(self):
+        if self._settings_tab in (0, 2):
+            self._save_mining_config()
+        elif self._settings_tab == 1:
+            save_config(self._config)
+            append_log("[TUI] Pool configuration saved")
 
-        # Pool-specific keys
-        if self._settings_tab == 1:
-            if c in ("a", "A"):
-                self._pool_set_active()
-            elif c in ("p", "P"):
-                self._pool_ping()
-            elif c in ("d", "D"):
-                self._pool_delete()
-            elif c in ("n", "N"):
-                self._pool_add_interactive()
-            elif c in ("r", "R"):
-                self._pool_reset()
-
-        # General-specific keys
-        if self._settings_tab == 2:
-            if c in ("c", "C"):
-                clear_log()
-                append_log("[TUI] Log cleared")
+    def _clear_log_from_settings(self):
+        clear_log()
+        append_log("[TUI] Log cleared")
 
-    def _handle_stats_input(self, ch):
-        if ch == 9:  # Tab
-            self._stats_tab = (self._stats_tab + 1) % len(self.STATS_TABS)
+    # ── Key actions: stats ──
 
-    def _handle_logs_input(self, ch):
-        c = chr(ch) if 32 <= ch <= 126 else ""
-        if ch == curses.KEY_UP:
-            self._log_scroll = max(0, self._log_scroll - 1)
-        elif ch == curses.KEY_DOWN:
-            self._log_scroll += 1
-        elif ch == curses.KEY_PPAGE:  # Page Up
-            self._log_scroll = max(0, self._log_scroll - 20)
-        elif ch == curses.KEY_NPAGE:  # Page Down
-            self._log_scroll += 20
-        elif c in ("r", "R"):
-            self._refresh_log_lines()
-            self._log_scroll = max(0, len(self._log_lines) - 20)
-        elif c in ("c", "C"):
-            clear_log()
-            self._log_lines = ["(log cleared)"]
-            self._log_scroll = 0
+    def _next_stats_tab(self):
+        self._stats_tab = (self._stats_tab + 1) % len(self.STATS_TABS)
+
+    # ── Key actions: logs ──
+
+    def _log_scroll_up(self):
+        self._log_scroll = max(0, self._log_scroll - 1)
+
+    def _log_scroll_down(self):
+        self._log_scroll += 1
+
+    def _log_page_up(self):
+        self._log_scroll = max(0, self._log_scroll - 20)
+
+    def _log_page_down(self):
+        self._log_scroll += 20
+
+    def _log_refresh(self):
+        # The tail thread keeps the buffer current; refresh jumps to the end
+        self._log_scroll = max(0, len(self._log_buf) - 20)
+
+    def _log_clear(self):
+        clear_log()
+        with self._log_lock:
+            self._log_buf.clear()
+            self._log_offset = 0
+            self._log_partial = b""
+            self._log_epoch += 1
+        self._log_scroll = 0
 
     # ═══════════════════════════════════════════════════════════
     # Actions
@@ -1137,7 +1351,7 @@ class SoloMinerTUI:
             self._engine.stop()
             append_log("[TUI] Mining stopped")
         else:
-            self._config = load_config()
+            self._reload_config()
             address = self._config.bitcoin_address
             if not address:
                 append_log(
@@ -1146,7 +1360,7 @@ class SoloMinerTUI:
                 return
 
             # Validate address format
-            valid, err = validate_bitcoin_address(address, self._config.network)
+            valid, err = _validate_address(address, self._config.network)
             if not valid:
                 append_log(f"[TUI] ERROR: Invalid address: {err}")
                 return
@@ -1172,42 +1386,53 @@ class SoloMinerTUI:
             )
             append_log(f"[TUI] Mining started -> {host}:{port} (Bitcoin / SHA-256d)")
 
+    def _reload_config(self):
+        """Reset the working config to what is on disk, skipping the read and
+        parse when the config file has not changed since the last load."""
+        try:
+            mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._disk_config is None or mtime is None or mtime != self._config_mtime:
+            self._disk_config = load_config()
+            self._config_mtime = mtime
+        # Hand out a copy so unsaved edits never leak into the cached snapshot
+        self._config = copy.deepcopy(self._disk_config)
+
     def _run_benchmark(self):
         if self._benchmarking or self._engine.is_running:
             return
-        self._benchmarking = True
         self._bench_result = ""
+        self._bench_thread = threading.Thread(
+            target=self._do_benchmark, daemon=True, name="tui-bench"
+        )
+        self._bench_thread.start()
 
-        def _bench():
-            try:
-                from .metal_miner import MetalMiner
-
-                miner = MetalMiner()
-                header = b"\x00" * 80
-                target = (1 << 256) - 1
-                total_hashes = 0
-                batch = (1 << 22) if miner.use_gpu else (1 << 18)
-                iters = 10
-                start = time.time()
-                for _ in range(iters):
-                    miner.mine_range_gpu(
-                        header, target, 0, batch
-                    ) if miner.use_gpu else miner.mine_range_cpu(
-                        header, target, 0, batch
-                    )
-                    total_hashes += batch
-                elapsed = time.time() - start
-                rate = total_hashes / elapsed if elapsed > 0 else 0
-                self._bench_result = f"{_format_hashrate(rate)} ({miner.gpu_name})"
-                append_log(f"[TUI] Benchmark: {self._bench_result}")
-            except Exception as e:
-                self._bench_result = f"Error: {e}"
-                append_log(f"[TUI] Benchmark error: {e}")
-            finally:
-                self._benchmarking = False
-
-        t = threading.Thread(target=_bench, daemon=True)
-        t.start()
+    def _do_benchmark(self):
+        try:
+            if self._bench_miner is None:
+                self._bench_miner = MetalMiner()
+            miner = self._bench_miner
+            batch = (1 << 22) if miner.use_gpu else (1 << 18)
+            iters = 10
+            # One large range lets the backend run uninterrupted instead
+            # of paying a dispatch round-trip per batch.
+            total_hashes = batch * iters
+            miner.get_and_reset_hashcount()  # the miner is reused across runs
+            start = time.time()
+            if miner.use_gpu:
+                miner.mine_range_gpu(_BENCH_HEADER, _BENCH_TARGET, 0, total_hashes)
+            else:
+                miner.mine_range_cpu(_BENCH_HEADER, _BENCH_TARGET, 0, total_hashes)
+            elapsed = time.time() - start
+            # Count what the backend actually hashed, not what was requested
+            hashed = miner.get_and_reset_hashcount()
+            rate = hashed / elapsed if elapsed > 0 else 0
+            self._bench_result = f"{format_hashrate(rate)} ({miner.gpu_name})"
+            append_log(f"[TUI] Benchmark: {self._bench_result}")
+        except Exception as e:
+            self._bench_result = f"Error: {e}"
+            append_log(f"[TUI] Benchmark error: {e}")
 
     # ── Pool actions ──
 
@@ -1241,16 +1466,14 @@ class SoloMinerTUI:
             host = pool.get("host", "")
             port = pool.get("port", 3333)
             self._ping_results[pi] = "..."
+            self._submit_io(self._do_ping, pi, host, port)
 
-            def _do_ping():
-                online, latency, err = ping_pool(host, port)
-                if online:
-                    self._ping_results[pi] = f"{latency}ms"
-                else:
-                    self._ping_results[pi] = err or "Offline"
-
-            t = threading.Thread(target=_do_ping, daemon=True)
-            t.start()
+    def _do_ping(self, pi: int, host: str, port: int):
+        online, latency, err = ping_pool(host, port)
+        if online:
+            self._ping_results[pi] = f"{latency}ms"
+        else:
+            self._ping_results[pi] = err or "Offline"
 
     def _pool_reset(self):
         from dataclasses import asdict
@@ -1294,29 +1517,33 @@ class SoloMinerTUI:
         curses.curs_set(1)
         win.nodelay(False)
 
-        buf = ""
+        buf = bytearray()
         while True:
             # Draw prompt
             _safe_addstr(win, h - 2, 0, " " * (w - 1))
             _safe_addstr(
-                win, h - 2, 1, prompt_text + buf + "_", curses.color_pair(C_ACCENT)
+                win,
+                h - 2,
+                1,
+                prompt_text + buf.decode("ascii", "ignore") + "_",
+                self._attr[C_ACCENT],
             )
             win.refresh()
 
             ch = win.getch()
-            if ch in (10, 13):  # Enter
+            if ch in _ENTER_KEYS:  # Enter
                 break
             elif ch == 27:  # Esc
-                buf = ""
+                buf.clear()
                 break
-            elif ch in (127, curses.KEY_BACKSPACE, 8):
-                buf = buf[:-1]
-            elif 32 <= ch <= 126:
-                buf += chr(ch)
+            elif ch in _BACKSPACE_KEYS:
+                del buf[-1:]
+            elif ch in _PRINTABLE:
+                buf.append(ch)
 
         curses.curs_set(0)
-        win.nodelay(True)
-        return buf.strip()
+        win.timeout(_INPUT_TIMEOUT_MS)
+        return buf.decode("ascii", "ignore").strip()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -1324,20 +1551,14 @@ class SoloMinerTUI:
 # ═══════════════════════════════════════════════════════════════
 
 
-def _word_wrap(text: str, width: int) -> list:
-    """Simple word-wrap for a string."""
-    words = text.split()
-    lines = []
-    current = ""
-    for word in words:
-        if current and len(current) + 1 + len(word) > width:
-            lines.append(current)
-            current = word
-        else:
-            current = current + " " + word if current else word
-    if current:
-        lines.append(current)
-    return lines
+@lru_cache(maxsize=512)
+def _word_wrap(text: str, width: int) -> tuple:
+    """Word-wrap a string. Cached on (text, width) since redraws repeat."""
+    return tuple(
+        textwrap.wrap(
+            text, max(1, width), break_long_words=False, break_on_hyphens=False
+        )
+    )
 
 
 def run_tui():
@@ -9,6 +9,8 @@ no activation policy switching.
 Fixed-size popover prevents horizontal teleporting on navigation.
 """
 
+import asyncio
+import ctypes
 import objc
 import os
 import math
@@ -16,9 +18,16 @@ import time
 import queue
 import threading
 import warnings
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict
+from functools import lru_cache
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 warnings.filterwarnings("ignore", message=".*ObjCPointer.*")
+# CGColor()/CALayer colour setters can warn about opaque CGColorRef
+# pointers; silence them once here instead of per call in the hot helpers.
+if hasattr(objc, "ObjCPointerWarning"):
+    warnings.simplefilter("ignore", objc.ObjCPointerWarning)
 from Foundation import (
     NSObject,
     NSTimer,
@@ -26,9 +35,11 @@ from Foundation import (
     NSRunLoopCommonModes,
     NSMakeRect,
     NSMakeSize,
-    NSAttributedString,
     NSDictionary,
     NSMutableAttributedString,
+    NSNumberFormatter,
+    NSOperationQueue,
+    NSQualityOfServiceUtility,
 )
 from AppKit import (
     NSApp,
@@ -81,10 +92,11 @@ from .config import (
     save_config,
     load_stats,
     save_stats,
-    read_log,
+    read_log_from,
     clear_log,
     append_log,
-    ping_pool,
+    ping_pool_async,
+    format_hashrate,
     validate_bitcoin_address,
     install_login_item,
     uninstall_login_item,
@@ -93,8 +105,12 @@ from .config import (
     DEFAULT_POOLS,
     APP_VERSION,
     DONATION_ADDRESS,
+    LOG_FILE,
+    LOG_TAIL_BYTES,
+    STATS_FILE,
 )
 from .engine import MiningEngine
+from .metal_miner import MetalMiner
 
 
 # ─────────────────────────────────────────────
@@ -116,6 +132,8 @@ ACCENT_GREEN = rgba(48, 209, 88)
 ACCENT_RED = rgba(255, 69, 58)
 ACCENT_ORANGE = rgba(255, 159, 10)
 BORDER_COLOR = rgba(255, 255, 255, 0.06)
+CARD_BORDER = rgba(255, 255, 255, 0.12)
+CARD_SHADOW = NSColor.blackColor()
 
 # Animation colors
 PULSE_GREEN = rgba(48, 209, 88, 0.8)
@@ -136,50 +154,208 @@ LOG_DEFAULT = rgba(180, 180, 185)
 POPOVER_WIDTH = 380
 POPOVER_HEIGHT = 600
 
+# ── Timer leeway (seconds) ──
+# Lets the OS coalesce the periodic UI ticks with other wakeups.
+_UPDATE_TIMER_TOLERANCE = 0.1
+_LOGS_TIMER_TOLERANCE = 0.5
+
+# ── Engine status -> (text colour, dot colour, animation) ──
+# Animation is "mining", "pulse", "stop" or None to leave it alone.
+_STATUS_TABLE = {
+    "Mining": (ACCENT_GREEN, ACCENT_GREEN, "mining"),
+    "Authorized": (ACCENT_GREEN, ACCENT_GREEN, None),
+    **{
+        s: (ACCENT_ORANGE, ACCENT_ORANGE, "pulse")
+        for s in (
+            "Connecting",
+            "Connected",
+            "Subscribing",
+            "Subscribed",
+            "Authorizing",
+            "Reconnecting",
+            "Starting",
+        )
+    },
+    **{
+        s: (ACCENT_RED, ACCENT_RED, "stop")
+        for s in (
+            "Auth Failed",
+            "Subscribe Failed",
+            "DNS Failed",
+            "Timeout",
+            "Refused",
+            "Error",
+            "Disconnected",
+        )
+    },
+}
+# Unknown statuses only recolour the text
+_STATUS_DEFAULT = (ACCENT_ORANGE, None, None)
+
+# ── Settings choices, in control order, with value -> index lookups ──
+_NETWORKS = ("Mainnet", "Testnet3", "Testnet4", "Signet", "Regtest")
+_NETWORK_INDEX = {n: i for i, n in enumerate(_NETWORKS)}
+_TIMEOUT_MINUTES = (5, 10, 15, 30, 60)
+_TIMEOUT_INDEX = {m: i for i, m in enumerate(_TIMEOUT_MINUTES)}
+_PERF_MODES = ("Auto", "Full Speed", "Eco Mode")
+_PERF_MODE_INDEX = {m: i for i, m in enumerate(_PERF_MODES)}
+_CPU_COUNT = os.cpu_count() or 4
+
+# Most recent sessions listed on the stats screen
+_MAX_SESSION_ROWS = 20
+
+# Pool card height, and the pitch between cards in the pools list
+_POOL_CARD_H = 52
+_POOL_ROW_H = _POOL_CARD_H + 3
+_SESSION_ROW_FMT = "{}  {:>8}  {:>5}  {:>8}".format
+
+# (threshold, format) for total hash counts, largest first
+_HASH_UNITS = (
+    (1e12, "%.2fT"),
+    (1e9, "%.2fG"),
+    (1e6, "%.2fM"),
+    (1e3, "%.2fK"),
+)
+
+# ── Worker thread QoS ──
+# Default-QoS threads can be parked on Apple Silicon efficiency cores,
+# which noticeably slows ping round-trips.
+_QOS_CLASS_USER_INITIATED = 0x19
+
+
+def _raise_thread_qos():
+    """Run first on latency-sensitive worker threads."""
+    try:
+        ctypes.CDLL(None).pthread_set_qos_class_self_np(_QOS_CLASS_USER_INITIATED, 0)
+    except (OSError, AttributeError):
+        pass
+
+
+def _run_ping_loop(loop):
+    """Thread body for the event loop that runs every pool ping."""
+    _raise_thread_qos()
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+# id(nscolor) -> (nscolor, CGColor). Holding the NSColor keeps its id from
+# being reused; only the palette constants above are passed in.
+_CGCOLOR_CACHE = {}
+
 
 def _cgcolor(nscolor):
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        return nscolor.CGColor()
+    cached = _CGCOLOR_CACHE.get(id(nscolor))
+    if cached is None:
+        cached = (nscolor, nscolor.CGColor())
+        _CGCOLOR_CACHE[id(nscolor)] = cached
+    return cached[1]
 
 
 def _set_bg(layer, nscolor):
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        layer.setBackgroundColor_(_cgcolor(nscolor))
+    layer.setBackgroundColor_(_cgcolor(nscolor))
 
 
 # ─────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def _font(size, bold=False, mono=False):
+    """Shared NSFont for (size, weight, family); labels reuse these instead
+    of looking the font up again for every widget."""
+    weight = NSFontWeightBold if bold else NSFontWeightRegular
+    if mono:
+        return NSFont.monospacedSystemFontOfSize_weight_(size, weight)
+    return NSFont.systemFontOfSize_weight_(size, weight)
+
+
+# Shown while idle, before the first sample and after mining stops
+HASHRATE_IDLE = "0.00 MH/s"
+
+# Weight of each new sample in the displayed hashrate; peak stays raw
+_HASHRATE_EMA_ALPHA = 0.2
+
+
 def make_label(text, size=13, color=None, bold=False, alignment=NSTextAlignmentLeft):
     label = NSTextField.labelWithString_(text)
-    weight = NSFontWeightBold if bold else NSFontWeightRegular
-    label.setFont_(NSFont.systemFontOfSize_weight_(size, weight))
+    label.setFont_(_font(size, bold))
     label.setTextColor_(color or TEXT_PRIMARY)
     label.setAlignment_(alignment)
-    label.setTranslatesAutoresizingMaskIntoConstraints_(False)
     label.setLineBreakMode_(NSLineBreakByTruncatingTail)
     return label
 
 
-def _make_inline_card(x, y, w, h):
-    card = NSView.alloc().initWithFrame_(NSMakeRect(x, y, w, h))
+def make_label_at(
+    text, frame, size=13, color=None, bold=False, alignment=NSTextAlignmentLeft
+):
+    """make_label plus its frame, for the common fixed-layout case."""
+    label = make_label(text, size=size, color=color, bold=bold, alignment=alignment)
+    label.setFrame_(frame)
+    return label
+
+
+def _add_label(parent, text, frame, **kwargs):
+    """make_label_at, added straight to ``parent``."""
+    label = make_label_at(text, frame, **kwargs)
+    parent.addSubview_(label)
+    return label
+
+
+class _FlippedView(NSView):
+    """Container laid out top-down, so rows keep their frames when it
+    grows or shrinks."""
+
+    def isFlipped(self):
+        return True
+
+
+class FastLayerView(NSView):
+    """Layer-backed view that never draws through drawRect:. AppKit only
+    composites its CALayer (background, border, corner radius, shadow), so
+    cards, separators and the status dot skip the backing-store redraw."""
+
+    def wantsUpdateLayer(self):
+        return True
+
+    def viewDidMoveToWindow(self):
+        _sync_rasterization_scale(self)
+
+    def viewDidChangeBackingProperties(self):
+        _sync_rasterization_scale(self)
+
+
+def _sync_rasterization_scale(view):
+    """Keep a rasterized layer's bitmap at the backing scale of the window
+    it is shown in, so it stays sharp when moved between displays."""
+    layer = view.layer()
+    window = view.window()
+    if layer is not None and window is not None and layer.shouldRasterize():
+        layer.setRasterizationScale_(window.backingScaleFactor())
+
+
+def _make_inline_card(x, y, w, h, rasterize=False):
+    card = FastLayerView.alloc().initWithFrame_(NSMakeRect(x, y, w, h))
     card.setWantsLayer_(True)
-    _set_bg(card.layer(), BG_CARD)
-    card.layer().setCornerRadius_(16)
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        card.layer().setBorderColor_(_cgcolor(rgba(255, 255, 255, 0.12)))
-    card.layer().setBorderWidth_(0.5)
-    card.layer().setShadowOffset_((0, -1))
-    card.layer().setShadowRadius_(4)
-    card.layer().setShadowOpacity_(0.15)
+    layer = card.layer()
+    _set_bg(layer, BG_CARD)
+    layer.setCornerRadius_(16)
+    layer.setBorderColor_(_cgcolor(CARD_BORDER))
+    layer.setBorderWidth_(0.5)
+    layer.setShadowOffset_((0, -1))
+    layer.setShadowRadius_(4)
+    layer.setShadowOpacity_(0.15)
+    if rasterize:
+        # Display-only cards let Core Animation composite a cached bitmap
+        # instead of re-blending border, shadow and children. Cards with
+        # controls stay live so editing and focus rings redraw normally.
+        layer.setShouldRasterize_(True)
+        _sync_rasterization_scale(card)
     return card
 
 
 def make_separator_at(y, width, inset=15):
-    sep = NSView.alloc().initWithFrame_(NSMakeRect(inset, y, width - inset * 2, 1))
+    sep = FastLayerView.alloc().initWithFrame_(
+        NSMakeRect(inset, y, width - inset * 2, 1)
+    )
     sep.setWantsLayer_(True)
     _set_bg(sep.layer(), BORDER_COLOR)
     return sep
@@ -198,65 +374,90 @@ def make_blue_button(title, frame):
 # ─────────────────────────────────────────────
 # Core Animation helpers (ambient effects)
 # ─────────────────────────────────────────────
-def _add_pulse_animation(layer, color_from, color_to, duration=2.0, key="pulse"):
-    """Add a repeating opacity pulse to a layer using Core Animation."""
-    if not QUARTZ_AVAILABLE:
-        return
-    try:
+if QUARTZ_AVAILABLE:
+    # Core Animation copies an animation when it is added to a layer, so one
+    # configured instance per (kind, parameters) can be shared by every layer.
+    @lru_cache(maxsize=None)
+    def _ease_in_out():
+        return Quartz.CAMediaTimingFunction.functionWithName_(
+            Quartz.kCAMediaTimingFunctionEaseInEaseOut
+        )
+
+    @lru_cache(maxsize=None)
+    def _pulse_animation(duration):
         anim = Quartz.CABasicAnimation.animationWithKeyPath_("opacity")
         anim.setFromValue_(1.0)
         anim.setToValue_(0.3)
         anim.setDuration_(duration)
         anim.setAutoreverses_(True)
         anim.setRepeatCount_(float("inf"))
-        anim.setTimingFunction_(
-            Quartz.CAMediaTimingFunction.functionWithName_(
-                Quartz.kCAMediaTimingFunctionEaseInEaseOut
-            )
-        )
-        layer.addAnimation_forKey_(anim, key)
-    except Exception:
-        pass
+        anim.setTimingFunction_(_ease_in_out())
+        return anim
 
-
-def _add_glow_animation(layer, duration=3.0, key="glow"):
-    """Add a soft shadow glow pulse."""
-    if not QUARTZ_AVAILABLE:
-        return
-    try:
+    @lru_cache(maxsize=None)
+    def _glow_animation(duration):
         anim = Quartz.CABasicAnimation.animationWithKeyPath_("shadowOpacity")
         anim.setFromValue_(0.0)
         anim.setToValue_(0.5)
         anim.setDuration_(duration)
         anim.setAutoreverses_(True)
         anim.setRepeatCount_(float("inf"))
-        anim.setTimingFunction_(
-            Quartz.CAMediaTimingFunction.functionWithName_(
-                Quartz.kCAMediaTimingFunctionEaseInEaseOut
-            )
-        )
-        layer.addAnimation_forKey_(anim, key)
-    except Exception:
-        pass
+        anim.setTimingFunction_(_ease_in_out())
+        return anim
 
-
-def _add_shimmer_animation(layer, width, duration=4.0, key="shimmer"):
-    """Add a horizontal shimmer sweep across a card layer."""
-    if not QUARTZ_AVAILABLE:
-        return
-    try:
+    @lru_cache(maxsize=None)
+    def _shimmer_animation(width, duration):
         anim = Quartz.CABasicAnimation.animationWithKeyPath_("position.x")
         anim.setFromValue_(-width * 0.3)
         anim.setToValue_(width * 1.3)
         anim.setDuration_(duration)
         anim.setRepeatCount_(float("inf"))
-        anim.setTimingFunction_(
-            Quartz.CAMediaTimingFunction.functionWithName_(
-                Quartz.kCAMediaTimingFunctionEaseInEaseOut
-            )
-        )
-        layer.addAnimation_forKey_(anim, key)
-    except Exception:
+        anim.setTimingFunction_(_ease_in_out())
+        return anim
+
+    def _add_pulse_animation(layer, color_from, color_to, duration=2.0, key="pulse"):
+        """Add a repeating opacity pulse to a layer using Core Animation."""
+        try:
+            layer.addAnimation_forKey_(_pulse_animation(duration), key)
+        except Exception:
+            pass
+
+    def _add_glow_animation(layer, duration=3.0, key="glow"):
+        """Add a soft shadow glow pulse."""
+        try:
+            layer.addAnimation_forKey_(_glow_animation(duration), key)
+        except Exception:
+            pass
+
+    def _add_shimmer_animation(layer, width, duration=4.0, key="shimmer"):
+        """Add a horizontal shimmer sweep across a card layer."""
+        try:
+            layer.addAnimation_forKey_(_shimmer_animation(width, duration), key)
+        except Exception:
+            pass
+
+    @contextmanager
+    def _layer_batch():
+        """Commit every layer change made inside the block in one Core
+        Animation transaction, with implicit animations off."""
+        Quartz.CATransaction.begin()
+        Quartz.CATransaction.setDisableActions_(True)
+        try:
+            yield
+        finally:
+            Quartz.CATransaction.commit()
+
+else:
+    _layer_batch = nullcontext
+
+    # No Quartz: ambient animations are purely cosmetic, so skip them
+    def _add_pulse_animation(layer, color_from, color_to, duration=2.0, key="pulse"):
+        pass
+
+    def _add_glow_animation(layer, duration=3.0, key="glow"):
+        pass
+
+    def _add_shimmer_animation(layer, width, duration=4.0, key="shimmer"):
         pass
 
 
@@ -270,74 +471,69 @@ def _remove_animation(layer, key="pulse"):
 # ─────────────────────────────────────────────
 # Color-coded log attributed string builder
 # ─────────────────────────────────────────────
-def _build_log_attributed_string(log_text):
-    mono_font = NSFont.monospacedSystemFontOfSize_weight_(11, NSFontWeightRegular)
-    mono_bold = NSFont.monospacedSystemFontOfSize_weight_(11, NSFontWeightBold)
+_LOG_FONT = _font(11, mono=True)
+_LOG_FONT_BOLD = _font(11, bold=True, mono=True)
 
-    result = NSMutableAttributedString.alloc().init()
 
-    if not log_text:
-        attrs = NSDictionary.dictionaryWithObjects_forKeys_(
-            [LOG_DEFAULT, mono_font],
-            [NSForegroundColorAttributeName, "NSFont"],
-        )
-        placeholder = NSAttributedString.alloc().initWithString_attributes_(
-            "No log entries yet.", attrs
-        )
-        result.appendAttributedString_(placeholder)
-        return result
-
-    lines = log_text.split("\n")
-    for i, line in enumerate(lines):
-        if i > 0:
-            newline_attrs = NSDictionary.dictionaryWithObjects_forKeys_(
-                [LOG_DEFAULT, mono_font],
-                [NSForegroundColorAttributeName, "NSFont"],
-            )
-            nl = NSAttributedString.alloc().initWithString_attributes_(
-                "\n", newline_attrs
-            )
-            result.appendAttributedString_(nl)
+def _log_attrs(color, font=_LOG_FONT):
+    return NSDictionary.dictionaryWithObjects_forKeys_(
+        [color, font],
+        [NSForegroundColorAttributeName, "NSFont"],
+    )
 
-        if not line:
-            continue
 
-        line_upper = line.upper()
+_LOG_ATTRS = {
+    "share": _log_attrs(LOG_BRIGHT_GREEN, _LOG_FONT_BOLD),
+    "err": _log_attrs(LOG_RED),
+    "ok": _log_attrs(LOG_GREEN),
+    "stratum": _log_attrs(LOG_BLUE),
+    "engine": _log_attrs(LOG_CYAN),
+    None: _log_attrs(LOG_DEFAULT),
+}
+
+
+def _log_line_attrs(line):
+    # First match wins, so "[STRATUM] ... accepted" is still green. A plain
+    # upper() + substring chain beats a regex here by an order of magnitude.
+    u = line.upper()
+    if "SHARE FOUND" in u:
+        return _LOG_ATTRS["share"]
+    if "ERROR" in u or "REJECTED" in u or "FAILED" in u:
+        return _LOG_ATTRS["err"]
+    if "ACCEPTED" in u or "SUCCESSFUL" in u or "AUTHORIZED" in u:
+        return _LOG_ATTRS["ok"]
+    if "[STRATUM" in u:
+        return _LOG_ATTRS["stratum"]
+    if "[ENGINE" in u:
+        return _LOG_ATTRS["engine"]
+    return _LOG_ATTRS[None]
 
-        if "SHARE FOUND" in line_upper:
-            color = LOG_BRIGHT_GREEN
-            font = mono_bold
-        elif (
-            "ERROR" in line_upper or "REJECTED" in line_upper or "FAILED" in line_upper
-        ):
-            color = LOG_RED
-            font = mono_font
-        elif (
-            "ACCEPTED" in line_upper
-            or "SUCCESSFUL" in line_upper
-            or "AUTHORIZED" in line_upper
-        ):
-            color = LOG_GREEN
-            font = mono_font
-        elif "[STRATUM" in line_upper:
-            color = LOG_BLUE
-            font = mono_font
-        elif "[ENGINE" in line_upper:
-            color = LOG_CYAN
-            font = mono_font
-        else:
-            color = LOG_DEFAULT
-            font = mono_font
 
-        attrs = NSDictionary.dictionaryWithObjects_forKeys_(
-            [color, font],
-            [NSForegroundColorAttributeName, "NSFont"],
-        )
-        attributed_line = NSAttributedString.alloc().initWithString_attributes_(
-            line, attrs
+def _build_log_attributed_string(log_text):
+    default_attrs = _LOG_ATTRS[None]
+
+    if not log_text:
+        return NSMutableAttributedString.alloc().initWithString_attributes_(
+            "No log entries yet.", default_attrs
         )
-        result.appendAttributedString_(attributed_line)
 
+    # One string in the default style, then restyle only the classified
+    # lines in place. Ranges are UTF-16 offsets, which match str offsets
+    # for ASCII text.
+    result = NSMutableAttributedString.alloc().initWithString_attributes_(
+        log_text, default_attrs
+    )
+    utf16 = not log_text.isascii()
+    pos = 0
+    result.beginEditing()
+    for line in log_text.split("\n"):
+        n = len(line.encode("utf-16-le")) // 2 if utf16 else len(line)
+        if n:
+            attrs = _log_line_attrs(line)
+            if attrs is not default_attrs:
+                result.setAttributes_range_(attrs, (pos, n))
+        pos += n + 1
+    result.endEditing()
     return result
 
 
@@ -345,6 +541,54 @@ def _build_log_attributed_string(log_text):
 # PopoverViewController - single VC with navigation
 # ─────────────────────────────────────────────
 class PopoverViewController(NSViewController):
+    # Main-thread hops from worker threads; AppKit takes the selector by name
+    _SEL_HASHRATE_SAMPLED = "hashrateSampled:"
+    _SEL_BENCH_DONE = "_benchDone:"
+    _SEL_PING_DONE = "_pingDone:"
+    _SEL_FLUSH_CONFIG = "_flushConfigTimer:"
+
+    # Control and timer actions, by name as well
+    _SEL_NAVIGATE_BACK = "navigateBack:"
+    _SEL_AUTO_REFRESH_LOGS = "_autoRefreshLogs:"
+    _SEL_PERF_MODE_CHANGED = "perfModeChanged:"
+    _SEL_TOGGLE_MINING = "toggleMining:"
+    _SEL_OPEN_SETTINGS = "openSettings:"
+    _SEL_OPEN_STATS = "openStats:"
+    _SEL_RUN_BENCHMARK = "runBenchmark:"
+    _SEL_OPEN_LOGS = "openLogs:"
+    _SEL_QUIT_APP = "quitApp:"
+    _SEL_UPDATE_STATS = "updateStats:"
+    _SEL_SETTINGS_TAB_CHANGED = "settingsTabChanged:"
+    _SEL_CLEAR_LOG_ACTION = "clearLogAction:"
+    _SEL_SAVE_GENERAL_CONFIG = "saveGeneralConfig:"
+    _SEL_POOL_TOGGLED = "poolToggled:"
+    _SEL_PING_POOL = "pingPool:"
+    _SEL_SET_ACTIVE_POOL = "setActivePool:"
+    _SEL_DELETE_POOL = "deletePool:"
+    _SEL_ADD_POOL = "addPool:"
+    _SEL_RESET_POOLS = "resetPools:"
+    _SEL_SAVE_POOLS = "savePools:"
+    _SEL_SAVE_MINING_CONFIG = "saveMiningConfig:"
+    _SEL_STATS_TAB_CHANGED = "statsTabChanged:"
+    _SEL_REFRESH_LOGS_ACTION = "refreshLogsAction:"
+    _SEL_CLEAR_LOGS_ACTION = "clearLogsAction:"
+
+    # Settings inputs whose edits only reach the config on Save, with the
+    # getter that reads the value they currently show
+    _SETTINGS_INPUTS = (
+        ("_login_toggle", "state"),
+        ("_restart_toggle", "state"),
+        ("_timeout_popup", "indexOfSelectedItem"),
+        ("_new_pool_name", "stringValue"),
+        ("_new_pool_host", "stringValue"),
+        ("_new_pool_port", "stringValue"),
+        ("_network_seg", "selectedSegment"),
+        ("_worker_field", "stringValue"),
+        ("_address_field", "stringValue"),
+        ("_gpu_threads_popup", "indexOfSelectedItem"),
+        ("_cpu_threads_popup", "indexOfSelectedItem"),
+    )
+
     def init(self):
         self = objc.super(PopoverViewController, self).init()
         if self is None:
@@ -352,6 +596,43 @@ class PopoverViewController(NSViewController):
         self._engine = None
         self._config = None
         self._update_timer = None
+        self._popover_visible = False
+        self._hashrate_pending = False  # a sample is queued for the main thread
+        self._ema_hashrate = None  # smoothed rate shown to the user
+        self._menu_bar_button = None  # status item button, resolved on first use
+        self._menu_title = None
+
+        self._view_loaded = False
+
+        # Widgets read by handlers, declared up front so the handlers can
+        # test for None instead of probing with hasattr
+        self._hashrate_val = None
+        self._gpu_val = None
+        self._pool_val = None
+        self._network_val = None
+        self._algo_val = None
+        self._mode_val = None
+        self._shares_val = None
+        self._diff_val = None
+        self._uptime_val = None
+        self._best_share_val = None
+        self._peak_val = None
+        self._jobs_val = None
+        self._threads_badge = None
+        self._perf_seg = None
+        self._login_status_label = None
+        self._network_seg = None
+        self._worker_field = None
+        self._address_field = None
+        self._addr_valid_label = None
+        self._gpu_threads_popup = None
+        self._cpu_threads_popup = None
+        self._login_toggle = None
+        self._restart_toggle = None
+        self._timeout_popup = None
+        self._new_pool_name = None
+        self._new_pool_host = None
+        self._new_pool_port = None
 
         # Navigation state
         self._current_screen = "dashboard"
@@ -365,26 +646,71 @@ class PopoverViewController(NSViewController):
         self._settings_view = None
         self._stats_view = None
         self._logs_view = None
+        # What each cached view was built from; a mismatch forces a rebuild
+        self._settings_built_from = None  # asdict() of the config
+        self._settings_inputs_shown = {}  # input values as each tab was built
+        self._stats_built_from = None  # stats file mtime last shown
+        # Stats tabs, built on first selection like the settings tabs, and
+        # the labels _refresh_stats refills in place
+        self._stats_tab_views = None
+        self._stats_tab_builders = None
+        self._stats_tab_container = None
+        self._stat_value_labels = []
+        self._session_row_labels = []
+        self._sessions_header = None
+        self._sessions_empty_label = None
+        self._blocks_empty_label = None
 
         # Settings sub-state
         self._settings_tab_views = None
+        self._settings_tab_builders = None
         self._settings_tab_seg = None
+        self._settings_tab_container = None
+        self._pool_list_view = None  # pool cards, swapped on add/delete
+        self._pool_add_view = None  # add form below the list
+        self._active_pool_card = None  # index of the highlighted pool card
 
-        # Logs refresh timer
+        # Pool edits mark the config dirty and are written once, shortly
+        # after the last edit (see _schedule_config_save)
+        self._config_dirty = False
+        self._save_timer = None
+
+        # Logs refresh timer and incremental read state
         self._logs_refresh_timer = None
+        self._logs_text_view = None
+        self._log_file_pos = 0  # byte offset already shown in the view
+        self._log_file_ino = None  # detects a cleared/replaced log file
+        self._log_stamp = None  # (ino, size, mtime) seen at the last sync
+        self._log_placeholder = False  # view shows a placeholder, not log lines
 
         # Animation state
-        self._status_dot = None
+        self._status_dot_layer = None
         self._hashrate_card = None
         self._is_mining_animated = False
 
-        # Thread-safe queue for ping results
+        # Last text written to each dashboard label (see _set_text), plus
+        # the raw values behind the labels that are costly to re-format
+        self._label_text = {}
+        self._label_color = {}  # label -> palette NSColor last applied
+        self._dot_color = None
+        self._btn_state = None  # True/False once the start/stop button is styled
+        self._last_uptime_secs = -1
+        self._last_peak = -1.0
+        self._last_status = None
+
+        # Pings run concurrently on one event loop thread, started on first
+        # use, and report through this queue
+        self._ping_loop = None
         self._ping_queue = queue.Queue()
 
+        # Serial utility-QoS queue so benchmarks don't contend with mining
+        self._bench_queue = None
+
         return self
 
     def setEngine_(self, engine):
         self._engine = engine
+        engine.on_hashrate_sample = self._on_hashrate_sample
 
     def setConfig_(self, config):
         self._config = config
@@ -398,7 +724,7 @@ class PopoverViewController(NSViewController):
 
         # ── Navigation bar (hidden on dashboard) ──
         nav_h = 36
-        self._nav_bar = NSView.alloc().initWithFrame_(
+        self._nav_bar = FastLayerView.alloc().initWithFrame_(
             NSMakeRect(0, h - nav_h, w, nav_h)
         )
         self._nav_bar.setWantsLayer_(True)
@@ -408,17 +734,17 @@ class PopoverViewController(NSViewController):
         self._nav_back_btn.setTitle_("Back")
         self._nav_back_btn.setBezelStyle_(_BezelStyle)
         self._nav_back_btn.setTarget_(self)
-        self._nav_back_btn.setAction_(
-            objc.selector(self.navigateBack_, signature=b"v@:@")
-        )
+        self._nav_back_btn.setAction_(self._SEL_NAVIGATE_BACK)
         self._nav_bar.addSubview_(self._nav_back_btn)
 
-        self._nav_title = make_label(
-            "", size=14, bold=True, alignment=NSTextAlignmentCenter
+        self._nav_title = _add_label(
+            self._nav_bar,
+            "",
+            NSMakeRect(70, 6, w - 140, 22),
+            size=14,
+            bold=True,
+            alignment=NSTextAlignmentCenter,
         )
-        self._nav_title.setFrame_(NSMakeRect(70, 6, w - 140, 22))
-        self._nav_title.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        self._nav_bar.addSubview_(self._nav_title)
 
         self._nav_bar.setHidden_(True)
 
@@ -434,13 +760,34 @@ class PopoverViewController(NSViewController):
         root.addSubview_(self._content_container)
 
         # Build and show dashboard (built at content_h, dashboard scrolls within)
-        self._dashboard_view = self._build_dashboard(w, content_h)
+        with _layer_batch():
+            self._dashboard_view = self._build_dashboard(w, content_h)
         self._content_container.addSubview_(self._dashboard_view)
 
         self._apply_config()
 
         self._view_loaded = True
+
+    # ── Visibility: only tick while something is on screen ──
+    def viewWillAppear(self):
+        objc.super(PopoverViewController, self).viewWillAppear()
+        self._popover_visible = True
         self.startUpdateTimer()
+        self.updateStats_(None)
+
+    def viewDidDisappear(self):
+        objc.super(PopoverViewController, self).viewDidDisappear()
+        self._popover_visible = False
+        if self._logs_refresh_timer:
+            self._logs_refresh_timer.invalidate()
+            self._logs_refresh_timer = None
+        # The menu bar title is driven by hashrate samples, not the tick
+        self.stopUpdateTimer()
+        # Nobody sees the pulse or glow while closed; the first tick after
+        # reopening restarts them from the current status
+        self._stop_mining_animations()
+        self._last_status = None
+        self._flush_config_save()
 
     # ── Navigation (fixed-size, no popover resize, no frame changes) ──
     def _navigate_to(self, screen_name):
@@ -461,7 +808,9 @@ class PopoverViewController(NSViewController):
         if screen_name == "dashboard":
             self._nav_bar.setHidden_(True)
             # Dashboard uses same content_h as other views
-            self._dashboard_view = self._build_dashboard(w, content_h)
+            if self._dashboard_view is None:
+                with _layer_batch():
+                    self._dashboard_view = self._build_dashboard(w, content_h)
             self._content_container.addSubview_(self._dashboard_view)
             self._apply_config()
         else:
@@ -475,27 +824,64 @@ class PopoverViewController(NSViewController):
             self._nav_title.setStringValue_(titles.get(screen_name, ""))
 
             if screen_name == "settings":
+                # Reuse the built view unless the saved config changed, or the
+                # working copy or the controls hold unsaved edits, which
+                # leaving settings discards.
+                stale = (
+                    self._config is None
+                    or asdict(self._config) != self._settings_built_from
+                    or self._settings_input_values() != self._settings_inputs_shown
+                )
+                self._flush_config_save()
                 self._config = load_config()
-                self._settings_view = self._build_settings(w, content_h)
+                snapshot = asdict(self._config)
+                if (
+                    self._settings_view is None
+                    or stale
+                    or snapshot != self._settings_built_from
+                ):
+                    with _layer_batch():
+                        self._settings_view = self._build_settings(w, content_h)
+                    self._settings_built_from = snapshot
                 self._content_container.addSubview_(self._settings_view)
             elif screen_name == "stats":
-                self._stats_view = self._build_stats(w, content_h)
+                try:
+                    stats_mtime = os.stat(STATS_FILE).st_mtime_ns
+                except OSError:
+                    stats_mtime = None
+                if self._stats_view is None:
+                    with _layer_batch():
+                        self._stats_view = self._build_stats(w, content_h)
+                    self._stats_built_from = stats_mtime
+                elif stats_mtime != self._stats_built_from:
+                    self._refresh_stats()
+                    self._stats_built_from = stats_mtime
                 self._content_container.addSubview_(self._stats_view)
             elif screen_name == "logs":
-                self._logs_view = self._build_logs(w, content_h)
+                if self._logs_view is None:
+                    with _layer_batch():
+                        self._logs_view = self._build_logs(w, content_h)
+                else:
+                    self._sync_log_view()
                 self._content_container.addSubview_(self._logs_view)
-                self._logs_refresh_timer = (
-                    NSTimer.timerWithTimeInterval_target_selector_userInfo_repeats_(
-                        2.0,
-                        self,
-                        objc.selector(self._autoRefreshLogs_, signature=b"v@:@"),
-                        None,
-                        True,
-                    )
-                )
-                NSRunLoop.currentRunLoop().addTimer_forMode_(
-                    self._logs_refresh_timer, NSRunLoopCommonModes
-                )
+                self._start_logs_timer()
+
+    def _start_logs_timer(self):
+        if self._logs_refresh_timer:
+            self._logs_refresh_timer.invalidate()
+        self._logs_refresh_timer = (
+            NSTimer.timerWithTimeInterval_target_selector_userInfo_repeats_(
+                2.0,
+                self,
+                self._SEL_AUTO_REFRESH_LOGS,
+                None,
+                True,
+            )
+        )
+        self._logs_refresh_timer.setTolerance_(_LOGS_TIMER_TOLERANCE)
+        NSRunLoop.currentRunLoop().addTimer_forMode_(
+            self._logs_refresh_timer, NSRunLoopCommonModes
+        )
 
     @objc.typedSelector(b"v@:@")
     def navigateBack_(self, sender):
@@ -506,13 +892,65 @@ class PopoverViewController(NSViewController):
         if self._current_screen != "logs":
             timer.invalidate()
             return
-        if hasattr(self, "_logs_text_view") and self._logs_text_view:
-            log_text = read_log() or ""
-            attr_str = _build_log_attributed_string(log_text)
-            ts = self._logs_text_view.textStorage()
-            ts.setAttributedString_(attr_str)
-            length = self._logs_text_view.string().length()
-            self._logs_text_view.scrollRangeToVisible_((length, 0))
+        if not self._popover_visible:
+            return  # caught up incrementally when the popover reopens
+        self._sync_log_view()
+
+    def _sync_log_view(self, force=False):
+        """Append log lines written since the last sync to the logs view.
+        The log's tail is only re-read when the file was cleared or replaced."""
+        tv = self._logs_text_view
+        if not tv:
+            return
+        try:
+            st = os.stat(LOG_FILE)
+            stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+        except OSError:
+            st = stamp = None
+        if stamp == self._log_stamp and not force:
+            return
+        self._log_stamp = stamp
+
+        if (
+            st is None
+            or st.st_ino != self._log_file_ino
+            or st.st_size < self._log_file_pos
+        ):
+            self._log_file_ino = st.st_ino if st else None
+            # Load only the last LOG_TAIL_BYTES, starting at a full line
+            start = max(0, st.st_size - LOG_TAIL_BYTES) if st else 0
+            text, self._log_file_pos = read_log_from(start)
+            if start:
+                text = text[text.find("\n") + 1 :]
+            ts = tv.textStorage()
+            ts.beginEditing()
+            ts.setAttributedString_(_build_log_attributed_string(text))
+            ts.endEditing()
+            self._log_placeholder = not text
+            tv.scrollRangeToVisible_((tv.string().length(), 0))
+            return
+        text, self._log_file_pos = read_log_from(self._log_file_pos)
+        if text:
+            # One edit transaction: layout is invalidated once for the new range
+            ts = tv.textStorage()
+            ts.beginEditing()
+            if self._log_placeholder:
+                # The first real lines replace the placeholder text
+                ts.setAttributedString_(_build_log_attributed_string(text))
+                self._log_placeholder = False
+            else:
+                ts.appendAttributedString_(_build_log_attributed_string(text))
+            # Appends would otherwise grow the view for as long as mining
+            # runs; once it doubles the tail size, drop whole lines off the top
+            length = ts.length()
+            if length > 2 * LOG_TAIL_BYTES:
+                excess = length - LOG_TAIL_BYTES
+                nl = ts.string().rangeOfString_options_range_(
+                    "\n", 0, (excess, length - excess)
+                )[0]
+                ts.deleteCharactersInRange_((0, nl + 1 if nl < length else excess))
+            ts.endEditing()
+            tv.scrollRangeToVisible_((tv.string().length(), 0))
 
     # ── Dashboard builder ──
     def _build_dashboard(self, width, height):
@@ -521,26 +959,35 @@ class PopoverViewController(NSViewController):
 
         # ── Header: SoloMiner title + animated status dot + status text ──
         y -= 30
-        title = make_label("SoloMiner", size=16, bold=True)
-        title.setFrame_(NSMakeRect(15, y, 150, 22))
-        title.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(title)
+        _add_label(view, "SoloMiner", NSMakeRect(15, y, 150, 22), size=16, bold=True)
 
-        # Status dot (animated pulse when mining)
+        # Status dot (animated pulse when mining): a small layer-hosting
+        # view, so the pulse runs on a layer we own rather than one AppKit
+        # manages for the parent view
         dot_size = 8
-        self._status_dot = NSView.alloc().initWithFrame_(
-            NSMakeRect(width - 140, y + 7, dot_size, dot_size)
+        dot_frame = NSMakeRect(width - 140, y + 7, dot_size, dot_size)
+        if QUARTZ_AVAILABLE:
+            dot_view = NSView.alloc().initWithFrame_(dot_frame)
+            # setLayer_ before setWantsLayer_ makes the view layer-hosting
+            dot_view.setLayer_(Quartz.CALayer.layer())
+            dot_view.setWantsLayer_(True)
+        else:
+            dot_view = FastLayerView.alloc().initWithFrame_(dot_frame)
+            dot_view.setWantsLayer_(True)
+        view.addSubview_(dot_view)
+        dot_layer = dot_view.layer()
+        dot_layer.setCornerRadius_(dot_size / 2)
+        self._status_dot_layer = dot_layer
+        self._set_dot_color(TEXT_SECONDARY)
+
+        self._auth_label = _add_label(
+            view,
+            "Idle",
+            NSMakeRect(width - 128, y + 2, 115, 18),
+            size=11,
+            color=TEXT_SECONDARY,
+            alignment=NSTextAlignmentRight,
         )
-        self._status_dot.setWantsLayer_(True)
-        _set_bg(self._status_dot.layer(), TEXT_SECONDARY)
-        self._status_dot.layer().setCornerRadius_(dot_size / 2)
-        view.addSubview_(self._status_dot)
-
-        self._auth_label = make_label("Idle", size=11, color=TEXT_SECONDARY)
-        self._auth_label.setFrame_(NSMakeRect(width - 128, y + 2, 115, 18))
-        self._auth_label.setAlignment_(NSTextAlignmentRight)
-        self._auth_label.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(self._auth_label)
 
         # ── Separator ──
         y -= 12
@@ -554,22 +1001,31 @@ class PopoverViewController(NSViewController):
         self._hashrate_card.layer().setCornerRadius_(14)
         view.addSubview_(self._hashrate_card)
 
-        hr_label = make_label("Hash Rate", size=10, color=TEXT_SECONDARY)
-        hr_label.setFrame_(NSMakeRect(14, 30, 80, 16))
-        hr_label.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        self._hashrate_card.addSubview_(hr_label)
+        _add_label(
+            self._hashrate_card,
+            "Hash Rate",
+            NSMakeRect(14, 30, 80, 16),
+            size=10,
+            color=TEXT_SECONDARY,
+        )
 
-        self._hashrate_val = make_label("0.00 MH/s", size=20, bold=True)
-        self._hashrate_val.setFrame_(NSMakeRect(14, 4, width - 60, 28))
-        self._hashrate_val.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        self._hashrate_card.addSubview_(self._hashrate_val)
+        self._hashrate_val = _add_label(
+            self._hashrate_card,
+            HASHRATE_IDLE,
+            NSMakeRect(14, 4, width - 60, 28),
+            size=20,
+            bold=True,
+        )
 
         # Thread count badge (right side of hashrate card)
-        self._threads_badge = make_label("--", size=9, color=TEXT_SECONDARY)
-        self._threads_badge.setFrame_(NSMakeRect(width - 90, 32, 45, 14))
-        self._threads_badge.setAlignment_(NSTextAlignmentRight)
-        self._threads_badge.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        self._hashrate_card.addSubview_(self._threads_badge)
+        self._threads_badge = _add_label(
+            self._hashrate_card,
+            "--",
+            NSMakeRect(width - 90, 32, 45, 14),
+            size=9,
+            color=TEXT_SECONDARY,
+            alignment=NSTextAlignmentRight,
+        )
 
         # ── Separator ──
         y -= 8
@@ -587,17 +1043,20 @@ class PopoverViewController(NSViewController):
             ("Uptime", "_uptime_val", "0m 0s"),
         ]
         y -= 4
-        for label_text, attr_name, default_val in stats_info:
-            y -= row_height
-            lbl = make_label(label_text, size=11, color=TEXT_SECONDARY)
-            lbl.setFrame_(NSMakeRect(20, y, 90, 18))
-            lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            view.addSubview_(lbl)
-
-            val = make_label(default_val, size=11, bold=True)
-            val.setFrame_(NSMakeRect(115, y, width - 135, 18))
-            val.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            view.addSubview_(val)
+        row_ys = [y - row_height * (i + 1) for i in range(len(stats_info))]
+        y = row_ys[-1]
+        val_w = width - 135
+        for (label_text, attr_name, default_val), ry in zip(stats_info, row_ys):
+            _add_label(
+                view,
+                label_text,
+                NSMakeRect(20, ry, 90, 18),
+                size=11,
+                color=TEXT_SECONDARY,
+            )
+            val = _add_label(
+                view, default_val, NSMakeRect(115, ry, val_w, 18), size=11, bold=True
+            )
             setattr(self, attr_name, val)
 
         # ── Separator ──
@@ -608,28 +1067,42 @@ class PopoverViewController(NSViewController):
         y -= 4
         card_h = 88
         y -= card_h
-        detail_card = _make_inline_card(15, y, width - 30, card_h)
+        detail_card = _make_inline_card(15, y, width - 30, card_h, rasterize=True)
         view.addSubview_(detail_card)
 
         extra_rows = [
             ("GPU", "_gpu_val", "---"),
             ("Best Share", "_best_share_val", "0 bits"),
-            ("Peak Rate", "_peak_val", "0.00 MH/s"),
+            ("Peak Rate", "_peak_val", HASHRATE_IDLE),
             ("Jobs", "_jobs_val", "0"),
         ]
-        ey = card_h - 4
-        for label_text, attr_name, default_val in extra_rows:
-            ey -= 19
-            lbl = make_label(label_text, size=10, color=TEXT_SECONDARY)
-            lbl.setFrame_(NSMakeRect(12, ey, 80, 16))
-            lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            detail_card.addSubview_(lbl)
-
-            val = make_label(default_val, size=10, bold=True)
-            val.setFrame_(NSMakeRect(95, ey, width - 135, 16))
-            val.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            detail_card.addSubview_(val)
+        extra_fields = []
+        for i, (label_text, attr_name, default_val) in enumerate(extra_rows):
+            ey = card_h - 4 - 19 * (i + 1)
+            _add_label(
+                detail_card,
+                label_text,
+                NSMakeRect(12, ey, 80, 16),
+                size=10,
+                color=TEXT_SECONDARY,
+            )
+            val = _add_label(
+                detail_card,
+                default_val,
+                NSMakeRect(95, ey, val_w, 16),
+                size=10,
+                bold=True,
+            )
             setattr(self, attr_name, val)
+            extra_fields.append((val, default_val))
+
+        # What the idle tick resets, bound once so the tick needn't look
+        # each field up
+        self._idle_fields = (
+            (self._hashrate_val, HASHRATE_IDLE),
+            (self._uptime_val, "0m 0s"),
+            (self._threads_badge, "--"),
+        ) + tuple(extra_fields)
 
         # ── Separator ──
         y -= 8
@@ -637,10 +1110,13 @@ class PopoverViewController(NSViewController):
 
         # ── Performance Mode ──
         y -= 20
-        perf_label = make_label("Performance Mode", size=10, color=TEXT_SECONDARY)
-        perf_label.setFrame_(NSMakeRect(15, y, 150, 16))
-        perf_label.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(perf_label)
+        _add_label(
+            view,
+            "Performance Mode",
+            NSMakeRect(15, y, 150, 16),
+            size=10,
+            color=TEXT_SECONDARY,
+        )
 
         y -= 30
         self._perf_seg = NSSegmentedControl.alloc().initWithFrame_(
@@ -652,9 +1128,7 @@ class PopoverViewController(NSViewController):
         self._perf_seg.setLabel_forSegment_("Eco Mode", 2)
         self._perf_seg.setSelectedSegment_(1)
         self._perf_seg.setTarget_(self)
-        self._perf_seg.setAction_(
-            objc.selector(self.perfModeChanged_, signature=b"v@:@")
-        )
+        self._perf_seg.setAction_(self._SEL_PERF_MODE_CHANGED)
         view.addSubview_(self._perf_seg)
 
         # ── Separator ──
@@ -666,15 +1140,11 @@ class PopoverViewController(NSViewController):
         self._start_stop_btn = NSButton.alloc().initWithFrame_(
             NSMakeRect(15, y, 80, 28)
         )
-        self._start_stop_btn.setTitle_("Start")
         self._start_stop_btn.setBezelStyle_(_BezelStyle)
         self._start_stop_btn.setTarget_(self)
-        self._start_stop_btn.setAction_(
-            objc.selector(self.toggleMining_, signature=b"v@:@")
-        )
+        self._start_stop_btn.setAction_(self._SEL_TOGGLE_MINING)
         self._start_stop_btn.setWantsLayer_(True)
-        if hasattr(self._start_stop_btn, "setBezelColor_"):
-            self._start_stop_btn.setBezelColor_(ACCENT_GREEN)
+        self._set_btn_state(False)
         view.addSubview_(self._start_stop_btn)
 
         settings_btn = NSButton.alloc().initWithFrame_(
@@ -683,14 +1153,14 @@ class PopoverViewController(NSViewController):
         settings_btn.setBezelStyle_(_BezelStyle)
         settings_btn.setTitle_("Settings")
         settings_btn.setTarget_(self)
-        settings_btn.setAction_(objc.selector(self.openSettings_, signature=b"v@:@"))
+        settings_btn.setAction_(self._SEL_OPEN_SETTINGS)
         view.addSubview_(settings_btn)
 
         stats_btn = NSButton.alloc().initWithFrame_(NSMakeRect(width - 155, y, 58, 28))
         stats_btn.setBezelStyle_(_BezelStyle)
         stats_btn.setTitle_("Stats")
         stats_btn.setTarget_(self)
-        stats_btn.setAction_(objc.selector(self.openStats_, signature=b"v@:@"))
+        stats_btn.setAction_(self._SEL_OPEN_STATS)
         view.addSubview_(stats_btn)
 
         # ── Separator ──
@@ -703,14 +1173,14 @@ class PopoverViewController(NSViewController):
         bench_btn.setTitle_("Benchmark")
         bench_btn.setBezelStyle_(_BezelStyle)
         bench_btn.setTarget_(self)
-        bench_btn.setAction_(objc.selector(self.runBenchmark_, signature=b"v@:@"))
+        bench_btn.setAction_(self._SEL_RUN_BENCHMARK)
         view.addSubview_(bench_btn)
 
         logs_btn = NSButton.alloc().initWithFrame_(NSMakeRect(width - 80, y, 65, 24))
         logs_btn.setTitle_("Logs")
         logs_btn.setBezelStyle_(_BezelStyle)
         logs_btn.setTarget_(self)
-        logs_btn.setAction_(objc.selector(self.openLogs_, signature=b"v@:@"))
+        logs_btn.setAction_(self._SEL_OPEN_LOGS)
         view.addSubview_(logs_btn)
 
         # ── Separator ──
@@ -723,26 +1193,25 @@ class PopoverViewController(NSViewController):
         quit_btn.setTitle_("Quit SoloMiner")
         quit_btn.setBezelStyle_(_BezelStyle)
         quit_btn.setTarget_(self)
-        quit_btn.setAction_(objc.selector(self.quitApp_, signature=b"v@:@"))
+        quit_btn.setAction_(self._SEL_QUIT_APP)
         view.addSubview_(quit_btn)
 
         return view
 
     def _apply_config(self):
         if self._config:
-            mode_map = {"Auto": 0, "Full Speed": 1, "Eco Mode": 2}
-            idx = mode_map.get(self._config.performance_mode, 1)
-            if hasattr(self, "_perf_seg") and self._perf_seg:
+            idx = _PERF_MODE_INDEX.get(self._config.performance_mode, 1)
+            if self._perf_seg is not None:
                 self._perf_seg.setSelectedSegment_(idx)
-            if hasattr(self, "_mode_val") and self._mode_val:
-                self._mode_val.setStringValue_(self._config.performance_mode)
-            if hasattr(self, "_network_val") and self._network_val:
-                self._network_val.setStringValue_(self._config.network)
-            if hasattr(self, "_algo_val") and self._algo_val:
-                self._algo_val.setStringValue_("SHA-256d")
-            if self._config.pools and hasattr(self, "_pool_val") and self._pool_val:
+            if self._mode_val is not None:
+                self._set_text(self._mode_val, self._config.performance_mode)
+            if self._network_val is not None:
+                self._set_text(self._network_val, self._config.network)
+            if self._algo_val is not None:
+                self._set_text(self._algo_val, "SHA-256d")
+            if self._config.pools and self._pool_val is not None:
                 active = self._config.pools[self._config.active_pool_index]
-                self._pool_val.setStringValue_(active.get("name", "---"))
+                self._set_text(self._pool_val, active.get("name", "---"))
 
     # ── Animations ──
     def _start_mining_animations(self):
@@ -752,18 +1221,14 @@ class PopoverViewController(NSViewController):
         self._is_mining_animated = True
 
         # Pulse the status dot
-        if self._status_dot:
-            _set_bg(self._status_dot.layer(), ACCENT_GREEN)
-            _add_pulse_animation(
-                self._status_dot.layer(), ACCENT_GREEN, PULSE_GREEN, 1.5
-            )
+        if self._status_dot_layer:
+            self._set_dot_color(ACCENT_GREEN)
+            _add_pulse_animation(self._status_dot_layer, ACCENT_GREEN, PULSE_GREEN, 1.5)
 
         # Glow on hashrate card
         if self._hashrate_card:
             layer = self._hashrate_card.layer()
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                layer.setShadowColor_(_cgcolor(ACCENT_BLUE))
+            layer.setShadowColor_(_cgcolor(ACCENT_BLUE))
             layer.setShadowRadius_(8)
             _add_glow_animation(layer, duration=2.5)
 
@@ -773,18 +1238,45 @@ class PopoverViewController(NSViewController):
             return
         self._is_mining_animated = False
 
-        if self._status_dot:
-            _remove_animation(self._status_dot.layer(), "pulse")
-            _set_bg(self._status_dot.layer(), TEXT_SECONDARY)
+        if self._status_dot_layer:
+            _remove_animation(self._status_dot_layer, "pulse")
+            self._set_dot_color(TEXT_SECONDARY)
 
         if self._hashrate_card:
             layer = self._hashrate_card.layer()
             _remove_animation(layer, "glow")
             layer.setShadowOpacity_(0.15)
             layer.setShadowRadius_(4)
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                layer.setShadowColor_(_cgcolor(NSColor.blackColor()))
+            layer.setShadowColor_(_cgcolor(CARD_SHADOW))
+
+    def _set_btn_state(self, running):
+        """Show Stop (red) while mining and Start (green) otherwise,
+        touching the button only when that flips."""
+        if running == self._btn_state:
+            return
+        self._btn_state = running
+        btn = self._start_stop_btn
+        btn.setTitle_("Stop" if running else "Start")
+        if hasattr(btn, "setBezelColor_"):
+            btn.setBezelColor_(ACCENT_RED if running else ACCENT_GREEN)
+
+    def _set_text(self, label, text):
+        """Set a dashboard label's text, skipping the call when it already
+        shows *text* so idle ticks don't dirty every layer-backed label."""
+        if self._label_text.get(label) != text:
+            label.setStringValue_(text)
+            self._label_text[label] = text
+
+    def _set_text_color(self, label, color):
+        """Like _set_text for the label's text colour (palette constants)."""
+        if self._label_color.get(label) is not color:
+            label.setTextColor_(color)
+            self._label_color[label] = color
+
+    def _set_dot_color(self, color):
+        if self._dot_color is not color:
+            _set_bg(self._status_dot_layer, color)
+            self._dot_color = color
 
     # ── Timer ──
     def startUpdateTimer(self):
@@ -794,168 +1286,152 @@ class PopoverViewController(NSViewController):
             NSTimer.timerWithTimeInterval_target_selector_userInfo_repeats_(
                 1.0,
                 self,
-                objc.selector(self.updateStats_, signature=b"v@:@"),
+                self._SEL_UPDATE_STATS,
                 None,
                 True,
             )
         )
+        self._update_timer.setTolerance_(_UPDATE_TIMER_TOLERANCE)
         NSRunLoop.currentRunLoop().addTimer_forMode_(
             self._update_timer, NSRunLoopCommonModes
         )
 
+    def _on_hashrate_sample(self, rate):
+        # Mining thread: hop to the main thread, coalescing bursts from
+        # several workers sampling in the same second into one update
+        if self._hashrate_pending:
+            return
+        self._hashrate_pending = True
+        self.performSelectorOnMainThread_withObject_waitUntilDone_(
+            self._SEL_HASHRATE_SAMPLED,
+            None,
+            False,
+        )
+
     @objc.typedSelector(b"v@:@")
-    def updateStats_(self, timer):
-        if not getattr(self, "_view_loaded", False):
+    def hashrateSampled_(self, _unused):
+        self._hashrate_pending = False
+        if not (self._engine and self._engine.is_running):
             return
-        # Only update dashboard widgets when on the dashboard screen
-        if self._current_screen != "dashboard":
+        rate = self._engine.hashrate
+        prev = self._ema_hashrate
+        if prev is not None:
+            rate = prev + _HASHRATE_EMA_ALPHA * (rate - prev)
+        self._ema_hashrate = rate
+        hr_str = format_hashrate(rate)
+        self._set_menu_title(f"SoloMiner {hr_str}")
+        if (
+            self._popover_visible
+            and self._current_screen == "dashboard"
+            and self._hashrate_val is not None
+        ):
+            self._set_text(self._hashrate_val, hr_str)
+
+    def stopUpdateTimer(self):
+        if self._update_timer is not None:
+            self._update_timer.invalidate()
+            self._update_timer = None
+
+    def _set_menu_title(self, title):
+        if title == self._menu_title:
             return
-        if not hasattr(self, "_hashrate_val") or self._hashrate_val is None:
+        if self._menu_bar_button is None:
+            try:
+                app_delegate = NSApp.delegate()
+                if app_delegate and hasattr(app_delegate, "_status_item"):
+                    self._menu_bar_button = app_delegate._status_item.button()
+            except Exception:
+                pass
+            if self._menu_bar_button is None:
+                return
+        self._menu_bar_button.setTitle_(title)
+        self._menu_title = title
+
+    @objc.typedSelector(b"v@:@")
+    def updateStats_(self, timer):
+        if not self._view_loaded:
+            return
+        # Dashboard widgets only update while they can be seen
+        if not self._popover_visible or self._current_screen != "dashboard":
             return
 
         if self._engine and self._engine.is_running:
-            hr = self._engine.hashrate
-            if hr >= 1e9:
-                hr_str = f"{hr / 1e9:.2f} GH/s"
-            elif hr >= 1e6:
-                hr_str = f"{hr / 1e6:.2f} MH/s"
-            elif hr >= 1e3:
-                hr_str = f"{hr / 1e3:.2f} KH/s"
-            else:
-                hr_str = f"{hr:.0f} H/s"
-            self._hashrate_val.setStringValue_(hr_str)
-
             # Thread badge
-            if hasattr(self, "_threads_badge") and self._threads_badge:
-                tc = self._engine.active_thread_count
-                self._threads_badge.setStringValue_(f"{tc} thr" if tc > 0 else "--")
+            tc = self._engine.active_thread_count
+            self._set_text(self._threads_badge, f"{tc} thr" if tc > 0 else "--")
 
             # Uptime
             secs = int(self._engine.uptime_seconds)
-            hours = secs // 3600
-            mins = (secs % 3600) // 60
-            s = secs % 60
-            if hours > 0:
-                self._uptime_val.setStringValue_(f"{hours}h {mins}m {s}s")
-            else:
-                self._uptime_val.setStringValue_(f"{mins}m {s}s")
+            if secs != self._last_uptime_secs:
+                self._last_uptime_secs = secs
+                hours, rem = divmod(secs, 3600)
+                mins, s = divmod(rem, 60)
+                if hours > 0:
+                    self._set_text(self._uptime_val, f"{hours}h {mins}m {s}s")
+                else:
+                    self._set_text(self._uptime_val, f"{mins}m {s}s")
 
-            self._shares_val.setStringValue_(
-                f"{self._engine.shares_accepted}/{self._engine.shares_accepted + self._engine.shares_rejected}"
+            self._set_text(
+                self._shares_val,
+                f"{self._engine.shares_accepted}/{self._engine.shares_accepted + self._engine.shares_rejected}",
             )
 
             diff = self._engine.difficulty
             if diff > 0:
-                self._diff_val.setStringValue_(f"{diff:.2e}")
+                self._set_text(self._diff_val, f"{diff:.2e}")
 
             # Extra info
-            if hasattr(self, "_gpu_val") and self._gpu_val:
-                if self._engine.miner:
-                    self._gpu_val.setStringValue_(self._engine.miner.gpu_name or "---")
-                    self._best_share_val.setStringValue_(
-                        f"{self._engine.miner.best_share_bits} bits"
-                    )
-            if hasattr(self, "_peak_val") and self._peak_val:
-                pk = self._engine.peak_hashrate
-                if pk >= 1e9:
-                    self._peak_val.setStringValue_(f"{pk / 1e9:.2f} GH/s")
-                elif pk >= 1e6:
-                    self._peak_val.setStringValue_(f"{pk / 1e6:.2f} MH/s")
-                elif pk >= 1e3:
-                    self._peak_val.setStringValue_(f"{pk / 1e3:.2f} KH/s")
-                else:
-                    self._peak_val.setStringValue_(f"{pk:.0f} H/s")
-            if hasattr(self, "_jobs_val") and self._jobs_val:
-                self._jobs_val.setStringValue_(str(self._engine.jobs_received))
+            miner = self._engine.miner
+            if miner:
+                self._set_text(self._gpu_val, miner.gpu_name or "---")
+                self._set_text(self._best_share_val, f"{miner.best_share_bits} bits")
+            pk = self._engine.peak_hashrate
+            if pk != self._last_peak:
+                self._last_peak = pk
+                self._set_text(self._peak_val, format_hashrate(pk))
+            self._set_text(self._jobs_val, str(self._engine.jobs_received))
 
             # Status
             status = self._engine.status
-            if status == "Mining":
-                self._auth_label.setStringValue_("Mining")
-                self._auth_label.setTextColor_(ACCENT_GREEN)
-                _set_bg(self._status_dot.layer(), ACCENT_GREEN)
-                self._start_mining_animations()
-            elif status == "Authorized":
-                self._auth_label.setStringValue_("Authorized")
-                self._auth_label.setTextColor_(ACCENT_GREEN)
-                _set_bg(self._status_dot.layer(), ACCENT_GREEN)
-            elif status in (
-                "Connecting",
-                "Connected",
-                "Subscribing",
-                "Subscribed",
-                "Authorizing",
-                "Reconnecting",
-                "Starting",
-            ):
-                self._auth_label.setStringValue_(status)
-                self._auth_label.setTextColor_(ACCENT_ORANGE)
-                _set_bg(self._status_dot.layer(), ACCENT_ORANGE)
-                _add_pulse_animation(
-                    self._status_dot.layer(), ACCENT_ORANGE, PULSE_ORANGE, 1.0, "pulse"
-                )
-            elif status in (
-                "Auth Failed",
-                "Subscribe Failed",
-                "DNS Failed",
-                "Timeout",
-                "Refused",
-                "Error",
-            ):
-                self._auth_label.setStringValue_(status)
-                self._auth_label.setTextColor_(ACCENT_RED)
-                _set_bg(self._status_dot.layer(), ACCENT_RED)
-                self._stop_mining_animations()
-            elif status == "Disconnected":
-                self._auth_label.setStringValue_("Disconnected")
-                self._auth_label.setTextColor_(ACCENT_RED)
-                _set_bg(self._status_dot.layer(), ACCENT_RED)
-                self._stop_mining_animations()
-            else:
-                self._auth_label.setStringValue_(status)
-                self._auth_label.setTextColor_(ACCENT_ORANGE)
-
-            # Menu bar title
-            try:
-                app_delegate = NSApp.delegate()
-                if app_delegate and hasattr(app_delegate, "_status_item"):
-                    btn = app_delegate._status_item.button()
-                    if btn:
-                        btn.setTitle_(f"SoloMiner {hr_str}")
-            except Exception:
-                pass
+            text_color, dot_color, anim = _STATUS_TABLE.get(status, _STATUS_DEFAULT)
+            self._set_text(self._auth_label, status)
+            self._set_text_color(self._auth_label, text_color)
+            if dot_color is not None:
+                self._set_dot_color(dot_color)
+            # Animations only change with the status; re-adding them every
+            # tick just restarts the same CAAnimation
+            if status != self._last_status:
+                self._last_status = status
+                if anim == "mining":
+                    self._start_mining_animations()
+                elif anim == "pulse":
+                    _add_pulse_animation(
+                        self._status_dot_layer,
+                        ACCENT_ORANGE,
+                        PULSE_ORANGE,
+                        1.0,
+                        "pulse",
+                    )
+                elif anim == "stop":
+                    self._stop_mining_animations()
         else:
-            self._hashrate_val.setStringValue_("0.00 MH/s")
-            self._uptime_val.setStringValue_("0m 0s")
-            self._auth_label.setStringValue_("Idle")
-            self._auth_label.setTextColor_(TEXT_SECONDARY)
-            if hasattr(self, "_threads_badge") and self._threads_badge:
-                self._threads_badge.setStringValue_("--")
-            if hasattr(self, "_gpu_val") and self._gpu_val:
-                self._gpu_val.setStringValue_("---")
-            if hasattr(self, "_best_share_val") and self._best_share_val:
-                self._best_share_val.setStringValue_("0 bits")
-            if hasattr(self, "_peak_val") and self._peak_val:
-                self._peak_val.setStringValue_("0.00 MH/s")
-            if hasattr(self, "_jobs_val") and self._jobs_val:
-                self._jobs_val.setStringValue_("0")
+            for label, text in self._idle_fields:
+                self._set_text(label, text)
+            self._set_text(self._auth_label, "Idle")
+            self._set_text_color(self._auth_label, TEXT_SECONDARY)
+            self._last_uptime_secs = -1
+            self._last_peak = -1.0
+            self._last_status = None
             self._stop_mining_animations()
-            try:
-                app_delegate = NSApp.delegate()
-                if app_delegate and hasattr(app_delegate, "_status_item"):
-                    btn = app_delegate._status_item.button()
-                    if btn:
-                        btn.setTitle_("SoloMiner")
-            except Exception:
-                pass
+            self._set_menu_title("SoloMiner")
 
     # ── Actions ──
     @objc.typedSelector(b"v@:@")
     def perfModeChanged_(self, sender):
-        modes = {0: "Auto", 1: "Full Speed", 2: "Eco Mode"}
-        mode = modes.get(sender.selectedSegment(), "Full Speed")
-        if hasattr(self, "_mode_val") and self._mode_val:
-            self._mode_val.setStringValue_(mode)
+        seg = sender.selectedSegment()
+        mode = _PERF_MODES[seg] if 0 <= seg < len(_PERF_MODES) else "Full Speed"
+        if self._mode_val is not None:
+            self._set_text(self._mode_val, mode)
         if self._config:
             self._config.performance_mode = mode
             save_config(self._config)
@@ -974,6 +1450,7 @@ class PopoverViewController(NSViewController):
         return self._engine and self._engine.is_running
 
     def _start_mining(self):
+        self._flush_config_save()
         self._config = load_config()
         self._apply_config()
 
@@ -982,16 +1459,16 @@ class PopoverViewController(NSViewController):
         address = self._config.bitcoin_address
         if not address:
             append_log("ERROR: No Bitcoin address configured. Open Settings > Mining.")
-            self._auth_label.setStringValue_("No Address")
-            self._auth_label.setTextColor_(ACCENT_RED)
+            self._set_text(self._auth_label, "No Address")
+            self._set_text_color(self._auth_label, ACCENT_RED)
             return
 
         # Validate address format
         valid, err = validate_bitcoin_address(address, self._config.network)
         if not valid:
             append_log(f"ERROR: Invalid Bitcoin address: {err}")
-            self._auth_label.setStringValue_("Bad Address")
-            self._auth_label.setTextColor_(ACCENT_RED)
+            self._set_text(self._auth_label, "Bad Address")
+            self._set_text_color(self._auth_label, ACCENT_RED)
             return
 
         pools = self._config.pools
@@ -1016,26 +1493,24 @@ class PopoverViewController(NSViewController):
             self._config.worker_name,
             self._config.network,
         )
-        self._start_stop_btn.setTitle_("Stop")
-        if hasattr(self._start_stop_btn, "setBezelColor_"):
-            self._start_stop_btn.setBezelColor_(ACCENT_RED)
-        self._pool_val.setStringValue_(active.get("name", f"{host}:{port}"))
-        self._network_val.setStringValue_(self._config.network)
-        self._mode_val.setStringValue_(self._config.performance_mode)
-        if hasattr(self, "_algo_val") and self._algo_val:
-            self._algo_val.setStringValue_("SHA-256d")
+        self._ema_hashrate = None
+        self.startUpdateTimer()
+        self._set_btn_state(True)
+        self._set_text(self._pool_val, active.get("name", f"{host}:{port}"))
+        self._set_text(self._network_val, self._config.network)
+        self._set_text(self._mode_val, self._config.performance_mode)
+        if self._algo_val is not None:
+            self._set_text(self._algo_val, "SHA-256d")
         append_log(f"Mining started -> {host}:{port} (Bitcoin / SHA-256d)")
 
     def _stop_mining(self):
         if self._engine:
             self._engine.stop()
-        self._start_stop_btn.setTitle_("Start")
-        if hasattr(self._start_stop_btn, "setBezelColor_"):
-            self._start_stop_btn.setBezelColor_(ACCENT_GREEN)
-        self._hashrate_val.setStringValue_("0.00 MH/s")
-        self._uptime_val.setStringValue_("0m 0s")
-        self._auth_label.setStringValue_("Idle")
-        self._auth_label.setTextColor_(TEXT_SECONDARY)
+        self._set_btn_state(False)
+        self._set_text(self._hashrate_val, HASHRATE_IDLE)
+        self._set_text(self._uptime_val, "0m 0s")
+        self._set_text(self._auth_label, "Idle")
+        self._set_text_color(self._auth_label, TEXT_SECONDARY)
         self._stop_mining_animations()
         append_log("Mining stopped")
 
@@ -1054,65 +1529,68 @@ class PopoverViewController(NSViewController):
     @objc.typedSelector(b"v@:@")
     def runBenchmark_(self, sender):
         append_log("Starting benchmark...")
-        self._hashrate_val.setStringValue_("Benchmarking...")
+        self._set_text(self._hashrate_val, "Benchmarking...")
         self._bench_result = None
 
         def _bench():
-            from .metal_miner import MetalMiner
-            import time as _time
-
-            miner = MetalMiner()
-            header = b"\x00" * 80
-            target = (1 << 256) - 1
-
-            start = _time.time()
-            iterations = 10
-            batch = 1 << 22 if miner.use_gpu else 1 << 18
-            for _ in range(iterations):
+            # Anything raised here would escape into the operation queue, and
+            # the dashboard would stay on "Benchmarking..."; always report back
+            try:
+                miner = MetalMiner()
+                header = b"\x00" * 80
+                # Unreachable target so every nonce in the range gets hashed
+                target = 0
+
+                # One dispatch over the whole range rather than ten identical ones
+                total = (1 << 22 if miner.use_gpu else 1 << 18) * 10
+                start = time.time()
                 if miner.use_gpu:
-                    miner.mine_range_gpu(header, target, 0, batch)
+                    miner.mine_range_gpu(header, target, 0, total)
                 else:
-                    miner.mine_range_cpu(header, target, 0, batch)
-            elapsed = _time.time() - start
-            total = batch * iterations
-            rate = total / elapsed
-
-            if rate >= 1e9:
-                hr_str = f"{rate / 1e9:.2f} GH/s"
-            elif rate >= 1e6:
-                hr_str = f"{rate / 1e6:.2f} MH/s"
-            elif rate >= 1e3:
-                hr_str = f"{rate / 1e3:.2f} KH/s"
-            else:
-                hr_str = f"{rate:.0f} H/s"
-
-            self._bench_result = (hr_str, miner.gpu_name)
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                objc.selector(
-                    PopoverViewController._benchDone_,
-                    signature=b"v@:@",
-                ),
-                None,
-                False,
-            )
+                    miner.mine_range_cpu(header, target, 0, total)
+                elapsed = time.time() - start
+                hashed = miner.get_and_reset_hashcount()
+                rate = hashed / elapsed if elapsed > 0 else 0.0
+
+                self._bench_result = (format_hashrate(rate), miner.gpu_name, None)
+            except Exception as e:
+                self._bench_result = (None, None, str(e) or type(e).__name__)
+            finally:
+                self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                    self._SEL_BENCH_DONE,
+                    None,
+                    False,
+                )
 
-        threading.Thread(target=_bench, daemon=True).start()
+        if self._bench_queue is None:
+            self._bench_queue = NSOperationQueue.alloc().init()
+            self._bench_queue.setMaxConcurrentOperationCount_(1)
+            self._bench_queue.setQualityOfService_(NSQualityOfServiceUtility)
+        self._bench_queue.addOperationWithBlock_(_bench)
 
     @objc.typedSelector(b"v@:@")
     def _benchDone_(self, _unused):
         if self._bench_result:
-            hr_str, gpu_name = self._bench_result
-            if hasattr(self, "_hashrate_val") and self._hashrate_val:
-                self._hashrate_val.setStringValue_(hr_str)
-            if hasattr(self, "_gpu_val") and self._gpu_val:
-                self._gpu_val.setStringValue_(gpu_name or "---")
-            append_log(f"Benchmark result: {hr_str} (GPU: {gpu_name})")
+            hr_str, gpu_name, err = self._bench_result
             self._bench_result = None
+            if err is not None:
+                if self._hashrate_val is not None:
+                    self._set_text(self._hashrate_val, "Benchmark failed")
+                append_log(f"Benchmark error: {err}")
+                return
+            if self._hashrate_val is not None:
+                self._set_text(self._hashrate_val, hr_str)
+            if self._gpu_val is not None:
+                self._set_text(self._gpu_val, gpu_name or "---")
+            append_log(f"Benchmark result: {hr_str} (GPU: {gpu_name})")
 
     @objc.typedSelector(b"v@:@")
     def quitApp_(self, sender):
         if self._engine and self._engine.is_running:
             self._engine.stop()
+        if self._ping_loop is not None:
+            self._ping_loop.call_soon_threadsafe(self._ping_loop.stop)
+        self._flush_config_save()
         NSApp.terminate_(None)
 
     # ─────────────────────────────────────────
@@ -1132,9 +1610,7 @@ class PopoverViewController(NSViewController):
         self._settings_tab_seg.setLabel_forSegment_("About", 3)
         self._settings_tab_seg.setSelectedSegment_(0)
         self._settings_tab_seg.setTarget_(self)
-        self._settings_tab_seg.setAction_(
-            objc.selector(self.settingsTabChanged_, signature=b"v@:@")
-        )
+        self._settings_tab_seg.setAction_(self._SEL_SETTINGS_TAB_CHANGED)
         view.addSubview_(self._settings_tab_seg)
 
         content_h = h - 42
@@ -1142,24 +1618,51 @@ class PopoverViewController(NSViewController):
         view.addSubview_(container)
         self._settings_tab_container = container
 
-        general = self._build_settings_general(w, content_h)
-        pools = self._build_settings_pools(w, content_h)
-        mining = self._build_settings_mining(w, content_h)
-        about = self._build_settings_about(w, content_h)
-
-        self._settings_tab_views = [general, pools, mining, about]
-        for v in self._settings_tab_views:
-            v.setHidden_(True)
-            container.addSubview_(v)
-        general.setHidden_(False)
+        # Tabs are built the first time they're selected; General shows first
+        self._settings_tab_builders = (
+            self._build_settings_general,
+            self._build_settings_pools,
+            self._build_settings_mining,
+            self._build_settings_about,
+        )
+        self._settings_tab_views = [None] * len(self._settings_tab_builders)
+        self._pool_list_view = None
+        # Drop inputs from the previous view; its tabs may not be rebuilt
+        for attr, _ in self._SETTINGS_INPUTS:
+            setattr(self, attr, None)
+        self._settings_inputs_shown = {}
+        self._show_settings_tab(0)
 
         return view
 
+    def _settings_input_values(self):
+        """Value shown by each settings input built so far, by attribute."""
+        values = {}
+        for attr, getter in self._SETTINGS_INPUTS:
+            control = getattr(self, attr)
+            if control is not None:
+                values[attr] = getattr(control, getter)()
+        return values
+
+    def _show_settings_tab(self, idx):
+        if self._settings_tab_views[idx] is None:
+            frame = self._settings_tab_container.frame()
+            with _layer_batch():
+                tab = self._settings_tab_builders[idx](
+                    int(frame.size.width), int(frame.size.height)
+                )
+            self._settings_tab_container.addSubview_(tab)
+            self._settings_tab_views[idx] = tab
+            # Baseline for the new tab's inputs; earlier tabs keep theirs
+            for attr, value in self._settings_input_values().items():
+                self._settings_inputs_shown.setdefault(attr, value)
+        for i, v in enumerate(self._settings_tab_views):
+            if v is not None:
+                v.setHidden_(i != idx)
+
     @objc.typedSelector(b"v@:@")
     def settingsTabChanged_(self, sender):
-        idx = sender.selectedSegment()
-        for i, v in enumerate(self._settings_tab_views):
-            v.setHidden_(i != idx)
+        self._show_settings_tab(sender.selectedSegment())
 
     # ── General tab ──
     def _build_settings_general(self, w, h):
@@ -1168,19 +1671,13 @@ class PopoverViewController(NSViewController):
         pad = 18
 
         y -= 22
-        header = make_label("Startup", size=13, bold=True)
-        header.setFrame_(NSMakeRect(pad, y, 200, 20))
-        header.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header)
+        _add_label(view, "Startup", NSMakeRect(pad, y, 200, 20), size=13, bold=True)
 
         y -= 55
         card = _make_inline_card(pad, y, w - pad * 2, 50)
         view.addSubview_(card)
 
-        lbl = make_label("Start at Login", size=12)
-        lbl.setFrame_(NSMakeRect(12, 26, 180, 18))
-        lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card.addSubview_(lbl)
+        _add_label(card, "Start at Login", NSMakeRect(12, 26, 180, 18), size=12)
 
         self._login_toggle = NSButton.alloc().initWithFrame_(
             NSMakeRect(w - pad * 2 - 55, 26, 44, 20)
@@ -1194,25 +1691,20 @@ class PopoverViewController(NSViewController):
 
         login_status = "Installed" if actual_installed else "Not installed"
         login_color = ACCENT_GREEN if actual_installed else TEXT_SECONDARY
-        self._login_status_label = make_label(login_status, size=9, color=login_color)
-        self._login_status_label.setFrame_(NSMakeRect(12, 5, 180, 14))
-        self._login_status_label.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card.addSubview_(self._login_status_label)
+        self._login_status_label = _add_label(
+            card, login_status, NSMakeRect(12, 5, 180, 14), size=9, color=login_color
+        )
 
         y -= 26
-        header2 = make_label("Auto-Restart", size=13, bold=True)
-        header2.setFrame_(NSMakeRect(pad, y, 200, 20))
-        header2.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header2)
+        _add_label(
+            view, "Auto-Restart", NSMakeRect(pad, y, 200, 20), size=13, bold=True
+        )
 
         y -= 85
         card2 = _make_inline_card(pad, y, w - pad * 2, 80)
         view.addSubview_(card2)
 
-        lbl2 = make_label("Restart on stall", size=12)
-        lbl2.setFrame_(NSMakeRect(12, 54, 180, 18))
-        lbl2.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card2.addSubview_(lbl2)
+        _add_label(card2, "Restart on stall", NSMakeRect(12, 54, 180, 18), size=12)
 
         self._restart_toggle = NSButton.alloc().initWithFrame_(
             NSMakeRect(w - pad * 2 - 55, 54, 44, 20)
@@ -1222,41 +1714,36 @@ class PopoverViewController(NSViewController):
         self._restart_toggle.setState_(1 if self._config.restart_on_stall else 0)
         card2.addSubview_(self._restart_toggle)
 
-        sep = NSView.alloc().initWithFrame_(NSMakeRect(12, 47, w - pad * 2 - 24, 1))
+        sep = FastLayerView.alloc().initWithFrame_(
+            NSMakeRect(12, 47, w - pad * 2 - 24, 1)
+        )
         sep.setWantsLayer_(True)
         _set_bg(sep.layer(), BORDER_COLOR)
         card2.addSubview_(sep)
 
-        lbl3 = make_label("Timeout", size=12)
-        lbl3.setFrame_(NSMakeRect(12, 24, 80, 18))
-        lbl3.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card2.addSubview_(lbl3)
+        _add_label(card2, "Timeout", NSMakeRect(12, 24, 80, 18), size=12)
 
         self._timeout_popup = NSPopUpButton.alloc().initWithFrame_(
             NSMakeRect(w - pad * 2 - 135, 22, 125, 22)
         )
-        for mins in [5, 10, 15, 30, 60]:
+        for mins in _TIMEOUT_MINUTES:
             self._timeout_popup.addItemWithTitle_(f"{mins} minutes")
-        idx = {5: 0, 10: 1, 15: 2, 30: 3, 60: 4}.get(
-            self._config.stall_timeout_minutes, 1
-        )
+        idx = _TIMEOUT_INDEX.get(self._config.stall_timeout_minutes, 1)
         self._timeout_popup.selectItemAtIndex_(idx)
         card2.addSubview_(self._timeout_popup)
 
-        hint = make_label(
+        _add_label(
+            card2,
             "Auto-restart mining if no activity detected",
+            NSMakeRect(12, 4, w - pad * 2 - 24, 14),
             size=9,
             color=TEXT_SECONDARY,
         )
-        hint.setFrame_(NSMakeRect(12, 4, w - pad * 2 - 24, 14))
-        hint.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card2.addSubview_(hint)
 
         y -= 26
-        header3 = make_label("Activity Log", size=13, bold=True)
-        header3.setFrame_(NSMakeRect(pad, y, 200, 20))
-        header3.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header3)
+        _add_label(
+            view, "Activity Log", NSMakeRect(pad, y, 200, 20), size=13, bold=True
+        )
 
         y -= 58
         card3 = _make_inline_card(pad, y, w - pad * 2, 52)
@@ -1266,21 +1753,21 @@ class PopoverViewController(NSViewController):
         view_log_btn.setTitle_("View Mining Activity")
         view_log_btn.setBezelStyle_(_BezelStyle)
         view_log_btn.setTarget_(self)
-        view_log_btn.setAction_(objc.selector(self.openLogs_, signature=b"v@:@"))
+        view_log_btn.setAction_(self._SEL_OPEN_LOGS)
         card3.addSubview_(view_log_btn)
 
         clear_log_btn = NSButton.alloc().initWithFrame_(NSMakeRect(12, 2, 120, 22))
         clear_log_btn.setTitle_("Clear Activity Log")
         clear_log_btn.setBezelStyle_(_BezelStyle)
         clear_log_btn.setTarget_(self)
-        clear_log_btn.setAction_(objc.selector(self.clearLogAction_, signature=b"v@:@"))
+        clear_log_btn.setAction_(self._SEL_CLEAR_LOG_ACTION)
         card3.addSubview_(clear_log_btn)
 
         save_btn = make_blue_button(
             "Save General", NSMakeRect((w - 130) / 2, 10, 130, 28)
         )
         save_btn.setTarget_(self)
-        save_btn.setAction_(objc.selector(self.saveGeneralConfig_, signature=b"v@:@"))
+        save_btn.setAction_(self._SEL_SAVE_GENERAL_CONFIG)
         save_btn.setKeyEquivalent_("\r")
         view.addSubview_(save_btn)
 
@@ -1296,8 +1783,7 @@ class PopoverViewController(NSViewController):
             want_login = bool(self._login_toggle.state())
             self._config.start_at_login = want_login
             self._config.restart_on_stall = bool(self._restart_toggle.state())
-            timeout_items = [5, 10, 15, 30, 60]
-            self._config.stall_timeout_minutes = timeout_items[
+            self._config.stall_timeout_minutes = _TIMEOUT_MINUTES[
                 self._timeout_popup.indexOfSelectedItem()
             ]
             save_config(self._config)
@@ -1308,7 +1794,7 @@ class PopoverViewController(NSViewController):
             else:
                 ok, msg = uninstall_login_item()
 
-            if hasattr(self, "_login_status_label") and self._login_status_label:
+            if self._login_status_label is not None:
                 if want_login and ok:
                     self._login_status_label.setStringValue_("Installed")
                     self._login_status_label.setTextColor_(ACCENT_GREEN)
@@ -1322,159 +1808,214 @@ class PopoverViewController(NSViewController):
             append_log(f"General settings saved ({msg})")
 
     # ── Pools tab ──
+    def _build_pool_list(self, w):
+        """Pool cards only. Add and delete edit the cards in place; only a
+        reset rebuilds the list."""
+        pools = self._config.pools
+        view = _FlippedView.alloc().initWithFrame_(
+            NSMakeRect(0, 0, w, len(pools) * _POOL_ROW_H)
+        )
+        # Sized up front and filled by index; _append_pool_card grows them
+        self._pool_cards = [None] * len(pools)
+        self._pool_ping_labels = [None] * len(pools)
+        self._active_pool_card = None
+        for i, pool in enumerate(pools):
+            self._add_pool_card(view, i, pool, w)
+        return view
+
+    def _add_pool_card(self, view, i, pool, w):
+        """Build the card for pool ``i`` in its row of the list ``view``."""
+        pad = 15
+        card = _make_inline_card(pad, i * _POOL_ROW_H + 3, w - pad * 2, _POOL_CARD_H)
+        card_layer = card.layer()
+        card_layer.setCornerRadius_(12)
+        is_active = i == self._config.active_pool_index
+        enabled = pool.get("enabled", True)
+        if is_active:
+            _set_bg(card_layer, BG_CARD_HIGHLIGHT)
+            self._active_pool_card = i
+        view.addSubview_(card)
+
+        cb = NSButton.alloc().initWithFrame_(NSMakeRect(8, 16, 22, 22))
+        cb.setButtonType_(NSSwitchButton)
+        cb.setTitle_("")
+        cb.setState_(1 if enabled else 0)
+        cb.setTag_(i)
+        cb.setTarget_(self)
+        cb.setAction_(self._SEL_POOL_TOGGLED)
+        card.addSubview_(cb)
+
+        name = pool.get("name", "Unknown")
+        host = pool.get("host", "")
+        port = pool.get("port", 3333)
+
+        name_lbl = _add_label(
+            card,
+            name,
+            NSMakeRect(34, 32, w - pad * 2 - 155, 16),
+            size=11,
+            bold=True,
+        )
+
+        detail_lbl = _add_label(
+            card,
+            f"{host} :{port}",
+            NSMakeRect(34, 18, w - pad * 2 - 155, 14),
+            size=9,
+            color=TEXT_SECONDARY,
+        )
+
+        # Algorithm badge (always SHA-256d)
+        _add_label(
+            card,
+            "SHA-256d",
+            NSMakeRect(34, 3, 120, 13),
+            size=8,
+            color=ACCENT_BLUE,
+            bold=True,
+        )
+
+        # Ping status label
+        ping_lbl = _add_label(
+            card, "", NSMakeRect(96, 3, 80, 13), size=8, color=TEXT_SECONDARY
+        )
+
+        # Ping button
+        ping_btn = NSButton.alloc().initWithFrame_(
+            NSMakeRect(w - pad * 2 - 130, 16, 36, 18)
+        )
+        ping_btn.setBezelStyle_(_BezelStyle)
+        ping_btn.setTitle_("Ping")
+        ping_btn.setTag_(i)
+        ping_btn.setTarget_(self)
+        ping_btn.setAction_(self._SEL_PING_POOL)
+        ping_btn.setFont_(_font(8))
+        card.addSubview_(ping_btn)
+
+        active_btn = NSButton.alloc().initWithFrame_(
+            NSMakeRect(w - pad * 2 - 52, 16, 42, 18)
+        )
+        active_btn.setBezelStyle_(_BezelStyle)
+        active_btn.setTitle_("Active" if is_active else "Set")
+        active_btn.setTag_(i)
+        active_btn.setTarget_(self)
+        active_btn.setAction_(self._SEL_SET_ACTIVE_POOL)
+        active_btn.setFont_(_font(9))
+        card.addSubview_(active_btn)
+
+        del_btn = NSButton.alloc().initWithFrame_(
+            NSMakeRect(w - pad * 2 - 88, 16, 32, 18)
+        )
+        del_btn.setBezelStyle_(_BezelStyle)
+        del_btn.setTitle_("Del")
+        del_btn.setTag_(i)
+        del_btn.setTarget_(self)
+        del_btn.setAction_(self._SEL_DELETE_POOL)
+        del_btn.setFont_(_font(9))
+        card.addSubview_(del_btn)
+
+        entry = (card, cb, name_lbl, detail_lbl, active_btn)
+        if i < len(self._pool_cards):
+            self._pool_cards[i] = entry
+            self._pool_ping_labels[i] = ping_lbl
+        else:
+            self._pool_cards.append(entry)
+            self._pool_ping_labels.append(ping_lbl)
+
     def _build_settings_pools(self, w, h):
         view = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, w, h))
         pad = 15
         y = h - 10
 
         y -= 20
-        header = make_label("Mining Pools", size=13, bold=True)
-        header.setFrame_(NSMakeRect(pad, y, 150, 20))
-        header.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header)
+        _add_label(
+            view, "Mining Pools", NSMakeRect(pad, y, 150, 20), size=13, bold=True
+        )
 
-        hint = make_label("Tap to set active", size=9, color=TEXT_SECONDARY)
-        hint.setFrame_(NSMakeRect(w - 120, y + 2, 105, 16))
-        hint.setAlignment_(NSTextAlignmentRight)
-        hint.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(hint)
+        _add_label(
+            view,
+            "Tap to set active",
+            NSMakeRect(w - 120, y + 2, 105, 16),
+            size=9,
+            color=TEXT_SECONDARY,
+            alignment=NSTextAlignmentRight,
+        )
 
         y -= 6
-        pool_h = 52
-        self._pool_cards = []
-        self._pool_ping_labels = []
-        pools = self._config.pools
-        for i, pool in enumerate(pools):
-            y -= pool_h + 3
-            card = _make_inline_card(pad, y, w - pad * 2, pool_h)
-            card.layer().setCornerRadius_(12)
-            is_active = i == self._config.active_pool_index
-            enabled = pool.get("enabled", True)
-            if is_active:
-                _set_bg(card.layer(), BG_CARD_HIGHLIGHT)
-            view.addSubview_(card)
-
-            cb = NSButton.alloc().initWithFrame_(NSMakeRect(8, 16, 22, 22))
-            cb.setButtonType_(NSSwitchButton)
-            cb.setTitle_("")
-            cb.setState_(1 if enabled else 0)
-            cb.setTag_(i)
-            cb.setTarget_(self)
-            cb.setAction_(objc.selector(self.poolToggled_, signature=b"v@:@"))
-            card.addSubview_(cb)
-
-            name = pool.get("name", "Unknown")
-            host = pool.get("host", "")
-            port = pool.get("port", 3333)
+        self._pool_list_view = self._build_pool_list(w)
+        list_h = int(self._pool_list_view.frame().size.height)
+        self._pool_list_view.setFrame_(NSMakeRect(0, y - list_h, w, list_h))
+        view.addSubview_(self._pool_list_view)
+        y -= list_h
+
+        # The add form sits just under the list and moves when it changes
+        add_h = 84
+        self._pool_add_view = NSView.alloc().initWithFrame_(
+            NSMakeRect(0, y - add_h, w, add_h)
+        )
+        view.addSubview_(self._pool_add_view)
 
-            name_lbl = make_label(name, size=11, bold=True)
-            name_lbl.setFrame_(NSMakeRect(34, 32, w - pad * 2 - 155, 16))
-            name_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(name_lbl)
-
-            detail_lbl = make_label(f"{host} :{port}", size=9, color=TEXT_SECONDARY)
-            detail_lbl.setFrame_(NSMakeRect(34, 18, w - pad * 2 - 155, 14))
-            detail_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(detail_lbl)
-
-            # Algorithm badge (always SHA-256d)
-            algo_lbl = make_label("SHA-256d", size=8, color=ACCENT_BLUE, bold=True)
-            algo_lbl.setFrame_(NSMakeRect(34, 3, 120, 13))
-            algo_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(algo_lbl)
-
-            # Ping status label
-            ping_lbl = make_label("", size=8, color=TEXT_SECONDARY)
-            ping_lbl.setFrame_(NSMakeRect(96, 3, 80, 13))
-            ping_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(ping_lbl)
-            self._pool_ping_labels.append(ping_lbl)
+        _add_label(
+            self._pool_add_view,
+            "Add Custom Pool",
+            NSMakeRect(pad, 60, 200, 16),
+            size=11,
+            bold=True,
+        )
 
-            # Ping button
-            ping_btn = NSButton.alloc().initWithFrame_(
-                NSMakeRect(w - pad * 2 - 130, 16, 36, 18)
-            )
-            ping_btn.setBezelStyle_(_BezelStyle)
-            ping_btn.setTitle_("Ping")
-            ping_btn.setTag_(i)
-            ping_btn.setTarget_(self)
-            ping_btn.setAction_(objc.selector(self.pingPool_, signature=b"v@:@"))
-            ping_btn.setFont_(NSFont.systemFontOfSize_(8))
-            card.addSubview_(ping_btn)
-
-            active_btn = NSButton.alloc().initWithFrame_(
-                NSMakeRect(w - pad * 2 - 52, 16, 42, 18)
-            )
-            active_btn.setBezelStyle_(_BezelStyle)
-            active_btn.setTitle_("Active" if is_active else "Set")
-            active_btn.setTag_(i)
-            active_btn.setTarget_(self)
-            active_btn.setAction_(objc.selector(self.setActivePool_, signature=b"v@:@"))
-            active_btn.setFont_(NSFont.systemFontOfSize_(9))
-            card.addSubview_(active_btn)
-
-            del_btn = NSButton.alloc().initWithFrame_(
-                NSMakeRect(w - pad * 2 - 88, 16, 32, 18)
-            )
-            del_btn.setBezelStyle_(_BezelStyle)
-            del_btn.setTitle_("Del")
-            del_btn.setTag_(i)
-            del_btn.setTarget_(self)
-            del_btn.setAction_(objc.selector(self.deletePool_, signature=b"v@:@"))
-            del_btn.setFont_(NSFont.systemFontOfSize_(9))
-            card.addSubview_(del_btn)
-
-            self._pool_cards.append((card, cb, name_lbl, detail_lbl, active_btn))
-
-        y -= 24
-        add_header = make_label("Add Custom Pool", size=11, bold=True)
-        add_header.setFrame_(NSMakeRect(pad, y, 200, 16))
-        add_header.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(add_header)
-
-        y -= 60
-        card_add = _make_inline_card(pad, y, w - pad * 2, 54)
+        card_add = _make_inline_card(pad, 0, w - pad * 2, 54)
         card_add.layer().setCornerRadius_(12)
-        view.addSubview_(card_add)
+        self._pool_add_view.addSubview_(card_add)
         cw = w - pad * 2
 
         # Row 1: Name + Host + Port
-        lbl_n = make_label("Name", size=8, color=TEXT_SECONDARY)
-        lbl_n.setFrame_(NSMakeRect(6, 38, 35, 12))
-        lbl_n.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card_add.addSubview_(lbl_n)
+        _add_label(
+            card_add, "Name", NSMakeRect(6, 38, 35, 12), size=8, color=TEXT_SECONDARY
+        )
         self._new_pool_name = NSTextField.alloc().initWithFrame_(
             NSMakeRect(6, 18, int(cw * 0.24), 18)
         )
         self._new_pool_name.setPlaceholderString_("My Pool")
         self._new_pool_name.setFocusRingType_(NSFocusRingTypeNone)
-        self._new_pool_name.setFont_(NSFont.systemFontOfSize_(10))
+        self._new_pool_name.setFont_(_font(10))
         card_add.addSubview_(self._new_pool_name)
 
         host_x = int(cw * 0.26)
-        lbl_h = make_label("Host", size=8, color=TEXT_SECONDARY)
-        lbl_h.setFrame_(NSMakeRect(host_x, 38, 30, 12))
-        lbl_h.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card_add.addSubview_(lbl_h)
+        _add_label(
+            card_add,
+            "Host",
+            NSMakeRect(host_x, 38, 30, 12),
+            size=8,
+            color=TEXT_SECONDARY,
+        )
         self._new_pool_host = NSTextField.alloc().initWithFrame_(
             NSMakeRect(host_x, 18, int(cw * 0.36), 18)
         )
         self._new_pool_host.setPlaceholderString_("pool.example.com")
         self._new_pool_host.setFocusRingType_(NSFocusRingTypeNone)
-        self._new_pool_host.setFont_(NSFont.systemFontOfSize_(10))
+        self._new_pool_host.setFont_(_font(10))
         card_add.addSubview_(self._new_pool_host)
 
         port_x = int(cw * 0.64)
-        lbl_p = make_label("Port", size=8, color=TEXT_SECONDARY)
-        lbl_p.setFrame_(NSMakeRect(port_x, 38, 30, 12))
-        lbl_p.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card_add.addSubview_(lbl_p)
+        _add_label(
+            card_add,
+            "Port",
+            NSMakeRect(port_x, 38, 30, 12),
+            size=8,
+            color=TEXT_SECONDARY,
+        )
         self._new_pool_port = NSTextField.alloc().initWithFrame_(
             NSMakeRect(port_x, 18, int(cw * 0.12), 18)
         )
         self._new_pool_port.setPlaceholderString_("3333")
         self._new_pool_port.setFocusRingType_(NSFocusRingTypeNone)
-        self._new_pool_port.setFont_(NSFont.systemFontOfSize_(10))
+        self._new_pool_port.setFont_(_font(10))
+        # Only whole numbers in the TCP port range get past editing
+        port_fmt = NSNumberFormatter.alloc().init()
+        port_fmt.setAllowsFloats_(False)
+        port_fmt.setMinimum_(1)
+        port_fmt.setMaximum_(65535)
+        self._new_pool_port.setFormatter_(port_fmt)
         card_add.addSubview_(self._new_pool_port)
 
         # Row 2: Add button
@@ -1484,21 +2025,21 @@ class PopoverViewController(NSViewController):
         add_btn.setTitle_("Add")
         add_btn.setBezelStyle_(_BezelStyle)
         add_btn.setTarget_(self)
-        add_btn.setAction_(objc.selector(self.addPool_, signature=b"v@:@"))
-        add_btn.setFont_(NSFont.systemFontOfSize_(10))
+        add_btn.setAction_(self._SEL_ADD_POOL)
+        add_btn.setFont_(_font(10))
         card_add.addSubview_(add_btn)
 
         reset_btn = NSButton.alloc().initWithFrame_(NSMakeRect(pad, 10, 95, 24))
         reset_btn.setTitle_("Reset Defaults")
         reset_btn.setBezelStyle_(_BezelStyle)
         reset_btn.setTarget_(self)
-        reset_btn.setAction_(objc.selector(self.resetPools_, signature=b"v@:@"))
-        reset_btn.setFont_(NSFont.systemFontOfSize_(10))
+        reset_btn.setAction_(self._SEL_RESET_POOLS)
+        reset_btn.setFont_(_font(10))
         view.addSubview_(reset_btn)
 
         save_btn = make_blue_button("Save Pools", NSMakeRect(w - pad - 95, 10, 95, 24))
         save_btn.setTarget_(self)
-        save_btn.setAction_(objc.selector(self.savePools_, signature=b"v@:@"))
+        save_btn.setAction_(self._SEL_SAVE_POOLS)
         save_btn.setKeyEquivalent_("\r")
         view.addSubview_(save_btn)
 
@@ -1512,26 +2053,25 @@ class PopoverViewController(NSViewController):
 
         # Coin/Algorithm display (read-only)
         y -= 22
-        header0 = make_label("Cryptocurrency", size=13, bold=True)
-        header0.setFrame_(NSMakeRect(pad, y, 200, 20))
-        header0.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header0)
+        _add_label(
+            view, "Cryptocurrency", NSMakeRect(pad, y, 200, 20), size=13, bold=True
+        )
 
         y -= 32
-        card0 = _make_inline_card(pad, y, w - pad * 2, 26)
+        card0 = _make_inline_card(pad, y, w - pad * 2, 26, rasterize=True)
         view.addSubview_(card0)
 
-        coin_lbl = make_label("Bitcoin (BTC) -- SHA-256d", size=11, bold=True)
-        coin_lbl.setFrame_(NSMakeRect(12, 4, w - pad * 2 - 24, 18))
-        coin_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card0.addSubview_(coin_lbl)
+        _add_label(
+            card0,
+            "Bitcoin (BTC) -- SHA-256d",
+            NSMakeRect(12, 4, w - pad * 2 - 24, 18),
+            size=11,
+            bold=True,
+        )
 
         # Network
         y -= 20
-        header = make_label("Network", size=13, bold=True)
-        header.setFrame_(NSMakeRect(pad, y, 200, 20))
-        header.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header)
+        _add_label(view, "Network", NSMakeRect(pad, y, 200, 20), size=13, bold=True)
 
         y -= 38
         card = _make_inline_card(pad, y, w - pad * 2, 32)
@@ -1541,32 +2081,22 @@ class PopoverViewController(NSViewController):
             NSMakeRect(6, 4, w - pad * 2 - 12, 24)
         )
         self._network_seg.setSegmentCount_(5)
-        networks = ["Mainnet", "Testnet3", "Testnet4", "Signet", "Regtest"]
-        for i, n in enumerate(networks):
+        for i, n in enumerate(_NETWORKS):
             self._network_seg.setLabel_forSegment_(n, i)
-        idx = (
-            networks.index(self._config.network)
-            if self._config.network in networks
-            else 0
+        self._network_seg.setSelectedSegment_(
+            _NETWORK_INDEX.get(self._config.network, 0)
         )
-        self._network_seg.setSelectedSegment_(idx)
         card.addSubview_(self._network_seg)
 
         # Worker
         y -= 20
-        header2 = make_label("Worker", size=13, bold=True)
-        header2.setFrame_(NSMakeRect(pad, y, 200, 20))
-        header2.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header2)
+        _add_label(view, "Worker", NSMakeRect(pad, y, 200, 20), size=13, bold=True)
 
         y -= 48
         card2 = _make_inline_card(pad, y, w - pad * 2, 44)
         view.addSubview_(card2)
 
-        wlbl = make_label("Worker Name", size=11)
-        wlbl.setFrame_(NSMakeRect(12, 22, 100, 16))
-        wlbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card2.addSubview_(wlbl)
+        _add_label(card2, "Worker Name", NSMakeRect(12, 22, 100, 16), size=11)
 
         self._worker_field = NSTextField.alloc().initWithFrame_(
             NSMakeRect(120, 22, w - pad * 2 - 140, 18)
@@ -1576,28 +2106,25 @@ class PopoverViewController(NSViewController):
         self._worker_field.setFocusRingType_(NSFocusRingTypeNone)
         card2.addSubview_(self._worker_field)
 
-        hint = make_label(
-            "Identifies your miner on the pool", size=9, color=TEXT_SECONDARY
+        _add_label(
+            card2,
+            "Identifies your miner on the pool",
+            NSMakeRect(12, 4, 250, 14),
+            size=9,
+            color=TEXT_SECONDARY,
         )
-        hint.setFrame_(NSMakeRect(12, 4, 250, 14))
-        hint.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card2.addSubview_(hint)
 
         # Payout
         y -= 20
-        header3 = make_label("Payout Address", size=13, bold=True)
-        header3.setFrame_(NSMakeRect(pad, y, 200, 20))
-        header3.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header3)
+        _add_label(
+            view, "Payout Address", NSMakeRect(pad, y, 200, 20), size=13, bold=True
+        )
 
         y -= 48
         card3 = _make_inline_card(pad, y, w - pad * 2, 44)
         view.addSubview_(card3)
 
-        addr_lbl = make_label("Address", size=11)
-        addr_lbl.setFrame_(NSMakeRect(12, 22, 60, 16))
-        addr_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card3.addSubview_(addr_lbl)
+        _add_label(card3, "Address", NSMakeRect(12, 22, 60, 16), size=11)
 
         self._address_field = NSTextField.alloc().initWithFrame_(
             NSMakeRect(78, 22, w - pad * 2 - 94, 18)
@@ -1605,47 +2132,41 @@ class PopoverViewController(NSViewController):
         self._address_field.setStringValue_(self._config.bitcoin_address)
         self._address_field.setPlaceholderString_("bc1q...")
         self._address_field.setFocusRingType_(NSFocusRingTypeNone)
-        self._address_field.setFont_(
-            NSFont.monospacedSystemFontOfSize_weight_(10, NSFontWeightRegular)
-        )
+        self._address_field.setFont_(_font(10, mono=True))
         card3.addSubview_(self._address_field)
 
-        self._addr_coin_hint = make_label(
+        self._addr_coin_hint = _add_label(
+            card3,
             "Bitcoin (BTC) address",
+            NSMakeRect(12, 4, 250, 14),
             size=9,
             color=TEXT_SECONDARY,
         )
-        self._addr_coin_hint.setFrame_(NSMakeRect(12, 4, 250, 14))
-        self._addr_coin_hint.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card3.addSubview_(self._addr_coin_hint)
 
         # Address validation status label (shown below card)
         y -= 2
-        self._addr_valid_label = make_label("", size=9, color=ACCENT_GREEN)
-        self._addr_valid_label.setFrame_(
-            NSMakeRect(pad + 12, y - 14, w - pad * 2 - 24, 14)
+        self._addr_valid_label = _add_label(
+            view,
+            "",
+            NSMakeRect(pad + 12, y - 14, w - pad * 2 - 24, 14),
+            size=9,
+            color=ACCENT_GREEN,
         )
-        self._addr_valid_label.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(self._addr_valid_label)
         y -= 14
 
         # ── Thread / Core Selection ──
         y -= 20
-        header4 = make_label("Thread Config", size=13, bold=True)
-        header4.setFrame_(NSMakeRect(pad, y, 200, 20))
-        header4.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(header4)
+        _add_label(
+            view, "Thread Config", NSMakeRect(pad, y, 200, 20), size=13, bold=True
+        )
 
-        cpu_count = os.cpu_count() or 4
+        cpu_count = _CPU_COUNT
 
         y -= 72
         card4 = _make_inline_card(pad, y, w - pad * 2, 68)
         view.addSubview_(card4)
 
-        gpu_lbl = make_label("GPU Threads", size=11)
-        gpu_lbl.setFrame_(NSMakeRect(12, 42, 180, 16))
-        gpu_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card4.addSubview_(gpu_lbl)
+        _add_label(card4, "GPU Threads", NSMakeRect(12, 42, 180, 16), size=11)
 
         self._gpu_threads_popup = NSPopUpButton.alloc().initWithFrame_(
             NSMakeRect(w - pad * 2 - 80, 40, 70, 20)
@@ -1660,15 +2181,14 @@ class PopoverViewController(NSViewController):
             self._gpu_threads_popup.selectItemAtIndex_(gpu_val)
         card4.addSubview_(self._gpu_threads_popup)
 
-        sep4 = NSView.alloc().initWithFrame_(NSMakeRect(12, 35, w - pad * 2 - 24, 1))
+        sep4 = FastLayerView.alloc().initWithFrame_(
+            NSMakeRect(12, 35, w - pad * 2 - 24, 1)
+        )
         sep4.setWantsLayer_(True)
         _set_bg(sep4.layer(), BORDER_COLOR)
         card4.addSubview_(sep4)
 
-        cpu_lbl = make_label("CPU Threads", size=11)
-        cpu_lbl.setFrame_(NSMakeRect(12, 12, 180, 16))
-        cpu_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        card4.addSubview_(cpu_lbl)
+        _add_label(card4, "CPU Threads", NSMakeRect(12, 12, 180, 16), size=11)
 
         self._cpu_threads_popup = NSPopUpButton.alloc().initWithFrame_(
             NSMakeRect(w - pad * 2 - 80, 10, 70, 20)
@@ -1688,7 +2208,7 @@ class PopoverViewController(NSViewController):
             "Save Configuration", NSMakeRect((w - 155) / 2, 10, 155, 28)
         )
         save_btn.setTarget_(self)
-        save_btn.setAction_(objc.selector(self.saveMiningConfig_, signature=b"v@:@"))
+        save_btn.setAction_(self._SEL_SAVE_MINING_CONFIG)
         save_btn.setKeyEquivalent_("\r")
         view.addSubview_(save_btn)
 
@@ -1712,41 +2232,42 @@ class PopoverViewController(NSViewController):
                 img_view.setImage_(img)
                 img_view.setImageScaling_(NSImageScaleProportionallyUpOrDown)
                 img_view.setWantsLayer_(True)
-                img_view.layer().setCornerRadius_(14)
-                img_view.layer().setMasksToBounds_(True)
+                img_layer = img_view.layer()
+                img_layer.setCornerRadius_(14)
+                img_layer.setMasksToBounds_(True)
                 view.addSubview_(img_view)
         else:
             y -= 8
 
         y -= 4
-        title = make_label(
-            "SoloMiner", size=20, bold=True, alignment=NSTextAlignmentCenter
+        _add_label(
+            view,
+            "SoloMiner",
+            NSMakeRect(0, y, w, 24),
+            size=20,
+            bold=True,
+            alignment=NSTextAlignmentCenter,
         )
-        title.setFrame_(NSMakeRect(0, y, w, 24))
-        title.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(title)
 
         y -= 16
-        ver = make_label(
+        _add_label(
+            view,
             f"Version {APP_VERSION}",
+            NSMakeRect(0, y, w, 16),
             size=11,
             color=TEXT_SECONDARY,
             alignment=NSTextAlignmentCenter,
         )
-        ver.setFrame_(NSMakeRect(0, y, w, 16))
-        ver.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(ver)
 
         y -= 14
-        author = make_label(
+        _add_label(
+            view,
             "by Cooper Wang",
+            NSMakeRect(0, y, w, 14),
             size=10,
             color=TEXT_SECONDARY,
             alignment=NSTextAlignmentCenter,
         )
-        author.setFrame_(NSMakeRect(0, y, w, 14))
-        author.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(author)
 
         y -= 38
         desc = NSTextField.wrappingLabelWithString_(
@@ -1754,17 +2275,16 @@ class PopoverViewController(NSViewController):
             "Uses Apple Metal for GPU-accelerated SHA-256d hashing. "
             "Connects to pools via the Stratum v1 protocol."
         )
-        desc.setFont_(NSFont.systemFontOfSize_weight_(10, NSFontWeightRegular))
+        desc.setFont_(_font(10))
         desc.setTextColor_(TEXT_SECONDARY)
         desc.setAlignment_(NSTextAlignmentCenter)
         desc.setFrame_(NSMakeRect(25, y, w - 50, 36))
-        desc.setTranslatesAutoresizingMaskIntoConstraints_(True)
         view.addSubview_(desc)
 
         y -= 8
         card_h = 118
         y -= card_h
-        card = _make_inline_card(20, y, w - 40, card_h)
+        card = _make_inline_card(20, y, w - 40, card_h, rasterize=True)
         view.addSubview_(card)
 
         items = [
@@ -1778,18 +2298,14 @@ class PopoverViewController(NSViewController):
         ey = card_h - 6
         for i, (k, v) in enumerate(items):
             ey -= row_h
-            kl = make_label(k, size=9, color=TEXT_SECONDARY)
-            kl.setFrame_(NSMakeRect(12, ey, 80, 14))
-            kl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(kl)
+            _add_label(
+                card, k, NSMakeRect(12, ey, 80, 14), size=9, color=TEXT_SECONDARY
+            )
 
-            vl = make_label(v, size=9, bold=True)
-            vl.setFrame_(NSMakeRect(98, ey, w - 140, 14))
-            vl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(vl)
+            _add_label(card, v, NSMakeRect(98, ey, w - 140, 14), size=9, bold=True)
 
             if i < len(items) - 1:
-                row_sep = NSView.alloc().initWithFrame_(
+                row_sep = FastLayerView.alloc().initWithFrame_(
                     NSMakeRect(12, ey - 3, w - 68, 1)
                 )
                 row_sep.setWantsLayer_(True)
@@ -1798,10 +2314,7 @@ class PopoverViewController(NSViewController):
 
         # ── Donation address ──
         y -= 18
-        donate_header = make_label("Donate", size=10, bold=True)
-        donate_header.setFrame_(NSMakeRect(20, y, 80, 14))
-        donate_header.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        view.addSubview_(donate_header)
+        _add_label(view, "Donate", NSMakeRect(20, y, 80, 14), size=10, bold=True)
 
         y -= 30
         donate_card = _make_inline_card(20, y, w - 40, 26)
@@ -1810,11 +2323,8 @@ class PopoverViewController(NSViewController):
         donate_lbl = make_label(
             DONATION_ADDRESS, size=8, color=ACCENT_ORANGE, bold=True
         )
-        donate_lbl.setFont_(
-            NSFont.monospacedSystemFontOfSize_weight_(8, NSFontWeightBold)
-        )
+        donate_lbl.setFont_(_font(8, bold=True, mono=True))
         donate_lbl.setFrame_(NSMakeRect(8, 5, w - 56, 16))
-        donate_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
         donate_lbl.setSelectable_(True)
         donate_card.addSubview_(donate_lbl)
 
@@ -1833,33 +2343,42 @@ class PopoverViewController(NSViewController):
 
             ping_idx = idx
 
-            def _do_ping():
-                online, latency, err = ping_pool(host, port)
+            async def _do_ping():
+                online, latency, err = await ping_pool_async(host, port)
                 self._ping_queue.put((ping_idx, online, latency, err))
                 self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                    objc.selector(
-                        PopoverViewController._pingDone_,
-                        signature=b"v@:@",
-                    ),
+                    self._SEL_PING_DONE,
                     None,
                     False,
                 )
 
-            threading.Thread(target=_do_ping, daemon=True).start()
+            if self._ping_loop is None:
+                self._ping_loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=_run_ping_loop,
+                    args=(self._ping_loop,),
+                    name="ping",
+                    daemon=True,
+                ).start()
+            asyncio.run_coroutine_threadsafe(_do_ping(), self._ping_loop)
 
     @objc.typedSelector(b"v@:@")
     def _pingDone_(self, _unused):
-        try:
-            idx, online, latency, err = self._ping_queue.get_nowait()
-        except queue.Empty:
-            return
-        if idx < len(self._pool_ping_labels):
+        # Drain everything queued; pings finishing together may share a post
+        while True:
+            try:
+                idx, online, latency, err = self._ping_queue.get_nowait()
+            except queue.Empty:
+                return
+            if idx >= len(self._pool_ping_labels):
+                continue
+            label = self._pool_ping_labels[idx]
             if online:
-                self._pool_ping_labels[idx].setStringValue_(f"{latency}ms")
-                self._pool_ping_labels[idx].setTextColor_(ACCENT_GREEN)
+                label.setStringValue_(f"{latency}ms")
+                label.setTextColor_(ACCENT_GREEN)
             else:
-                self._pool_ping_labels[idx].setStringValue_(err or "Offline")
-                self._pool_ping_labels[idx].setTextColor_(ACCENT_RED)
+                label.setStringValue_(err or "Offline")
+                label.setTextColor_(ACCENT_RED)
 
     # ── Pool actions ──
     @objc.typedSelector(b"v@:@")
@@ -1873,13 +2392,22 @@ class PopoverViewController(NSViewController):
         idx = sender.tag()
         if self._config:
             self._config.active_pool_index = idx
-        for i, (card, cb, nl, dl, ab) in enumerate(self._pool_cards):
-            if i == idx:
-                ab.setTitle_("Active")
-                _set_bg(card.layer(), BG_CARD_HIGHLIGHT)
-            else:
-                ab.setTitle_("Set")
-                _set_bg(card.layer(), BG_CARD)
+        self._highlight_pool_card(idx)
+
+    def _highlight_pool_card(self, idx):
+        # Only the previously highlighted card and the new one change
+        prev = self._active_pool_card
+        if prev == idx:
+            return
+        if prev is not None and prev < len(self._pool_cards):
+            card, _, _, _, ab = self._pool_cards[prev]
+            ab.setTitle_("Set")
+            _set_bg(card.layer(), BG_CARD)
+        if idx < len(self._pool_cards):
+            card, _, _, _, ab = self._pool_cards[idx]
+            ab.setTitle_("Active")
+            _set_bg(card.layer(), BG_CARD_HIGHLIGHT)
+        self._active_pool_card = idx
 
     @objc.typedSelector(b"v@:@")
     def deletePool_(self, sender):
@@ -1888,36 +2416,72 @@ class PopoverViewController(NSViewController):
             self._config.pools.pop(idx)
             if self._config.active_pool_index >= len(self._config.pools):
                 self._config.active_pool_index = max(0, len(self._config.pools) - 1)
-            save_config(self._config)
-            self._rebuild_settings_pools_tab()
+            self._schedule_config_save()
+            self._remove_pool_card(idx)
+
+    def _resize_pool_list(self):
+        """Fit the list to its cards, keeping its top edge, and move the add
+        form up or down under it."""
+        frame = self._pool_list_view.frame()
+        w = int(frame.size.width)
+        top = int(frame.origin.y + frame.size.height)
+        list_h = len(self._pool_cards) * _POOL_ROW_H
+        self._pool_list_view.setFrame_(NSMakeRect(0, top - list_h, w, list_h))
+        add_h = int(self._pool_add_view.frame().size.height)
+        self._pool_add_view.setFrame_(NSMakeRect(0, top - list_h - add_h, w, add_h))
+
+    def _append_pool_card(self, pool):
+        view = self._pool_list_view
+        if view is None:
+            return
+        with _layer_batch():
+            self._add_pool_card(
+                view, len(self._pool_cards), pool, int(view.frame().size.width)
+            )
+        self._resize_pool_list()
 
-    def _rebuild_settings_pools_tab(self):
-        if not self._settings_tab_container:
+    def _remove_pool_card(self, idx):
+        """Drop card ``idx`` and slide the cards below it up one row,
+        renumbering their button tags to match the config's pool list."""
+        if self._pool_list_view is None or idx >= len(self._pool_cards):
+            return
+        self._pool_cards.pop(idx)[0].removeFromSuperview()
+        self._pool_ping_labels.pop(idx)
+        with _layer_batch():
+            for i in range(idx, len(self._pool_cards)):
+                card = self._pool_cards[i][0]
+                card.setFrameOrigin_((card.frame().origin.x, i * _POOL_ROW_H + 3))
+                for sub in card.subviews():
+                    if isinstance(sub, NSButton):
+                        sub.setTag_(i)
+        active = self._active_pool_card
+        if active == idx:
+            self._active_pool_card = None
+        elif active is not None and active > idx:
+            self._active_pool_card = active - 1
+        self._resize_pool_list()
+        if self._config.pools:
+            self._highlight_pool_card(self._config.active_pool_index)
+
+    def _rebuild_pool_list(self):
+        old = self._pool_list_view
+        if old is None:
             return
-        w = int(self._settings_tab_container.frame().size.width)
-        h = int(self._settings_tab_container.frame().size.height)
-        old = self._settings_tab_views[1]
-        new_pools = self._build_settings_pools(w, h)
-        # Set hidden state based on whether pools tab is currently active
-        is_pools_active = (
-            self._settings_tab_seg and self._settings_tab_seg.selectedSegment() == 1
-        )
-        new_pools.setHidden_(not is_pools_active)
-        self._settings_tab_views[1] = new_pools
-        self._settings_tab_container.addSubview_(new_pools)
-        old.removeFromSuperview()
+        frame = old.frame()
+        with _layer_batch():
+            new_list = self._build_pool_list(int(frame.size.width))
+        new_list.setFrame_(frame)
+        old.superview().replaceSubview_with_(old, new_list)
+        self._pool_list_view = new_list
+        self._resize_pool_list()
 
     @objc.typedSelector(b"v@:@")
     def addPool_(self, sender):
         name = str(self._new_pool_name.stringValue()).strip()
         host = str(self._new_pool_host.stringValue()).strip()
-        port_str = str(self._new_pool_port.stringValue()).strip()
         if not name or not host:
             return
-        try:
-            port = int(port_str) if port_str else 3333
-        except ValueError:
-            port = 3333
+        port = int(self._new_pool_port.intValue()) or 3333
         self._config.pools.append(
             {
                 "name": name,
@@ -1926,65 +2490,88 @@ class PopoverViewController(NSViewController):
                 "enabled": True,
             }
         )
-        save_config(self._config)
-        self._rebuild_settings_pools_tab()
+        self._schedule_config_save()
+        self._append_pool_card(self._config.pools[-1])
+        for field in (self._new_pool_name, self._new_pool_host, self._new_pool_port):
+            field.setStringValue_("")
 
     @objc.typedSelector(b"v@:@")
     def resetPools_(self, sender):
-        from dataclasses import asdict
-
         self._config.pools = [asdict(p) for p in DEFAULT_POOLS]
         self._config.active_pool_index = 0
-        save_config(self._config)
-        self._rebuild_settings_pools_tab()
+        self._schedule_config_save()
+        self._rebuild_pool_list()
 
     @objc.typedSelector(b"v@:@")
     def savePools_(self, sender):
         if self._config:
-            save_config(self._config)
+            self._config_dirty = True
+            self._flush_config_save()
             append_log("Pool configuration saved")
 
+    def _schedule_config_save(self):
+        """Mark the config dirty and write it once, half a second after the
+        first pending edit, so a burst of pool edits costs a single save."""
+        self._config_dirty = True
+        if self._save_timer is None:
+            self._save_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+                0.5, self, self._SEL_FLUSH_CONFIG, None, False
+            )
+
+    @objc.typedSelector(b"v@:@")
+    def _flushConfigTimer_(self, timer):
+        self._save_timer = None
+        self._flush_config_save()
+
+    def _flush_config_save(self):
+        """Write any pending config edits now."""
+        if self._save_timer is not None:
+            self._save_timer.invalidate()
+            self._save_timer = None
+        if self._config_dirty and self._config:
+            save_config(self._config)
+        self._config_dirty = False
+
     @objc.typedSelector(b"v@:@")
     def saveMiningConfig_(self, sender):
-        if not self._config:
+        config = self._config
+        if not config:
             return
-        networks = ["Mainnet", "Testnet3", "Testnet4", "Signet", "Regtest"]
-        idx = self._network_seg.selectedSegment()
-        self._config.network = networks[idx]
-        self._config.worker_name = str(self._worker_field.stringValue())
-
-        # Save and validate Bitcoin address
+        # Read every control once before touching the config
+        network = _NETWORKS[self._network_seg.selectedSegment()]
+        worker = str(self._worker_field.stringValue())
         current_addr = str(self._address_field.stringValue()).strip()
-        self._config.bitcoin_address = current_addr
+        gpu_threads = self._gpu_threads_popup.indexOfSelectedItem()  # 0 = auto
+        cpu_threads = self._cpu_threads_popup.indexOfSelectedItem()
+
+        config.network = network
+        config.worker_name = worker
+        config.bitcoin_address = current_addr
+        config.gpu_threads = gpu_threads
+        config.cpu_threads = cpu_threads
 
         # Validate address
-        if current_addr:
-            valid, err = validate_bitcoin_address(current_addr, self._config.network)
-            if hasattr(self, "_addr_valid_label") and self._addr_valid_label:
+        status = self._addr_valid_label
+        if status is not None:
+            if not current_addr:
+                status.setStringValue_("No address set")
+                status.setTextColor_(ACCENT_ORANGE)
+            else:
+                valid, err = validate_bitcoin_address(current_addr, network)
                 if valid:
-                    self._addr_valid_label.setStringValue_("Address looks valid")
-                    self._addr_valid_label.setTextColor_(ACCENT_GREEN)
+                    status.setStringValue_("Address looks valid")
+                    status.setTextColor_(ACCENT_GREEN)
                 else:
-                    self._addr_valid_label.setStringValue_(err)
-                    self._addr_valid_label.setTextColor_(ACCENT_RED)
-        else:
-            if hasattr(self, "_addr_valid_label") and self._addr_valid_label:
-                self._addr_valid_label.setStringValue_("No address set")
-                self._addr_valid_label.setTextColor_(ACCENT_ORANGE)
-
-        # Thread config
-        gpu_idx = self._gpu_threads_popup.indexOfSelectedItem()
-        self._config.gpu_threads = 0 if gpu_idx == 0 else gpu_idx
-        cpu_idx = self._cpu_threads_popup.indexOfSelectedItem()
-        self._config.cpu_threads = 0 if cpu_idx == 0 else cpu_idx
+                    status.setStringValue_(err)
+                    status.setTextColor_(ACCENT_RED)
 
-        save_config(self._config)
+        save_config(config)
         append_log(
             f"Configuration saved: "
-            f"network={self._config.network}, "
+            f"network={network}, "
             f"address={current_addr[:12]}..., "
-            f"gpu_threads={self._config.gpu_threads or 'auto'}, "
-            f"cpu_threads={self._config.cpu_threads or 'auto'}"
+            f"gpu_threads={gpu_threads or 'auto'}, "
+            f"cpu_threads={cpu_threads or 'auto'}"
         )
 
     # ─────────────────────────────────────────
@@ -2003,34 +2590,45 @@ class PopoverViewController(NSViewController):
         self._stats_tab_seg.setLabel_forSegment_("Blocks", 2)
         self._stats_tab_seg.setSelectedSegment_(0)
         self._stats_tab_seg.setTarget_(self)
-        self._stats_tab_seg.setAction_(
-            objc.selector(self.statsTabChanged_, signature=b"v@:@")
-        )
+        self._stats_tab_seg.setAction_(self._SEL_STATS_TAB_CHANGED)
         view.addSubview_(self._stats_tab_seg)
 
         content_h = h - 42
-        overview = self._build_stats_overview(w, content_h)
-        sessions = self._build_stats_sessions(w, content_h)
-        blocks = self._build_stats_blocks(w, content_h)
+        container = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, w, content_h))
+        view.addSubview_(container)
+        self._stats_tab_container = container
 
-        self._stats_tab_views = [overview, sessions, blocks]
-        for v in self._stats_tab_views:
-            v.setFrame_(NSMakeRect(0, 0, w, content_h))
-            v.setHidden_(True)
-            view.addSubview_(v)
-        overview.setHidden_(False)
+        # Tabs are built the first time they're selected; Overview shows first
+        self._stats_tab_builders = (
+            self._build_stats_overview,
+            self._build_stats_sessions,
+            self._build_stats_blocks,
+        )
+        self._stats_tab_views = [None] * len(self._stats_tab_builders)
+        self._show_stats_tab(0)
 
         return view
 
+    def _show_stats_tab(self, idx):
+        if self._stats_tab_views[idx] is None:
+            frame = self._stats_tab_container.frame()
+            with _layer_batch():
+                tab = self._stats_tab_builders[idx](
+                    int(frame.size.width), int(frame.size.height)
+                )
+            self._stats_tab_container.addSubview_(tab)
+            self._stats_tab_views[idx] = tab
+            self._refresh_stats()
+        for i, v in enumerate(self._stats_tab_views):
+            if v is not None:
+                v.setHidden_(i != idx)
+
     @objc.typedSelector(b"v@:@")
     def statsTabChanged_(self, sender):
-        idx = sender.selectedSegment()
-        for i, v in enumerate(self._stats_tab_views):
-            v.setHidden_(i != idx)
+        self._show_stats_tab(sender.selectedSegment())
 
     def _build_stats_overview(self, w, h):
         view = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, w, h))
-        stats = load_stats()
 
         card_w = int((w - 50) / 2)
         card_h = 85
@@ -2039,31 +2637,12 @@ class PopoverViewController(NSViewController):
         row1_y = h - card_h - 15
         row2_y = row1_y - card_h - gap
 
+        # Values are filled in by _refresh_stats, in this order
         cards_data = [
-            (
-                "Hashes",
-                self._format_hashes(stats.get("total_hashes", 0)),
-                "Total Hashes",
-                ACCENT_ORANGE,
-            ),
-            (
-                "Time",
-                self._format_runtime(stats.get("total_runtime_seconds", 0)),
-                "Runtime",
-                ACCENT_ORANGE,
-            ),
-            (
-                "Shares",
-                str(stats.get("shares_found", 0)),
-                "Shares Found",
-                ACCENT_ORANGE,
-            ),
-            (
-                "Peak",
-                f"{stats.get('peak_hashrate', 0) / 1e6:.2f}\nMH/s",
-                "Peak Rate",
-                ACCENT_ORANGE,
-            ),
+            ("Hashes", "Total Hashes", ACCENT_ORANGE),
+            ("Time", "Runtime", ACCENT_ORANGE),
+            ("Shares", "Shares Found", ACCENT_ORANGE),
+            ("Peak", "Peak Rate", ACCENT_ORANGE),
         ]
 
         positions = [
@@ -2073,119 +2652,139 @@ class PopoverViewController(NSViewController):
             (start_x + card_w + gap, row2_y),
         ]
 
-        for i, ((icon, value, label, color), (cx, cy)) in enumerate(
-            zip(cards_data, positions)
-        ):
-            card = _make_inline_card(cx, cy, card_w, card_h)
+        self._stat_value_labels = []
+        for (icon, label, color), (cx, cy) in zip(cards_data, positions):
+            card = _make_inline_card(cx, cy, card_w, card_h, rasterize=True)
             card.layer().setCornerRadius_(12)
             view.addSubview_(card)
 
-            icon_lbl = make_label(
-                icon, size=11, color=color, bold=True, alignment=NSTextAlignmentCenter
+            _add_label(
+                card,
+                icon,
+                NSMakeRect(0, 58, card_w, 18),
+                size=11,
+                color=color,
+                bold=True,
+                alignment=NSTextAlignmentCenter,
             )
-            icon_lbl.setFrame_(NSMakeRect(0, 58, card_w, 18))
-            icon_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(icon_lbl)
 
-            val_lbl = make_label(
-                value, size=15, bold=True, alignment=NSTextAlignmentCenter
+            val_lbl = _add_label(
+                card,
+                "",
+                NSMakeRect(4, 22, card_w - 8, 36),
+                size=15,
+                bold=True,
+                alignment=NSTextAlignmentCenter,
             )
-            val_lbl.setFrame_(NSMakeRect(4, 22, card_w - 8, 36))
-            val_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(val_lbl)
+            self._stat_value_labels.append(val_lbl)
 
-            name_lbl = make_label(
-                label, size=9, color=TEXT_SECONDARY, alignment=NSTextAlignmentCenter
+            _add_label(
+                card,
+                label,
+                NSMakeRect(0, 4, card_w, 14),
+                size=9,
+                color=TEXT_SECONDARY,
+                alignment=NSTextAlignmentCenter,
             )
-            name_lbl.setFrame_(NSMakeRect(0, 4, card_w, 14))
-            name_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            card.addSubview_(name_lbl)
 
         return view
 
     def _build_stats_sessions(self, w, h):
         view = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, w, h))
-        stats = load_stats()
-        sessions = stats.get("sessions", [])
 
-        if not sessions:
-            lbl = make_label(
-                "No mining sessions recorded yet.",
-                size=12,
-                color=TEXT_SECONDARY,
-                alignment=NSTextAlignmentCenter,
-            )
-            lbl.setFrame_(NSMakeRect(0, h / 2 - 10, w, 18))
-            lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            view.addSubview_(lbl)
-            return view
+        self._sessions_empty_label = _add_label(
+            view,
+            "No mining sessions recorded yet.",
+            NSMakeRect(0, h / 2 - 10, w, 18),
+            size=12,
+            color=TEXT_SECONDARY,
+            alignment=NSTextAlignmentCenter,
+        )
 
         y = h - 12
-        header_lbl = make_label(
+        self._sessions_header = make_label_at(
             "Start Time              Runtime   Shares  Peak",
+            NSMakeRect(12, y, w - 24, 14),
             size=10,
             color=TEXT_SECONDARY,
             bold=True,
         )
-        header_lbl.setFrame_(NSMakeRect(12, y, w - 24, 14))
-        header_lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-        header_lbl.setFont_(
-            NSFont.monospacedSystemFontOfSize_weight_(9, NSFontWeightBold)
-        )
-        view.addSubview_(header_lbl)
+        self._sessions_header.setFont_(_font(9, bold=True, mono=True))
+        view.addSubview_(self._sessions_header)
 
-        for session in reversed(sessions[-20:]):
+        # A fixed set of row labels, refilled in place by _refresh_stats
+        self._session_row_labels = []
+        for _ in range(_MAX_SESSION_ROWS):
             y -= 18
-            st = session.get("start_time", "?")
-            rt = self._format_runtime(session.get("runtime_seconds", 0))
-            sh = str(session.get("shares", 0))
-            pk = f"{session.get('peak_hashrate', 0) / 1e6:.1f}M"
-            line = f"{st}  {rt:>8}  {sh:>5}  {pk:>8}"
-            row = make_label(line, size=9, color=TEXT_PRIMARY)
-            row.setFrame_(NSMakeRect(12, y, w - 24, 14))
-            row.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            row.setFont_(
-                NSFont.monospacedSystemFontOfSize_weight_(9, NSFontWeightRegular)
+            row = make_label_at(
+                "", NSMakeRect(12, y, w - 24, 14), size=9, color=TEXT_PRIMARY
             )
+            row.setFont_(_font(9, mono=True))
             view.addSubview_(row)
+            self._session_row_labels.append(row)
 
         return view
 
     def _build_stats_blocks(self, w, h):
         view = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, w, h))
-        stats = load_stats()
-        blocks = stats.get("blocks", [])
 
-        if not blocks:
-            lbl = make_label(
-                "No blocks found yet. Keep mining!",
-                size=12,
-                color=TEXT_SECONDARY,
-                alignment=NSTextAlignmentCenter,
-            )
-            lbl.setFrame_(NSMakeRect(0, h / 2 - 10, w, 18))
-            lbl.setTranslatesAutoresizingMaskIntoConstraints_(True)
-            view.addSubview_(lbl)
+        self._blocks_empty_label = _add_label(
+            view,
+            "No blocks found yet. Keep mining!",
+            NSMakeRect(0, h / 2 - 10, w, 18),
+            size=12,
+            color=TEXT_SECONDARY,
+            alignment=NSTextAlignmentCenter,
+        )
 
         return view
 
+    def _refresh_stats(self):
+        """Fill the stats labels from the stats file; the views themselves
+        are built once and only their text changes. Tabs that haven't been
+        built yet are skipped and filled when first shown."""
+        stats = load_stats()
+
+        values = (
+            self._format_hashes(stats.get("total_hashes", 0)),
+            self._format_runtime(stats.get("total_runtime_seconds", 0)),
+            str(stats.get("shares_found", 0)),
+            f"{stats.get('peak_hashrate', 0) / 1e6:.2f}\nMH/s",
+        )
+        for label, value in zip(self._stat_value_labels, values):
+            label.setStringValue_(value)
+
+        if self._sessions_header is not None:
+            sessions = stats.get("sessions", [])
+            recent = list(reversed(sessions[-_MAX_SESSION_ROWS:]))
+            self._sessions_empty_label.setHidden_(bool(recent))
+            self._sessions_header.setHidden_(not recent)
+            for i, row in enumerate(self._session_row_labels):
+                if i < len(recent):
+                    session = recent[i]
+                    st = session.get("start_time", "?")
+                    rt = self._format_runtime(session.get("runtime_seconds", 0))
+                    sh = str(session.get("shares", 0))
+                    pk = "%.1fM" % (session.get("peak_hashrate", 0) / 1e6)
+                    row.setStringValue_(_SESSION_ROW_FMT(st, rt, sh, pk))
+                    row.setHidden_(False)
+                else:
+                    row.setHidden_(True)
+
+        if self._blocks_empty_label is not None:
+            self._blocks_empty_label.setHidden_(bool(stats.get("blocks")))
+
     @staticmethod
     def _format_hashes(n):
-        if n >= 1e12:
-            return f"{n / 1e12:.2f}T"
-        elif n >= 1e9:
-            return f"{n / 1e9:.2f}G"
-        elif n >= 1e6:
-            return f"{n / 1e6:.2f}M"
-        elif n >= 1e3:
-            return f"{n / 1e3:.2f}K"
+        for threshold, fmt in _HASH_UNITS:
+            if n >= threshold:
+                return fmt % (n / threshold)
         return str(int(n))
 
     @staticmethod
     def _format_runtime(seconds):
-        seconds = int(seconds)
-        hours = seconds // 3600
-        mins = (seconds % 3600) // 60
+        hours, rem = divmod(int(seconds), 3600)
+        mins = rem // 60
         if hours > 0:
             return f"{hours}h {mins}m"
         return f"{mins}m"
@@ -2204,60 +2803,63 @@ class PopoverViewController(NSViewController):
 
         tv = NSTextView.alloc().initWithFrame_(NSMakeRect(0, 0, w - 30, h - 44))
         tv.setEditable_(False)
-        tv.setFont_(NSFont.monospacedSystemFontOfSize_weight_(10, NSFontWeightRegular))
+        tv.setFont_(_font(10, mono=True))
         tv.setTextColor_(LOG_DEFAULT)
         tv.setBackgroundColor_(rgba(20, 20, 22, 0.6))
-
-        log_text = read_log() or ""
-        attr_str = _build_log_attributed_string(log_text)
-        tv.textStorage().setAttributedString_(attr_str)
+        # The view lives at the end of the log; let the layout manager skip
+        # glyph layout for scrollback that is never on screen.
+        tv.layoutManager().setAllowsNonContiguousLayout_(True)
 
         scroll.setDocumentView_(tv)
         view.addSubview_(scroll)
         self._logs_text_view = tv
+        self._log_file_ino = None  # fresh view: load the log from the top
+        self._sync_log_view(force=True)
 
         refresh_btn = NSButton.alloc().initWithFrame_(NSMakeRect(10, 6, 65, 24))
         refresh_btn.setTitle_("Refresh")
         refresh_btn.setBezelStyle_(_BezelStyle)
         refresh_btn.setTarget_(self)
-        refresh_btn.setAction_(
-            objc.selector(self.refreshLogsAction_, signature=b"v@:@")
-        )
+        refresh_btn.setAction_(self._SEL_REFRESH_LOGS_ACTION)
         view.addSubview_(refresh_btn)
 
         clear_btn = NSButton.alloc().initWithFrame_(NSMakeRect(82, 6, 55, 24))
         clear_btn.setTitle_("Clear")
         clear_btn.setBezelStyle_(_BezelStyle)
         clear_btn.setTarget_(self)
-        clear_btn.setAction_(objc.selector(self.clearLogsAction_, signature=b"v@:@"))
+        clear_btn.setAction_(self._SEL_CLEAR_LOGS_ACTION)
         view.addSubview_(clear_btn)
 
-        length = tv.string().length()
-        tv.scrollRangeToVisible_((length, 0))
-
         return view
 
     @objc.typedSelector(b"v@:@")
     def refreshLogsAction_(self, sender):
-        if hasattr(self, "_logs_text_view") and self._logs_text_view:
-            log_text = read_log() or ""
-            attr_str = _build_log_attributed_string(log_text)
-            self._logs_text_view.textStorage().setAttributedString_(attr_str)
-            length = self._logs_text_view.string().length()
-            self._logs_text_view.scrollRangeToVisible_((length, 0))
+        self._sync_log_view(force=True)
 
     @objc.typedSelector(b"v@:@")
     def clearLogsAction_(self, sender):
         clear_log()
-        if hasattr(self, "_logs_text_view") and self._logs_text_view:
-            attr_str = _build_log_attributed_string("Log cleared.")
-            self._logs_text_view.textStorage().setAttributedString_(attr_str)
+        self._log_file_ino = None
+        self._log_file_pos = 0
+        self._log_stamp = None
+        if self._logs_text_view:
+            # Swap the existing range in one edit rather than resetting the
+            # whole storage, so layout is invalidated once
+            ts = self._logs_text_view.textStorage()
+            ts.beginEditing()
+            ts.replaceCharactersInRange_withAttributedString_(
+                (0, ts.length()), _build_log_attributed_string("Log cleared.")
+            )
+            ts.endEditing()
+            self._log_placeholder = True
 
 
 # ─────────────────────────────────────────────
 # App Delegate
 # ─────────────────────────────────────────────
 class SoloMinerAppDelegate(NSObject):
+    _SEL_TOGGLE_POPOVER = "togglePopover:"
+
     def applicationDidFinishLaunching_(self, notification):
         self._config = load_config()
         self._engine = MiningEngine()
@@ -2293,7 +2895,7 @@ class SoloMinerAppDelegate(NSObject):
         )
         button = self._status_item.button()
         button.setTitle_("SoloMiner")
-        button.setAction_(objc.selector(self.togglePopover_, signature=b"v@:@"))
+        button.setAction_(self._SEL_TOGGLE_POPOVER)
         button.setTarget_(self)
 
         self._popover = NSPopover.alloc().init()
@@ -2364,10 +2966,6 @@ class SoloMinerAppDelegate(NSObject):
         if self._popover.isShown():
             self._popover.close()
             self._stopEventMonitor()
-            # Invalidate logs timer when popover closes to prevent leak
-            if self._vc._logs_refresh_timer:
-                self._vc._logs_refresh_timer.invalidate()
-                self._vc._logs_refresh_timer = None
         else:
             if self._vc._current_screen != "dashboard":
                 self._vc._navigate_to("dashboard")
@@ -2381,6 +2979,7 @@ class SoloMinerAppDelegate(NSObject):
 
     def applicationWillTerminate_(self, notification):
         self._stopEventMonitor()
+        self._vc._flush_config_save()
         if self._engine and self._engine.is_running:
             self._engine.stop()
         append_log("SoloMiner terminated")
@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from solominer.config import format_hashrate
+
+
+def _reference_format_hashrate(rate):
+    """The formatter before memoization: format the raw rate directly."""
+    if rate < 1e3:
+        return "%.0f H/s" % rate
+    if rate < 1e6:
+        return "%.2f KH/s" % (rate / 1e3)
+    if rate < 1e9:
+        return "%.2f MH/s" % (rate / 1e6)
+    return "%.2f GH/s" % (rate / 1e9)
+
+
+class FormatHashrateTest(unittest.TestCase):
+    def assertMatchesReference(self, rate):
+        self.assertEqual(
+            format_hashrate(rate), _reference_format_hashrate(rate), msg=repr(rate)
+        )
+
+    def test_bucket_boundaries(self):
+        for rate in (
+            0.0,
+            999.0,
+            999.4,
+            999.5,
+            999.9999,
+            1000.0,
+            999994.9,
+            999995.0,
+            999999.99,
+            1e6,
+            999999999.0,
+            1e9,
+            1.005e9,
+        ):
+            self.assertMatchesReference(rate)
+
+    def test_ties_round_like_the_reference(self):
+        for rate in (0.5, 1.5, 2.5, 24.5, 24.5026, 2665.0, 2675.0, 2685.0, 1.005e6):
+            self.assertMatchesReference(rate)
+
+    def test_random_rates(self):
+        rng = random.Random(1234)
+        for _ in range(20000):
+            rate = 10 ** rng.uniform(-1, 12)
+            if rng.random() < 0.3:
+                rate = round(rate, rng.randint(-8, 3))
+            self.assertMatchesReference(rate)
+
+
+if __name__ == "__main__":
+    unittest.main()